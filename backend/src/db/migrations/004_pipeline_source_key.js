@@ -0,0 +1,55 @@
+/**
+ * 마이그레이션 004: 데이터 파이프라인 건물 자연 키
+ * - buildings.source_key: 파이프라인이 부여하는 건물 자연 키 (건축물대장 관리번호 또는 정규 주소 + 건물명)
+ * - source_key 유니크 인덱스 (파이프라인 적재 시 ON CONFLICT (source_key) 대상, 기존 행은 NULL 허용)
+ * - 기존 행은 NULL로 두고, 파이프라인 첫 증분 적재 때 건물명+주소가 같은 행이 자연 키를 넘겨받는다
+ *   (data-pipeline/loaders/db_loader.py _adopt_legacy_buildings, 키 계산이 파이프라인에 있으므로 SQL 백필 대신)
+ * - 실행: node src/db/migrations/004_pipeline_source_key.js
+ */
+const path = require('path');
+require('dotenv').config({ path: path.join(__dirname, '..', '..', '..', '.env') });
+
+const { Pool } = require('pg');
+
+async function migrate() {
+  console.log('[마이그레이션 004] 건물 자연 키 추가 시작...');
+
+  const poolConfig = process.env.DATABASE_URL
+    ? { connectionString: process.env.DATABASE_URL, ssl: { rejectUnauthorized: false } }
+    : {
+        host: process.env.DB_HOST,
+        port: parseInt(process.env.DB_PORT, 10) || 5432,
+        database: process.env.DB_NAME,
+        user: process.env.DB_USER,
+        password: process.env.DB_PASSWORD,
+        ssl: { rejectUnauthorized: false },
+      };
+  const pool = new Pool(poolConfig);
+
+  try {
+    const statements = [
+      `ALTER TABLE buildings ADD COLUMN IF NOT EXISTS source_key VARCHAR(300)`,
+      `CREATE UNIQUE INDEX IF NOT EXISTS idx_buildings_source_key ON buildings(source_key)`,
+    ];
+
+    for (const sql of statements) {
+      await pool.query(sql);
+      console.log('[004] OK:', sql.substring(0, 60));
+    }
+
+    console.log('[마이그레이션 004] 완료!');
+  } catch (err) {
+    console.error('[마이그레이션 004] 에러:', err.message);
+    throw err;
+  } finally {
+    await pool.end();
+  }
+}
+
+module.exports = migrate;
+
+if (require.main === module) {
+  migrate()
+    .then(() => process.exit(0))
+    .catch(() => process.exit(1));
+}
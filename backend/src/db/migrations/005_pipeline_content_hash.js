@@ -0,0 +1,56 @@
+/**
+ * 마이그레이션 005: 데이터 파이프라인 증분 적재
+ * - buildings.content_hash: 파이프라인이 계산한 건물 행 내용 해시 (바뀐 건물만 갱신)
+ * - floors.source_key / content_hash: 매장 자연 키와 내용 해시 (바뀐 매장 갱신, 사라진 매장 삭제)
+ * - floors.source_key 유니크 인덱스 (파이프라인 적재 시 ON CONFLICT (source_key) 대상)
+ * - 실행: node src/db/migrations/005_pipeline_content_hash.js
+ */
+const path = require('path');
+require('dotenv').config({ path: path.join(__dirname, '..', '..', '..', '.env') });
+
+const { Pool } = require('pg');
+
+async function migrate() {
+  console.log('[마이그레이션 005] 증분 적재 컬럼 추가 시작...');
+
+  const poolConfig = process.env.DATABASE_URL
+    ? { connectionString: process.env.DATABASE_URL, ssl: { rejectUnauthorized: false } }
+    : {
+        host: process.env.DB_HOST,
+        port: parseInt(process.env.DB_PORT, 10) || 5432,
+        database: process.env.DB_NAME,
+        user: process.env.DB_USER,
+        password: process.env.DB_PASSWORD,
+        ssl: { rejectUnauthorized: false },
+      };
+  const pool = new Pool(poolConfig);
+
+  try {
+    const statements = [
+      `ALTER TABLE buildings ADD COLUMN IF NOT EXISTS content_hash BIGINT`,
+      `ALTER TABLE floors ADD COLUMN IF NOT EXISTS source_key VARCHAR(500)`,
+      `ALTER TABLE floors ADD COLUMN IF NOT EXISTS content_hash BIGINT`,
+      `CREATE UNIQUE INDEX IF NOT EXISTS idx_floors_source_key ON floors(source_key)`,
+    ];
+
+    for (const sql of statements) {
+      await pool.query(sql);
+      console.log('[005] OK:', sql.substring(0, 60));
+    }
+
+    console.log('[마이그레이션 005] 완료!');
+  } catch (err) {
+    console.error('[마이그레이션 005] 에러:', err.message);
+    throw err;
+  } finally {
+    await pool.end();
+  }
+}
+
+module.exports = migrate;
+
+if (require.main === module) {
+  migrate()
+    .then(() => process.exit(0))
+    .catch(() => process.exit(1));
+}
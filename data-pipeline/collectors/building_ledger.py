@@ -7,119 +7,289 @@ API: 국토교통부_건축물대장정보 서비스
 """
 
 import logging
-import time
+import math
 import xml.etree.ElementTree as ET
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, Optional
 
 import pandas as pd
 import requests
 
-from config import DATA_GO_KR_API_KEY, SIGUNGU_CD, BJDONG_CD
+from config import DATA_GO_KR_API_KEY, SIGUNGU_CD, BJDONG_CD, LEDGER_MAX_WORKERS
+from utils.http_cache import cached_get
 
 logger = logging.getLogger(__name__)
 
 # 공공데이터포털 건축물대장 기본개요 API
 BASE_URL = "http://apis.data.go.kr/1613000/BldRgstHubService/getBrTitleInfo"
 
+# 정상 응답 resultCode (서비스키/쿼터/서비스 오류도 HTTP 200으로 오므로 본문으로 판단한다)
+_OK_RESULT_CODES = ("00", "0000")
+
+
+def _is_cacheable(resp) -> bool:
+    """resultCode가 정상이고 body가 있는 응답만 캐시한다 (키/쿼터 오류 cmmMsgHeader 등은 재시도 대상)."""
+    content_type = resp.headers.get("content-type", "")
+    if "xml" not in content_type:
+        try:
+            response = resp.json().get("response", {})
+            code = str(response.get("header", {}).get("resultCode", ""))
+            return code in _OK_RESULT_CODES and isinstance(response.get("body"), dict)
+        except (ValueError, AttributeError):
+            pass
+
+    try:
+        root = ET.fromstring(resp.text)
+    except ET.ParseError:
+        return False
+    code = root.findtext(".//resultCode", default="").strip()
+    return code in _OK_RESULT_CODES and root.find(".//body") is not None
+
+
+def _fetch_page(
+    page_no: int,
+    sigungu_cd: str,
+    bjdong_cd: str,
+    num_of_rows: int,
+) -> Optional[tuple[int, list[dict]]]:
+    """
+    건축물대장 기본개요 한 페이지를 요청하고 파싱한다.
+
+    Args:
+        page_no: 페이지 번호 (1~)
+        sigungu_cd: 시군구코드
+        bjdong_cd: 법정동코드
+        num_of_rows: 페이지당 건수
+
+    Returns:
+        (totalCount, 아이템 리스트) 튜플. 요청/파싱 실패 시 None
+    """
+    params = {
+        "serviceKey": DATA_GO_KR_API_KEY,
+        "sigunguCd": sigungu_cd,
+        "bjdongCd": bjdong_cd,
+        "numOfRows": num_of_rows,
+        "pageNo": page_no,
+        "resultType": "json",
+    }
+
+    try:
+        resp = cached_get("data_go_kr", BASE_URL, params=params, timeout=30, should_cache=_is_cacheable)
+        resp.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.error(f"API 요청 실패 (페이지 {page_no}): {e}")
+        return None
+
+    # JSON 파싱 시도, 실패 시 XML 파싱
+    content_type = resp.headers.get("content-type", "")
+    try:
+        if "xml" in content_type:
+            raise ValueError("XML response detected")
+        data = resp.json()
+        body = data.get("response", {}).get("body", {})
+        total_count = int(body.get("totalCount", 0) or 0)
+        items = body.get("items", {})
+        if not items:
+            return total_count, []
+        item_list = items if isinstance(items, list) else items.get("item", [])
+        if isinstance(item_list, dict):
+            item_list = [item_list]
+    except (ValueError, KeyError):
+        # XML 파싱 fallback
+        try:
+            root = ET.fromstring(resp.text)
+            body_el = root.find(".//body")
+            if body_el is None:
+                logger.error(f"페이지 {page_no}: XML에서 body를 찾을 수 없음")
+                return None
+            total_count_el = body_el.find("totalCount")
+            total_count = int(total_count_el.text) if total_count_el is not None else 0
+            item_list = []
+            for item_el in root.findall(".//item"):
+                item_dict = {}
+                for child in item_el:
+                    item_dict[child.tag] = child.text
+                item_list.append(item_dict)
+            logger.debug(f"페이지 {page_no}: XML 파싱 성공 ({len(item_list)}건)")
+        except ET.ParseError as e:
+            logger.error(f"XML 파싱 실패 (페이지 {page_no}): {e}")
+            return None
+
+    return total_count, item_list
+
+
+def _dedupe_by_pk(items: list[dict]) -> list[dict]:
+    """mgmBldrgstPk 기준으로 중복 아이템을 제거한다 (먼저 나온 항목 유지)."""
+    seen = set()
+    unique_items = []
+    for item in items:
+        pk = item.get("mgmBldrgstPk")
+        if pk:
+            if pk in seen:
+                continue
+            seen.add(pk)
+        unique_items.append(item)
+    return unique_items
+
 
 def fetch_building_ledger(
     sigungu_cd: str = SIGUNGU_CD,
     bjdong_cd: str = BJDONG_CD,
     num_of_rows: int = 100,
     max_pages: int = 10,
+    concurrent: bool = True,
+    max_workers: int = LEDGER_MAX_WORKERS,
 ) -> pd.DataFrame:
     """
     건축물대장 기본개요를 페이지네이션하여 수집한다.
 
+    concurrent 모드에서는 1페이지 응답의 totalCount로 남은 페이지 수를 계산한 뒤,
+    나머지 페이지를 스레드 풀(max_workers)로 병렬 요청한다.
+    결과는 페이지 순서를 유지하며 mgmBldrgstPk 기준으로 중복 제거된다.
+
     Args:
         sigungu_cd: 시군구코드 (기본값: 강남구 11680)
         bjdong_cd: 법정동코드 (기본값: 역삼동 10300)
         num_of_rows: 페이지당 건수
         max_pages: 최대 페이지 수
+        concurrent: 병렬 페이지 수집 여부 (False면 기존 순차 방식)
+        max_workers: 병렬 수집 시 최대 동시 요청 수
 
     Returns:
         건축물대장 데이터프레임
     """
     all_items = []
+    for item_list in iter_ledger_pages(sigungu_cd, bjdong_cd, num_of_rows, max_pages, concurrent, max_workers):
+        all_items.extend(item_list)
+
+    all_items = _dedupe_by_pk(all_items)
+
+    if not all_items:
+        logger.warning("수집된 건축물대장 데이터가 없습니다.")
+        return pd.DataFrame()
+
+    df = pd.DataFrame(all_items)
+    logger.info(f"건축물대장 원시 데이터: {len(df)}건, 컬럼: {list(df.columns)}")
+
+    return df
+
+
+def iter_ledger_pages(
+    sigungu_cd: str = SIGUNGU_CD,
+    bjdong_cd: str = BJDONG_CD,
+    num_of_rows: int = 100,
+    max_pages: int = 10,
+    concurrent: bool = True,
+    max_workers: int = LEDGER_MAX_WORKERS,
+) -> Iterator[list[dict]]:
+    """
+    건축물대장 원시 아이템을 페이지 단위로 순서대로 내보낸다.
+    전체 수집이 끝나기 전에 앞 페이지부터 후속 처리를 시작할 때 사용한다.
+    (중복 제거는 하지 않으므로 호출 측에서 mgmBldrgstPk 기준으로 처리한다)
+
+    Yields:
+        페이지별 원시 아이템 리스트
+    """
+    if concurrent:
+        yield from _fetch_pages_concurrent(sigungu_cd, bjdong_cd, num_of_rows, max_pages, max_workers)
+    else:
+        yield from _fetch_pages_sequential(sigungu_cd, bjdong_cd, num_of_rows, max_pages)
+
+
+def _fetch_pages_sequential(
+    sigungu_cd: str,
+    bjdong_cd: str,
+    num_of_rows: int,
+    max_pages: int,
+) -> Iterator[list[dict]]:
+    """페이지를 하나씩 순서대로 수집한다."""
+    collected = 0
+    failed_pages = []
 
     for page_no in range(1, max_pages + 1):
         logger.info(f"건축물대장 수집 중... 페이지 {page_no}/{max_pages}")
 
-        params = {
-            "serviceKey": DATA_GO_KR_API_KEY,
-            "sigunguCd": sigungu_cd,
-            "bjdongCd": bjdong_cd,
-            "numOfRows": num_of_rows,
-            "pageNo": page_no,
-            "resultType": "json",
-        }
+        page = _fetch_page(page_no, sigungu_cd, bjdong_cd, num_of_rows)
+        if page is None:
+            # 재시도까지 실패한 페이지. 1페이지가 실패하면 전체 건수를 알 수 없으므로 중단
+            failed_pages.append(page_no)
+            if page_no == 1:
+                break
+            continue
 
-        try:
-            resp = requests.get(BASE_URL, params=params, timeout=30)
-            resp.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API 요청 실패 (페이지 {page_no}): {e}")
+        total_count, item_list = page
+        if not item_list:
+            logger.info(f"페이지 {page_no}: 데이터 없음. 수집 종료.")
             break
 
-        # JSON 파싱 시도, 실패 시 XML 파싱
-        content_type = resp.headers.get("content-type", "")
-        try:
-            if "xml" in content_type:
-                raise ValueError("XML response detected")
-            data = resp.json()
-            body = data.get("response", {}).get("body", {})
-            total_count = body.get("totalCount", 0)
-            items = body.get("items", {})
-            if not items:
-                logger.info(f"페이지 {page_no}: 데이터 없음. 수집 종료.")
-                break
-            item_list = items if isinstance(items, list) else items.get("item", [])
-            if isinstance(item_list, dict):
-                item_list = [item_list]
-        except (ValueError, KeyError):
-            # XML 파싱 fallback
-            try:
-                root = ET.fromstring(resp.text)
-                body_el = root.find(".//body")
-                if body_el is None:
-                    logger.error(f"페이지 {page_no}: XML에서 body를 찾을 수 없음")
-                    break
-                total_count_el = body_el.find("totalCount")
-                total_count = int(total_count_el.text) if total_count_el is not None else 0
-                item_elements = root.findall(".//item")
-                if not item_elements:
-                    logger.info(f"페이지 {page_no}: 데이터 없음. 수집 종료.")
-                    break
-                item_list = []
-                for item_el in item_elements:
-                    item_dict = {}
-                    for child in item_el:
-                        item_dict[child.tag] = child.text
-                    item_list.append(item_dict)
-                logger.debug(f"페이지 {page_no}: XML 파싱 성공 ({len(item_list)}건)")
-            except ET.ParseError as e:
-                logger.error(f"XML 파싱 실패 (페이지 {page_no}): {e}")
-                break
-
-        all_items.extend(item_list)
-        logger.info(f"페이지 {page_no}: {len(item_list)}건 수집 (누적 {len(all_items)}/{total_count})")
+        collected += len(item_list)
+        logger.info(f"페이지 {page_no}: {len(item_list)}건 수집 (누적 {collected}/{total_count})")
+        yield item_list
 
         # 전체 데이터 수집 완료 확인
-        if len(all_items) >= total_count:
+        if collected >= total_count:
             logger.info("전체 데이터 수집 완료.")
             break
 
-        # API 과부하 방지를 위한 딜레이
-        time.sleep(0.5)
-
-    if not all_items:
-        logger.warning("수집된 건축물대장 데이터가 없습니다.")
-        return pd.DataFrame()
+    _warn_failed_pages(failed_pages)
+
+
+def _fetch_pages_concurrent(
+    sigungu_cd: str,
+    bjdong_cd: str,
+    num_of_rows: int,
+    max_pages: int,
+    max_workers: int,
+) -> Iterator[list[dict]]:
+    """1페이지로 전체 건수를 확인한 뒤 나머지 페이지를 병렬로 수집한다."""
+    logger.info(f"건축물대장 수집 중... 페이지 1/{max_pages}")
+    first = _fetch_page(1, sigungu_cd, bjdong_cd, num_of_rows)
+    if first is None:
+        _warn_failed_pages([1])
+        return
+
+    total_count, first_items = first
+    if not first_items:
+        logger.info("페이지 1: 데이터 없음. 수집 종료.")
+        return
+
+    total_pages = min(max_pages, math.ceil(total_count / num_of_rows)) if num_of_rows else 1
+    logger.info(f"페이지 1: {len(first_items)}건 수집 (전체 {total_count}건, {total_pages}페이지)")
+    yield first_items
+
+    collected = len(first_items)
+    remaining = range(2, total_pages + 1)
+    if not remaining:
+        logger.info("전체 데이터 수집 완료.")
+        return
+
+    failed_pages = []
+    fetch = partial(_fetch_page, sigungu_cd=sigungu_cd, bjdong_cd=bjdong_cd, num_of_rows=num_of_rows)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        # executor.map은 입력 순서대로 결과를 돌려주므로 페이지 순서가 유지된다
+        for page_no, page in zip(remaining, executor.map(fetch, remaining)):
+            if page is None:
+                failed_pages.append(page_no)
+                continue
+            _, item_list = page
+            collected += len(item_list)
+            logger.info(f"페이지 {page_no}: {len(item_list)}건 수집 (누적 {collected}/{total_count})")
+            yield item_list
+
+    if failed_pages:
+        _warn_failed_pages(failed_pages)
+    else:
+        logger.info("전체 데이터 수집 완료.")
 
-    df = pd.DataFrame(all_items)
-    logger.info(f"건축물대장 원시 데이터: {len(df)}건, 컬럼: {list(df.columns)}")
 
-    return df
+def _warn_failed_pages(failed_pages: list[int]) -> None:
+    """재시도 후에도 실패한 페이지가 있으면 결과가 불완전하다는 경고를 남긴다."""
+    if failed_pages:
+        logger.warning(
+            f"건축물대장 페이지 {failed_pages} 수집 실패 (재시도 소진). "
+            f"수집 결과가 불완전합니다."
+        )
 
 
 def parse_building_ledger(df: pd.DataFrame) -> pd.DataFrame:
@@ -154,7 +324,7 @@ def parse_building_ledger(df: pd.DataFrame) -> pd.DataFrame:
 
     # 존재하는 컬럼만 선택
     available_cols = {k: v for k, v in column_map.items() if k in df.columns}
-    result = df[list(available_cols.keys())].rename(columns=available_cols).copy()
+    result = df[list(available_cols.keys())].rename(columns=available_cols)
 
     # 지상 층수 정수 변환
     if "ground_floors" in result.columns:
@@ -199,10 +369,10 @@ def parse_building_ledger(df: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
-def collect() -> pd.DataFrame:
+def collect(sigungu_cd: str = SIGUNGU_CD, bjdong_cd: str = BJDONG_CD) -> pd.DataFrame:
     """건축물대장 수집 파이프라인 실행 (외부 호출용)"""
     logger.info("=== 건축물대장 수집 시작 ===")
-    raw_df = fetch_building_ledger()
+    raw_df = fetch_building_ledger(sigungu_cd, bjdong_cd)
     parsed_df = parse_building_ledger(raw_df)
     logger.info(f"=== 건축물대장 수집 완료: {len(parsed_df)}건 ===")
     return parsed_df
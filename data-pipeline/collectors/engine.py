@@ -0,0 +1,137 @@
+"""
+ScanPang Data Pipeline - 비동기 수집 엔진
+건축물대장 / 네이버 / Google Places 수집을 의존 관계에 따라 동시에 실행한다.
+
+의존 관계:
+    건축물대장 ──(페이지 도착 시 건물명)──▶ 네이버 건물별 검색
+    네이버 기본 지역 검색   (독립)
+    Google Places          (독립)
+
+각 수집기는 동기(requests) 코드이므로 asyncio.to_thread로 스레드에서 실행하고,
+프로바이더별 호출 속도는 utils.rate_limiter가 공유 버킷으로 제어한다.
+전체 수집 시간은 세 프로바이더의 합이 아니라 가장 느린 하나에 가까워진다.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+import pandas as pd
+
+from collectors import building_ledger, google_places, naver_places
+from config import NAVER_MAX_CONCURRENCY
+from utils.regions import default_region
+
+logger = logging.getLogger(__name__)
+
+_PAGES_DONE = object()
+
+
+async def _aiter_ledger_pages(sigungu_cd: str, bjdong_cd: str) -> AsyncIterator[list[dict]]:
+    """스레드에서 도는 건축물대장 페이지 제너레이터를 비동기 이터레이터로 연결한다."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def _produce():
+        try:
+            for page in building_ledger.iter_ledger_pages(sigungu_cd, bjdong_cd):
+                loop.call_soon_threadsafe(queue.put_nowait, page)
+        except Exception as e:  # 예외는 소비 측에서 다시 던진다
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _PAGES_DONE)
+
+    producer = asyncio.create_task(asyncio.to_thread(_produce))
+    try:
+        while True:
+            page = await queue.get()
+            if page is _PAGES_DONE:
+                break
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        await producer
+
+
+async def collect_concurrently(
+    region: Optional[dict] = None,
+    max_naver_concurrency: int = NAVER_MAX_CONCURRENCY,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    세 수집기를 동시에 실행한다.
+
+    - Google Places는 건축물대장과 무관하므로 즉시 시작한다.
+    - 네이버 기본 지역 검색도 즉시 시작한다.
+    - 네이버 건물별 검색은 건축물대장 페이지가 도착할 때마다 새 건물명에 대해 시작한다.
+
+    Args:
+        region: 수집 대상 지역 (utils.regions 형식, 기본값: config의 단일 지역)
+        max_naver_concurrency: 동시에 진행할 네이버 검색 대상(건물/지역) 수
+
+    Returns:
+        (buildings_df, naver_df, google_df) - 순차 수집과 같은 형태/순서의 결과
+    """
+    region = region or default_region()
+    logger.info(f"=== 동시 수집 시작 [{region['name']}] (건축물대장 ∥ 네이버 ∥ Google Places) ===")
+
+    semaphore = asyncio.Semaphore(max(1, max_naver_concurrency))
+
+    async def _naver_job(search_context: str) -> list[dict]:
+        async with semaphore:
+            return await asyncio.to_thread(naver_places.search_around, search_context)
+
+    google_task = asyncio.create_task(asyncio.to_thread(
+        google_places.collect, region["center_lat"], region["center_lng"], region["radius_m"],
+    ))
+    base_tasks = [asyncio.create_task(_naver_job(q)) for q in region["base_queries"]]
+
+    # 건축물대장 페이지를 받는 대로 건물별 네이버 검색을 시작
+    building_tasks = []
+    target_names: set = set()
+    raw_items: list[dict] = []
+    seen_pks: set = set()
+
+    async for page in _aiter_ledger_pages(region["sigungu_cd"], region["bjdong_cd"]):
+        new_items = []
+        for item in page:
+            pk = item.get("mgmBldrgstPk")
+            if pk:
+                if pk in seen_pks:
+                    continue
+                seen_pks.add(pk)
+            new_items.append(item)
+        raw_items.extend(new_items)
+
+        if len(target_names) >= naver_places.MAX_BUILDING_TARGETS or not new_items:
+            continue
+
+        parsed = building_ledger.parse_building_ledger(pd.DataFrame(new_items))
+        for name in naver_places.select_building_targets(parsed):
+            if len(target_names) >= naver_places.MAX_BUILDING_TARGETS:
+                break
+            if name in target_names:
+                continue
+            target_names.add(name)
+            building_tasks.append(asyncio.create_task(_naver_job(name)))
+
+    if raw_items:
+        buildings_df = building_ledger.parse_building_ledger(pd.DataFrame(raw_items))
+    else:
+        logger.warning("수집된 건축물대장 데이터가 없습니다.")
+        buildings_df = pd.DataFrame()
+    logger.info(f"건축물대장 수집 완료: {len(buildings_df)}건 (네이버 건물 검색 {len(building_tasks)}건 진행 중)")
+
+    # 순차 수집과 동일하게 건물별 결과 → 기본 지역 결과 순으로 합친다 (중복 제거 기준 유지)
+    naver_results = await asyncio.gather(*building_tasks, *base_tasks)
+    naver_df = naver_places.places_to_dataframe([p for places in naver_results for p in places])
+
+    google_df = await google_task
+
+    logger.info("=== 동시 수집 완료 ===")
+    return buildings_df, naver_df, google_df
+
+
+def collect(region: Optional[dict] = None) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """동시 수집 엔진 실행 (외부 호출용)"""
+    return asyncio.run(collect_concurrently(region))
@@ -5,18 +5,27 @@ Google Places API (Nearby Search)로 매장 정보를 보완 수집한다.
 강남역/역삼역 주변 반경 500m 내의 매장을 카테고리별로 검색한다.
 """
 
+import heapq
+import itertools
 import logging
+import math
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional
 
 import pandas as pd
 import requests
 
 from config import (
+    GOOGLE_ADAPTIVE_TILING,
+    GOOGLE_MIN_TILE_RADIUS_M,
     GOOGLE_PLACES_API_KEY,
+    GOOGLE_SEARCH_WORKERS,
     TARGET_CENTER_LAT,
     TARGET_CENTER_LNG,
     TARGET_RADIUS_M,
 )
+from utils.http_cache import cached_get, has_cached
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +48,205 @@ GOOGLE_PLACE_TYPES = {
     "store": "상점",
 }
 
+# Nearby Search는 검색당 최대 3페이지(60건)까지만 반환한다
+_MAX_PAGES_PER_SEARCH = 3
+_RESULTS_PER_PAGE = 20
+
+# next_page_token은 발급 직후에는 INVALID_REQUEST가 되므로 잠시 기다린 뒤 사용한다
+PAGE_TOKEN_DELAY_S = 2.0
+
+_EARTH_RADIUS_M = 6_371_000
+_M_PER_DEG_LAT = math.pi * _EARTH_RADIUS_M / 180
+
+
+def _is_cacheable(resp) -> bool:
+    """OK / ZERO_RESULTS 응답만 캐시한다 (INVALID_REQUEST, OVER_QUERY_LIMIT 등은 재시도 대상)."""
+    try:
+        return resp.json().get("status") in ("OK", "ZERO_RESULTS")
+    except ValueError:
+        return False
+
+
+def _nearby_params(
+    lat: float,
+    lng: float,
+    radius: float,
+    place_type: str,
+    page_token: Optional[str] = None,
+) -> dict:
+    """Nearby Search 요청 파라미터를 만든다."""
+    params = {
+        "key": GOOGLE_PLACES_API_KEY,
+        "location": f"{lat},{lng}",
+        "radius": int(round(radius)),
+        "type": place_type,
+        "language": "ko",
+    }
+    if page_token:
+        params["pagetoken"] = page_token
+    return params
+
+
+def _fetch_nearby_page(params: dict, place_type: str, page_no: int) -> Optional[dict]:
+    """
+    Nearby Search 한 페이지를 요청한다.
+
+    Returns:
+        status가 OK인 응답 JSON. 요청 실패 또는 OK가 아닌 상태면 None
+    """
+    try:
+        resp = cached_get(
+            "google", NEARBY_SEARCH_URL, params=params, timeout=15,
+            should_cache=_is_cacheable,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Google Places API 요청 실패 [{place_type}, 페이지 {page_no}]: {e}")
+        return None
+    except ValueError as e:
+        logger.error(f"JSON 파싱 실패 [{place_type}]: {e}")
+        return None
+
+    status = data.get("status")
+    if status != "OK":
+        if status == "ZERO_RESULTS":
+            logger.debug(f"Google Places [{place_type}]: 검색 결과 없음 ({params['location']})")
+        elif status == "REQUEST_DENIED":
+            logger.error(f"Google Places API 키 오류: {data.get('error_message', '')}")
+        else:
+            logger.warning(f"Google Places API 상태: {status}")
+        return None
+
+    logger.debug(f"Google Places [{place_type}] 페이지 {page_no}: {len(data.get('results', []))}건")
+    return data
+
+
+def _is_saturated(pages: int, max_pages: int, result_count: int, next_page_token: Optional[str]) -> bool:
+    """
+    검색이 Google의 결과 수 제한에 걸려 잘렸는지(포화) 판단한다.
+
+    Google은 3페이지(60건)에서 next_page_token을 더 주지 않으므로 토큰만으로는 알 수 없다.
+    max_pages를 다 썼고, 마지막 페이지에도 토큰이 남아 있거나 페이지마다 꽉 찬 결과
+    (페이지당 20건)를 받았으면 포화로 본다.
+
+    Args:
+        pages: 받은 페이지 수
+        max_pages: 검색당 최대 페이지 수
+        result_count: 받은 결과 수
+        next_page_token: 마지막 응답의 next_page_token
+
+    Returns:
+        포화 여부
+    """
+    if pages < max_pages:
+        return False
+    return bool(next_page_token) or result_count >= _RESULTS_PER_PAGE * max_pages
+
+
+class _TileSearch:
+    """
+    한 원형 영역 + 타입에 대한 페이지네이션 진행 상태.
+
+    half가 None이면 최초의 전체 원 검색이고, 값이 있으면 반변 길이가 half(m)인
+    정사각형 타일을 외접원으로 검색하는 중이다.
+    """
+
+    def __init__(
+        self,
+        place_type: str,
+        lat: float,
+        lng: float,
+        radius: float,
+        max_pages: int,
+        half: Optional[float] = None,
+    ):
+        self.place_type = place_type
+        self.lat = lat
+        self.lng = lng
+        self.radius = radius
+        self.max_pages = max_pages
+        self.half = half
+        self.page = 0
+        self.page_token: Optional[str] = None
+        self.results: list[dict] = []
+        # max_pages를 꽉 찬 페이지로 다 쓰면 Google이 잘라낸 결과가 더 있다 (_is_saturated)
+        self.saturated = False
+
+    def next_params(self) -> dict:
+        return _nearby_params(self.lat, self.lng, self.radius, self.place_type, self.page_token)
+
+
+class NearbySearchScheduler:
+    """
+    여러 Nearby Search(타입 × 타일)의 페이지 요청을 한 스레드 풀에서 교차 실행하는 스케줄러.
+
+    next_page_token은 발급 후 약 2초가 지나야 유효하므로, 다음 페이지 요청을
+    준비 시각(ready_at)과 함께 힙에 넣어 두고 그동안 다른 검색의 페이지를 먼저 요청한다.
+    대기 시간이 검색 수만큼 누적되지 않고 서로 겹친다.
+    """
+
+    def __init__(self, max_workers: int = GOOGLE_SEARCH_WORKERS, token_delay: float = PAGE_TOKEN_DELAY_S):
+        self.max_workers = max(1, max_workers)
+        self.token_delay = token_delay
+        self._heap: list = []
+        self._seq = itertools.count()
+
+    def submit(
+        self,
+        search: _TileSearch,
+        on_done: Callable[[_TileSearch], None],
+        delay: float = 0.0,
+    ) -> None:
+        """검색을 등록한다. on_done은 마지막 페이지까지 끝나면 스케줄러 스레드에서 호출된다."""
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), search, on_done))
+
+    def run(self) -> None:
+        """등록된 검색과 on_done에서 추가된 검색이 모두 끝날 때까지 실행한다."""
+        in_flight: dict = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while self._heap or in_flight:
+                # 준비된 페이지 요청을 빈 워커 수만큼 제출
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now and len(in_flight) < self.max_workers:
+                    _, _, search, on_done = heapq.heappop(self._heap)
+                    future = executor.submit(
+                        _fetch_nearby_page, search.next_params(), search.place_type, search.page + 1
+                    )
+                    in_flight[future] = (search, on_done)
+
+                timeout = None
+                if self._heap and len(in_flight) < self.max_workers:
+                    timeout = max(0.0, self._heap[0][0] - time.monotonic())
+
+                if not in_flight:
+                    # 모든 검색이 토큰 대기 중
+                    time.sleep(timeout or 0.0)
+                    continue
+
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    search, on_done = in_flight.pop(future)
+                    self._advance(search, on_done, future.result())
+
+    def _advance(self, search: _TileSearch, on_done: Callable, data: Optional[dict]) -> None:
+        search.page += 1
+        if data is None:
+            on_done(search)
+            return
+
+        search.results.extend(data.get("results", []))
+        next_page_token = data.get("next_page_token")
+
+        if next_page_token and search.page < search.max_pages:
+            search.page_token = next_page_token
+            # 캐시에 있는 다음 페이지는 토큰 유효화 대기 없이 바로 요청
+            cached = has_cached("google", NEARBY_SEARCH_URL, search.next_params())
+            self.submit(search, on_done, delay=0.0 if cached else self.token_delay)
+        else:
+            search.saturated = _is_saturated(search.page, search.max_pages, len(search.results), next_page_token)
+            on_done(search)
+
 
 def nearby_search(
     lat: float = TARGET_CENTER_LAT,
@@ -61,76 +269,179 @@ def nearby_search(
     Returns:
         검색 결과 리스트
     """
-    all_results = []
-    next_page_token = None
-
-    for page in range(max_pages):
-        params = {
-            "key": GOOGLE_PLACES_API_KEY,
-            "location": f"{lat},{lng}",
-            "radius": radius,
-            "type": place_type,
-            "language": "ko",
-        }
-
-        if next_page_token:
-            params["pagetoken"] = next_page_token
-            # Google API는 next_page_token 발급 후 짧은 지연이 필요
-            time.sleep(2)
-
-        try:
-            resp = requests.get(NEARBY_SEARCH_URL, params=params, timeout=15)
-            resp.raise_for_status()
-            data = resp.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Google Places API 요청 실패 [{place_type}, 페이지 {page + 1}]: {e}")
-            break
-        except ValueError as e:
-            logger.error(f"JSON 파싱 실패 [{place_type}]: {e}")
-            break
-
-        status = data.get("status")
-        if status != "OK":
-            if status == "ZERO_RESULTS":
-                logger.info(f"Google Places [{place_type}]: 검색 결과 없음")
-            elif status == "REQUEST_DENIED":
-                logger.error(f"Google Places API 키 오류: {data.get('error_message', '')}")
-            else:
-                logger.warning(f"Google Places API 상태: {status}")
-            break
-
-        results = data.get("results", [])
-        all_results.extend(results)
-        logger.debug(f"Google Places [{place_type}] 페이지 {page + 1}: {len(results)}건")
-
-        # 다음 페이지 토큰 확인
-        next_page_token = data.get("next_page_token")
-        if not next_page_token:
-            break
+    done: list[_TileSearch] = []
+    scheduler = NearbySearchScheduler(max_workers=1)
+    scheduler.submit(_TileSearch(place_type, lat, lng, radius, max_pages), done.append)
+    scheduler.run()
+    return done[0].results
+
+
+def _offset(lat: float, lng: float, dy_m: float, dx_m: float) -> tuple[float, float]:
+    """위경도에서 남북 dy_m, 동서 dx_m 미터만큼 이동한 좌표를 반환한다."""
+    new_lat = lat + dy_m / _M_PER_DEG_LAT
+    new_lng = lng + dx_m / (_M_PER_DEG_LAT * math.cos(math.radians(lat)))
+    return new_lat, new_lng
+
+
+def _distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 거리(미터, 하버사인)."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * _EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def _split_tile(tile: tuple[float, float, float]) -> list[tuple[float, float, float]]:
+    """정사각형 타일 (중심 위도, 중심 경도, 반변 길이 m)을 4개의 사분면 타일로 나눈다."""
+    lat, lng, half = tile
+    quarter = half / 2
+    return [
+        (*_offset(lat, lng, dy, dx), quarter)
+        for dy in (quarter, -quarter)
+        for dx in (-quarter, quarter)
+    ]
+
+
+def search_types(
+    place_types: list[str],
+    lat: float = TARGET_CENTER_LAT,
+    lng: float = TARGET_CENTER_LNG,
+    radius: int = TARGET_RADIUS_M,
+    tiling: bool = GOOGLE_ADAPTIVE_TILING,
+    max_pages: int = 2,
+    min_tile_radius: float = GOOGLE_MIN_TILE_RADIUS_M,
+    max_workers: int = GOOGLE_SEARCH_WORKERS,
+) -> dict[str, list[dict]]:
+    """
+    여러 타입의 Nearby Search를 하나의 스케줄러로 교차 실행한다.
+
+    tiling이 켜져 있으면 적응형 쿼드트리 타일링으로 60건 제한을 넘어 전체 결과를 수집한다.
+    전체 원을 먼저 검색하고, 결과가 포화(3페이지 60건)되면 원을 감싸는 정사각형을 사분면으로 나눠
+    각 타일의 외접원으로 다시 검색한다. 포화된 타일만 계속 분할하며,
+    타일 외접원이 min_tile_radius보다 작아지면 더 나누지 않는다.
+    분할된 타일 검색도 같은 스케줄러에 들어가 다른 타입의 페이지 요청과 겹쳐 실행된다.
+
+    Args:
+        place_types: Google Place 타입 목록
+        lat: 검색 중심 위도
+        lng: 검색 중심 경도
+        radius: 전체 검색 반경 (미터)
+        tiling: 적응형 타일링 사용 여부
+        max_pages: 타일링을 쓰지 않을 때 검색당 최대 페이지 수
+        min_tile_radius: 분할을 멈추는 최소 타일 반경 (미터)
+        max_workers: 동시에 진행할 페이지 요청 수
+
+    Returns:
+        {타입: place_id 기준으로 중복 제거된 검색 결과 리스트}
+        (타일링 시 전체 반경 밖 결과는 제외)
+    """
+    by_type: dict[str, dict] = {t: {} for t in place_types}
+    scheduler = NearbySearchScheduler(max_workers=max_workers)
+    pages = _MAX_PAGES_PER_SEARCH if tiling else max_pages
+
+    def _on_done(search: _TileSearch) -> None:
+        found = by_type[search.place_type]
+        for r in search.results:
+            found.setdefault(r.get("place_id") or id(r), r)
+
+        if not (tiling and search.saturated):
+            return
+
+        if search.half is None:
+            # 원을 감싸는 정사각형(반변 = radius)을 사분면으로 나눠 시작
+            children = _split_tile((search.lat, search.lng, float(radius)))
+        elif search.half * math.sqrt(2) / 2 >= min_tile_radius:
+            children = _split_tile((search.lat, search.lng, search.half))
+        else:
+            logger.warning(
+                f"Google Places [{search.place_type}] 최소 타일 반경에서도 포화 "
+                f"({search.lat:.5f}, {search.lng:.5f}) - 일부 결과 누락 가능"
+            )
+            return
+
+        for c_lat, c_lng, c_half in children:
+            # 전체 원과 겹치지 않는 타일은 검색하지 않는다
+            if _distance_m(lat, lng, c_lat, c_lng) - c_half * math.sqrt(2) > radius:
+                continue
+            scheduler.submit(
+                _TileSearch(search.place_type, c_lat, c_lng, c_half * math.sqrt(2), pages, half=c_half),
+                _on_done,
+            )
+        logger.debug(f"Google Places [{search.place_type}] 포화 타일 분할 (반변 {children[0][2]:.0f}m)")
+
+    for place_type in place_types:
+        scheduler.submit(_TileSearch(place_type, lat, lng, radius, pages), _on_done)
+    scheduler.run()
+
+    results_by_type = {}
+    for place_type, found in by_type.items():
+        results = list(found.values())
+        if tiling:
+            # 타일 외접원은 전체 원 밖까지 덮으므로 전체 반경 밖 결과는 제외
+            results = [r for r in results if _within(r, lat, lng, radius)]
+        results_by_type[place_type] = results
+    return results_by_type
+
+
+def _within(result: dict, lat: float, lng: float, radius: float) -> bool:
+    loc = result.get("geometry", {}).get("location", {})
+    if loc.get("lat") is None or loc.get("lng") is None:
+        return False
+    return _distance_m(lat, lng, loc["lat"], loc["lng"]) <= radius
+
+
+def tiled_nearby_search(
+    lat: float = TARGET_CENTER_LAT,
+    lng: float = TARGET_CENTER_LNG,
+    radius: int = TARGET_RADIUS_M,
+    place_type: str = "restaurant",
+    min_tile_radius: float = GOOGLE_MIN_TILE_RADIUS_M,
+    max_workers: int = GOOGLE_SEARCH_WORKERS,
+) -> list[dict]:
+    """
+    한 타입에 대해 적응형 쿼드트리 타일링 검색을 수행한다 (search_types 참고).
 
-    return all_results
+    Returns:
+        place_id 기준으로 중복 제거되고 전체 반경 안에 있는 검색 결과 리스트
+    """
+    return search_types(
+        [place_type], lat, lng, radius, tiling=True,
+        min_tile_radius=min_tile_radius, max_workers=max_workers,
+    )[place_type]
 
 
-def collect_all_types() -> pd.DataFrame:
+def collect_all_types(
+    tiling: bool = GOOGLE_ADAPTIVE_TILING,
+    lat: float = TARGET_CENTER_LAT,
+    lng: float = TARGET_CENTER_LNG,
+    radius: int = TARGET_RADIUS_M,
+) -> pd.DataFrame:
     """
     모든 카테고리에 대해 Google Places 검색을 수행한다.
+    타입별 검색과 페이지네이션은 NearbySearchScheduler로 교차 실행된다.
+
+    Args:
+        tiling: True면 적응형 쿼드트리 타일링으로 60건 제한 없이 수집한다
+        lat: 검색 중심 위도
+        lng: 검색 중심 경도
+        radius: 검색 반경 (미터)
 
     Returns:
         전체 매장 정보 데이터프레임
     """
-    all_places = []
+    logger.info(f"Google Places 수집: {len(GOOGLE_PLACE_TYPES)}개 타입 동시 검색 (타일링 {'ON' if tiling else 'OFF'})")
+    results_by_type = search_types(list(GOOGLE_PLACE_TYPES), lat, lng, radius, tiling=tiling)
 
+    all_places = []
     for google_type, korean_category in GOOGLE_PLACE_TYPES.items():
-        logger.info(f"Google Places 수집: {korean_category} ({google_type})")
-
-        results = nearby_search(place_type=google_type, max_pages=2)
+        results = results_by_type.get(google_type, [])
+        logger.info(f"Google Places {korean_category} ({google_type}): {len(results)}건")
 
         for result in results:
             place = _parse_google_result(result, korean_category, google_type)
             all_places.append(place)
 
-        time.sleep(0.3)  # API 호출 간격
-
     if not all_places:
         logger.warning("수집된 Google Places 데이터가 없습니다.")
         return pd.DataFrame()
@@ -174,10 +485,14 @@ def _parse_google_result(result: dict, category: str, google_type: str) -> dict:
     }
 
 
-def collect() -> pd.DataFrame:
+def collect(
+    lat: float = TARGET_CENTER_LAT,
+    lng: float = TARGET_CENTER_LNG,
+    radius: int = TARGET_RADIUS_M,
+) -> pd.DataFrame:
     """Google Places 수집 파이프라인 실행 (외부 호출용)"""
     logger.info("=== Google Places 수집 시작 ===")
-    df = collect_all_types()
+    df = collect_all_types(lat=lat, lng=lng, radius=radius)
     logger.info(f"=== Google Places 수집 완료: {len(df)}건 ===")
     return df
 
@@ -6,7 +6,6 @@ API: 네이버 검색 > 지역 (Local)
 """
 
 import logging
-import time
 from typing import Optional
 
 import pandas as pd
@@ -18,6 +17,7 @@ from config import (
     TARGET_CENTER_LAT,
     TARGET_CENTER_LNG,
 )
+from utils.http_cache import cached_get
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +38,12 @@ PLACE_CATEGORIES = [
     "주차장",
 ]
 
+# 건물명 기반 검색 대상 최대 건물 수
+MAX_BUILDING_TARGETS = 30
+
+# 기본 지역 검색어 (역삼동 / 강남역 / 역삼역 주변)
+BASE_QUERIES = ["역삼동", "강남역", "역삼역", "테헤란로"]
+
 
 def _get_headers() -> dict:
     """네이버 API 인증 헤더를 반환한다."""
@@ -73,7 +79,7 @@ def search_local(
     }
 
     try:
-        resp = requests.get(SEARCH_URL, headers=_get_headers(), params=params, timeout=15)
+        resp = cached_get("naver", SEARCH_URL, params=params, headers=_get_headers(), timeout=15)
         resp.raise_for_status()
         data = resp.json()
         return data.get("items", [])
@@ -87,6 +93,7 @@ def search_local(
 
 def collect_places_around_buildings(
     buildings_df: Optional[pd.DataFrame] = None,
+    base_queries: Optional[list[str]] = None,
 ) -> pd.DataFrame:
     """
     건물 목록을 기반으로 주변 매장 정보를 수집한다.
@@ -96,6 +103,7 @@ def collect_places_around_buildings(
 
     Args:
         buildings_df: 건축물대장 데이터프레임 (선택)
+        base_queries: 기본 지역 검색어 목록 (기본값: BASE_QUERIES)
 
     Returns:
         매장 정보 데이터프레임
@@ -103,36 +111,47 @@ def collect_places_around_buildings(
     all_places = []
 
     # 건물별로 주변 매장 검색
-    if buildings_df is not None and not buildings_df.empty:
-        # 건물명이 있는 건물 우선 검색
-        search_targets = buildings_df[
-            buildings_df["building_name"].notna() & (buildings_df["building_name"] != "")
-        ]["building_name"].unique()[:30]  # 상위 30개 건물로 제한
+    for building_name in select_building_targets(buildings_df):
+        all_places.extend(search_around(building_name))
 
-        for building_name in search_targets:
-            for category in PLACE_CATEGORIES:
-                query = f"{building_name} {category}"
-                items = search_local(query, display=5)
+    # 기본 지역 검색 (역삼동 / 강남역 / 역삼역 주변)
+    for base_query in base_queries or BASE_QUERIES:
+        all_places.extend(search_around(base_query))
 
-                for item in items:
-                    place = _parse_naver_item(item, category, building_name)
-                    all_places.append(place)
+    return places_to_dataframe(all_places)
 
-                time.sleep(0.2)  # API 호출 간격
 
-    # 기본 지역 검색 (역삼동 / 강남역 / 역삼역 주변)
-    base_queries = ["역삼동", "강남역", "역삼역", "테헤란로"]
-    for base_query in base_queries:
-        for category in PLACE_CATEGORIES:
-            query = f"{base_query} {category}"
-            items = search_local(query, display=5)
+def select_building_targets(buildings_df: Optional[pd.DataFrame]) -> list[str]:
+    """건물명이 있는 건물 중 검색 대상 건물명을 순서대로 최대 MAX_BUILDING_TARGETS개 고른다."""
+    if buildings_df is None or buildings_df.empty:
+        return []
+    return list(buildings_df[
+        buildings_df["building_name"].notna() & (buildings_df["building_name"] != "")
+    ]["building_name"].unique()[:MAX_BUILDING_TARGETS])
+
 
-            for item in items:
-                place = _parse_naver_item(item, category, base_query)
-                all_places.append(place)
+def search_around(search_context: str) -> list[dict]:
+    """
+    검색 맥락(건물명 또는 지역명)과 업종 키워드를 조합해 매장을 검색한다.
 
-            time.sleep(0.2)
+    Args:
+        search_context: 건물명 또는 지역명
 
+    Returns:
+        정규화된 매장 정보 딕셔너리 리스트
+    """
+    places = []
+    for category in PLACE_CATEGORIES:
+        query = f"{search_context} {category}"
+        items = search_local(query, display=5)
+
+        for item in items:
+            places.append(_parse_naver_item(item, category, search_context))
+    return places
+
+
+def places_to_dataframe(all_places: list[dict]) -> pd.DataFrame:
+    """수집한 매장 리스트를 데이터프레임으로 만들고 매장명 + 주소 기준으로 중복 제거한다."""
     if not all_places:
         logger.warning("수집된 네이버 매장 데이터가 없습니다.")
         return pd.DataFrame()
@@ -180,10 +199,13 @@ def _parse_naver_item(item: dict, category: str, search_context: str) -> dict:
     }
 
 
-def collect(buildings_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+def collect(
+    buildings_df: Optional[pd.DataFrame] = None,
+    base_queries: Optional[list[str]] = None,
+) -> pd.DataFrame:
     """네이버 매장 수집 파이프라인 실행 (외부 호출용)"""
     logger.info("=== 네이버 매장 수집 시작 ===")
-    df = collect_places_around_buildings(buildings_df)
+    df = collect_places_around_buildings(buildings_df, base_queries)
     logger.info(f"=== 네이버 매장 수집 완료: {len(df)}건 ===")
     return df
 
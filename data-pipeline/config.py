@@ -96,6 +96,18 @@ def get_db_url_safe() -> str:
     return f"postgresql://{DB_USER}:{password_encoded}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 
+# ──────────────────────────────────────────────
+# DB 적재 설정 (loaders/db_loader.py)
+# ──────────────────────────────────────────────
+# 스테이징 COPY를 나눠 보낼 연결 수 (1이면 단일 연결 + 임시 테이블)
+# 2 이상은 DB_STAGE_SCHEMA에 스키마/테이블 생성 권한이 있어야 하므로 필요할 때만 켠다
+DB_LOAD_WORKERS: int = int(os.getenv("DB_LOAD_WORKERS", "1"))
+# 병렬 적재 시 스테이징 테이블을 만들 스키마 (실행마다 테이블을 만들고 끝나면 지운다)
+DB_STAGE_SCHEMA: str = os.getenv("DB_STAGE_SCHEMA", "pipeline_stage")
+# 이보다 오래된 스테이징 테이블은 중간에 죽은 실행이 남긴 것으로 보고 다음 병렬 적재 때 지운다
+DB_STAGE_STALE_S: int = int(os.getenv("DB_STAGE_STALE_S", str(24 * 3600)))
+
+
 # ──────────────────────────────────────────────
 # 수집 대상 지역 설정
 # ──────────────────────────────────────────────
@@ -108,6 +120,32 @@ TARGET_CENTER_LAT = 37.4979
 TARGET_CENTER_LNG = 127.0276
 TARGET_RADIUS_M = 500      # 반경 500m
 
+# 다지역 수집 매니페스트 (utils/regions.py 형식) 및 샤드 실행 설정
+REGION_MANIFEST_PATH: Path = Path(os.getenv(
+    "REGION_MANIFEST_PATH", str(Path(__file__).resolve().parent / "regions.json")
+))
+SHARD_OUTPUT_DIR: Path = Path(os.getenv(
+    "SHARD_OUTPUT_DIR", str(Path(__file__).resolve().parent / "output" / "shards")
+))
+CHECKPOINT_DIR: Path = Path(os.getenv(
+    "CHECKPOINT_DIR", str(Path(__file__).resolve().parent / "output" / "checkpoints")
+))
+SHARD_WORKERS: int = int(os.getenv("SHARD_WORKERS", str(os.cpu_count() or 1)))
+
+# 업종 분류 체계 (processors/category.py): 카테고리별 아이콘과 키워드 (파일 순서가 우선순위)
+CATEGORY_TAXONOMY_PATH: Path = Path(os.getenv(
+    "CATEGORY_TAXONOMY_PATH", str(Path(__file__).resolve().parent / "category_taxonomy.json")
+))
+
+# 스트리밍 모드 (streaming.py): 마이크로 배치 크기와 단계 간 큐 크기(배치 수)
+STREAM_BATCH_SIZE: int = int(os.getenv("STREAM_BATCH_SIZE", "200"))
+STREAM_QUEUE_SIZE: int = int(os.getenv("STREAM_QUEUE_SIZE", "4"))
+
+# Google Places 적응형 타일링 (검색당 60건 제한 우회)
+GOOGLE_ADAPTIVE_TILING: bool = os.getenv("GOOGLE_ADAPTIVE_TILING", "1") not in ("0", "false", "False")
+GOOGLE_MIN_TILE_RADIUS_M = 50   # 이보다 작은 타일로는 분할하지 않음
+GOOGLE_SEARCH_WORKERS = 4       # 타입/타일 페이지 요청 동시 진행 수
+
 # 수집 대상 주요 건물 키워드 (강남역·역삼역 반경 500m)
 TARGET_BUILDING_KEYWORDS = [
     "강남파이낸스센터",
@@ -123,3 +161,76 @@ TARGET_BUILDING_KEYWORDS = [
     "메리츠타워",
     "신논현역",
 ]
+
+# ──────────────────────────────────────────────
+# 매장 → 건물 매칭 (processors/matcher.py)
+# ──────────────────────────────────────────────
+# "text": 주소 토큰/건물명만 사용 / "spatial": Geocoding 후 좌표 근접 건물 우선, 텍스트는 동점 처리용
+MATCH_MODE: str = os.getenv("MATCH_MODE", "spatial")
+MATCH_MAX_DISTANCE_M: float = float(os.getenv("MATCH_MAX_DISTANCE_M", "30"))   # 이 거리 안의 건물만 후보
+# 건물 외곽선 GeoJSON (VWorld 응답 그대로도 가능). 지정하면 매장 좌표가 들어 있는 폴리곤의 건물에 우선 배정
+BUILDING_FOOTPRINTS_PATH: str = os.getenv("BUILDING_FOOTPRINTS_PATH", "")
+
+# ──────────────────────────────────────────────
+# 매장 중복 제거 (processors/entity_resolution.py)
+# ──────────────────────────────────────────────
+# 네이버/구글에서 표기가 다른 같은 매장을 합친다: 이 거리 안 + 매장명 유사도 기준 이상이면 같은 매장
+ENTITY_MAX_DISTANCE_M: float = float(os.getenv("ENTITY_MAX_DISTANCE_M", "50"))
+ENTITY_TITLE_SIMILARITY: float = float(os.getenv("ENTITY_TITLE_SIMILARITY", "0.5"))
+
+# ──────────────────────────────────────────────
+# 수집 동시성 설정
+# ──────────────────────────────────────────────
+# 건축물대장 페이지 병렬 요청 수 (1페이지 이후 나머지 페이지를 동시에 요청)
+LEDGER_MAX_WORKERS: int = int(os.getenv("LEDGER_MAX_WORKERS", "4"))
+# 네이버 검색 대상(건물/지역)을 동시에 몇 개까지 진행할지 (실제 호출 속도는 RATE_LIMITS가 제한)
+NAVER_MAX_CONCURRENCY: int = int(os.getenv("NAVER_MAX_CONCURRENCY", "4"))
+
+# ──────────────────────────────────────────────
+# API 호출 속도 제한 (프로바이더별 QPS, burst)
+# ──────────────────────────────────────────────
+# 같은 프로바이더를 호출하는 모든 모듈이 하나의 토큰 버킷을 공유한다.
+# 실제 쿼터에 맞게 환경변수로 조정한다.
+RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "data_go_kr": (float(os.getenv("DATA_GO_KR_QPS", "5")), int(os.getenv("DATA_GO_KR_BURST", "5"))),
+    "naver": (float(os.getenv("NAVER_QPS", "10")), int(os.getenv("NAVER_BURST", "10"))),
+    "google": (float(os.getenv("GOOGLE_QPS", "10")), int(os.getenv("GOOGLE_BURST", "10"))),
+}
+
+# ──────────────────────────────────────────────
+# HTTP 응답 캐시
+# ──────────────────────────────────────────────
+HTTP_CACHE_ENABLED: bool = os.getenv("HTTP_CACHE_ENABLED", "1") not in ("0", "false", "False")
+HTTP_CACHE_DIR: Path = Path(os.getenv(
+    "HTTP_CACHE_DIR", str(Path(__file__).resolve().parent / ".cache" / "http")
+))
+HTTP_CACHE_MAX_BYTES: int = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+# 프로바이더별 캐시 유효기간 (초)
+HTTP_CACHE_TTL: dict[str, int] = {
+    "data_go_kr": 7 * 24 * 3600,   # 건축물대장은 자주 바뀌지 않음
+    "naver": 24 * 3600,
+    "google": 24 * 3600,
+}
+
+# 캐시 키에서 제외할 비밀 파라미터 (API 키)
+HTTP_CACHE_SECRET_PARAMS: frozenset = frozenset({"serviceKey", "key"})
+
+# ──────────────────────────────────────────────
+# HTTP 세션 (커넥션 풀 / 재시도)
+# ──────────────────────────────────────────────
+HTTP_POOL_MAXSIZE: int = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))      # 호스트당 유지할 최대 연결 수
+HTTP_MAX_RETRIES: int = int(os.getenv("HTTP_MAX_RETRIES", "4"))         # 429/5xx/연결 오류 재시도 횟수
+HTTP_BACKOFF_FACTOR: float = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))  # 0.5, 1, 2, 4초 ...
+HTTP_BACKOFF_JITTER: float = float(os.getenv("HTTP_BACKOFF_JITTER", "0.5"))  # 백오프에 더할 최대 지터(초)
+
+# ──────────────────────────────────────────────
+# Geocoding 결과 캐시 (SQLite)
+# ──────────────────────────────────────────────
+GEOCODE_CACHE_ENABLED: bool = os.getenv("GEOCODE_CACHE_ENABLED", "1") not in ("0", "false", "False")
+GEOCODE_CACHE_PATH: Path = Path(os.getenv(
+    "GEOCODE_CACHE_PATH", str(Path(__file__).resolve().parent / ".cache" / "geocode.sqlite3")
+))
+GEOCODE_CACHE_TTL: int = 30 * 24 * 3600      # 성공 결과 유지 기간
+GEOCODE_NEGATIVE_TTL: int = 24 * 3600        # 검색 결과 없음 유지 기간 (주소 데이터 보완 가능성 고려)
+GEOCODE_MAX_WORKERS: int = int(os.getenv("GEOCODE_MAX_WORKERS", "4"))  # 배치 Geocoding 동시 요청 수
@@ -3,16 +3,42 @@ ScanPang Data Pipeline - DB 적재 모듈
 정제된 데이터를 PostgreSQL(Supabase)에 적재한다.
 
 대상 테이블: buildings, floors, facilities, building_stats, live_feeds
+
+각 테이블은 행 단위 INSERT 대신 두 단계로 적재한다.
+    1. 프레임을 임시 스테이징 테이블(_stage_*)에 COPY FROM STDIN으로 한 번에 전송
+    2. INSERT … SELECT 한 문장으로 대상 테이블에 반영 (PostGIS 좌표도 서버에서 생성)
+facilities, building_stats, live_feeds는 전송할 데이터 없이 새 건물 ID 배열과
+템플릿(VALUES)을 서버에서 CROSS JOIN해 만든다.
+테이블당 왕복이 행 수와 무관하게 몇 번으로 고정된다.
+
+적재는 증분 방식이다. 건물/매장마다 자연 키(source_key)와 내용 해시(content_hash)를 계산해
+DB에 저장된 해시와 한 번에 비교하고, 새 행과 바뀐 행만 upsert, 사라진 매장은 삭제한다.
+바뀐 것이 없으면 해시 조회 몇 번으로 끝난다.
+자연 키 도입 전에 적재된 건물(source_key IS NULL)은 건물명+주소가 같으면 새 키가 그 행을
+넘겨받아 갱신하므로, 기존 DB에서 첫 증분 적재를 해도 건물이 두 벌로 늘지 않는다.
+
+load_*/prune_* 함수는 커밋하지 않는다. load_all은 전체 적재를 한 트랜잭션으로 묶어
+마지막에 한 번 커밋하므로 중간에 실패하면 이번 실행분이 모두 롤백된다.
+DB_LOAD_WORKERS가 2 이상이면 스테이징 COPY를 연결 풀의 여러 연결로 나눠 동시에 보내고
+(ParallelStager), 대상 테이블 반영은 메인 연결의 트랜잭션 하나에서 의존 순서대로 한다.
+기본값 1은 임시 테이블만 쓰므로 스키마 생성 권한이 필요 없다.
 """
 
+import io
 import logging
-from typing import Optional
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_values
+from psycopg2 import pool
 
-from config import get_db_params
+from config import DB_LOAD_WORKERS, DB_STAGE_SCHEMA, DB_STAGE_STALE_S, get_db_params
+from processors.merger import attach_building_keys, building_keys, tenant_keys
 
 logger = logging.getLogger(__name__)
 
@@ -26,325 +52,637 @@ def get_connection():
     return conn
 
 
-def load_buildings(conn, buildings_df: pd.DataFrame) -> dict:
+# 좌표가 없는 건물의 기본 좌표 (강남역 부근)
+DEFAULT_LAT, DEFAULT_LNG = 37.4979, 127.0276
+
+# 건물 용도에 따른 기본 편의시설
+DEFAULT_FACILITIES = [
+    {"facility_type": "주차장", "location_info": "B1-B2", "status_text": "유료"},
+    {"facility_type": "와이파이", "location_info": "전층", "status_text": "무료"},
+    {"facility_type": "냉난방", "location_info": "전층", "status_text": "중앙 공급"},
+]
+
+# 건물 통계 템플릿 (stat_value가 None인 항목은 적재 시 건물 층수로 계산)
+STAT_TEMPLATES = [
+    {"stat_type": "total_floors", "stat_value": None, "stat_icon": "layers", "display_order": 1},
+    {"stat_type": "basement", "stat_value": None, "stat_icon": "arrow_downward", "display_order": 2},
+    {"stat_type": "occupancy", "stat_value": "85%", "stat_icon": "pie_chart", "display_order": 3},     # MVP 더미 값
+    {"stat_type": "tenants", "stat_value": None, "stat_icon": "store", "display_order": 4},            # 추정치
+    {"stat_type": "congestion", "stat_value": "보통", "stat_icon": "people", "display_order": 5},      # MVP 더미 값
+]
+
+# 기본 LIVE 피드 템플릿
+FEED_TEMPLATES = [
+    {
+        "feed_type": "congestion",
+        "title": "현재 혼잡도: 보통",
+        "description": "평상시 대비 적정 수준입니다.",
+        "icon": "people",
+        "icon_color": "green",
+        "time_label": "현재",
+    },
+    {
+        "feed_type": "event",
+        "title": "1층 로비 리모델링 공사 중",
+        "description": "2층 출입구를 이용해 주세요.",
+        "icon": "construction",
+        "icon_color": "orange",
+        "time_label": "오늘",
+    },
+    {
+        "feed_type": "promotion",
+        "title": "B1 카페 오픈 기념 할인",
+        "description": "아메리카노 50% 할인 (~이번주)",
+        "icon": "local_offer",
+        "icon_color": "red",
+        "time_label": "진행중",
+    },
+]
+
+_COPY_NULL = r"\N"
+# ParallelStager 스테이징 테이블 이름: <table>_<epoch 초>_<난수 8자리>
+_STAGE_TABLE_RE = re.compile(r"^\w+?_(\d{10})_[0-9a-f]{8}$")
+
+
+def load_buildings(conn, buildings_df: pd.DataFrame, stager: Optional[Callable] = None) -> dict:
     """
-    건물 데이터를 buildings 테이블에 적재한다.
+    건물 데이터를 buildings 테이블에 증분 적재한다.
+    건물마다 자연 키(building_key → buildings.source_key)와 내용 해시를 계산해
+    DB에 저장된 해시와 비교하고, 새 건물과 내용이 바뀐 건물만 upsert한다.
 
     Args:
-        conn: psycopg2 연결 객체
+        conn: psycopg2 연결 객체 (커밋은 호출하는 쪽에서 한다)
         buildings_df: 건물 데이터프레임
+        stager: 스테이징 함수 (기본 copy_to_staging, 병렬 적재 시 ParallelStager)
 
     Returns:
-        {"inserted": int, "id_map": dict} - 삽입 건수 및 건물명→ID 매핑
+        {
+            "inserted": int,          # 새로 삽입된 건물 수
+            "updated": int,           # 내용이 바뀌어 갱신된 건물 수
+            "key_ids": pd.Series,     # 자연 키 → building_id (입력 건물 전체)
+            "new_ids": list[int],     # 새로 삽입된 building_id (입력 행 순서)
+            "changed_ids": list[int], # 갱신된 building_id
+        }
     """
     if buildings_df.empty:
         logger.warning("적재할 건물 데이터가 없습니다.")
-        return {"inserted": 0, "id_map": {}}
+        return {"inserted": 0, "updated": 0, "key_ids": pd.Series(dtype="int64"), "new_ids": [], "changed_ids": []}
 
-    cur = conn.cursor()
-    inserted = 0
-    id_map = {}  # building_name → building_id
-
-    insert_sql = """
-        INSERT INTO buildings (name, address, location, total_floors, basement_floors,
-                               building_use, completion_year)
-        VALUES (%s, %s, ST_SetSRID(ST_MakePoint(%s, %s), 4326), %s, %s, %s, %s)
-        ON CONFLICT DO NOTHING
-        RETURNING id, name;
-    """
+    keys = buildings_df["building_key"] if "building_key" in buildings_df.columns else building_keys(buildings_df)
 
-    for _, row in buildings_df.iterrows():
-        name = row.get("building_name", "")
-        address = row.get("address", "")
-        lat = row.get("lat")
-        lng = row.get("lng")
-        total_floors = row.get("ground_floors", 0)
-        basement_floors = row.get("basement_floors", 0)
-        building_use = row.get("building_use", "")
-        completion_year = row.get("completion_year")
+    cur = conn.cursor()
+    stage = pd.DataFrame({
+        "row_no": range(len(buildings_df)),
+        "source_key": keys.astype(object).to_numpy(),
+        "name": _text_column(buildings_df, "building_name").to_numpy(),
+        "address": _text_column(buildings_df, "address").to_numpy(),
+        "lng": _numeric_column(buildings_df, "lng").to_numpy(),
+        "lat": _numeric_column(buildings_df, "lat").to_numpy(),
+        "total_floors": _int_column(buildings_df, "ground_floors", default=0).array,
+        "basement_floors": _int_column(buildings_df, "basement_floors", default=0).array,
+        "building_use": _text_column(buildings_df, "building_use").to_numpy(),
+        "completion_year": _int_column(buildings_df, "completion_year").array,
+    })
+    # 준공연도 0은 미상으로 취급
+    stage.loc[stage["completion_year"] == 0, "completion_year"] = pd.NA
+    # 같은 키가 여러 번 나오면 첫 행 기준
+    stage = stage.drop_duplicates(subset=["source_key"], keep="first")
+    stage["content_hash"] = _content_hashes(stage, [
+        "name", "address", "lng", "lat", "total_floors", "basement_floors", "building_use", "completion_year",
+    ])
+
+    # DB에 저장된 해시를 한 번에 조회해 새 건물 / 바뀐 건물만 골라낸다
+    cur.execute(
+        "SELECT source_key, id, content_hash FROM buildings WHERE source_key = ANY(%s)",
+        (stage["source_key"].tolist(),),
+    )
+    existing = pd.DataFrame(cur.fetchall(), columns=["source_key", "id", "content_hash"], dtype=object)
+    adopted = _adopt_legacy_buildings(cur, stage[~stage["source_key"].isin(existing["source_key"])])
+    if not adopted.empty:
+        existing = pd.concat([existing, adopted], ignore_index=True)
+    existing = existing.set_index("source_key")
+
+    is_new = ~stage["source_key"].isin(existing.index)
+    stored_hash = stage["source_key"].map(existing["content_hash"])
+    changed = ~is_new & (stored_hash != stage["content_hash"])
+    delta = stage[is_new | changed]
+
+    written = pd.DataFrame(columns=["id", "source_key"])
+    if not delta.empty:
+        table = (stager or copy_to_staging)(cur, "_stage_buildings", {
+            "row_no": "integer",
+            "source_key": "text",
+            "name": "text",
+            "address": "text",
+            "lng": "double precision",
+            "lat": "double precision",
+            "total_floors": "integer",
+            "basement_floors": "integer",
+            "building_use": "text",
+            "completion_year": "integer",
+            "content_hash": "bigint",
+        }, delta)
 
         # 좌표가 없는 경우 기본값 (강남역 부근)
-        if lat is None or lng is None or pd.isna(lat) or pd.isna(lng):
-            lat, lng = 37.4979, 127.0276
-
-        try:
-            cur.execute(insert_sql, (
-                name, address, float(lng), float(lat),
-                int(total_floors), int(basement_floors),
-                building_use,
-                int(completion_year) if completion_year and not pd.isna(completion_year) else None,
-            ))
-            result = cur.fetchone()
-            if result:
-                id_map[result[1]] = result[0]
-                inserted += 1
-        except Exception as e:
-            logger.error(f"건물 INSERT 실패 [{name}]: {e}")
-            conn.rollback()
-            continue
-
-    conn.commit()
-    logger.info(f"buildings 테이블 적재: {inserted}건")
-    return {"inserted": inserted, "id_map": id_map}
-
+        cur.execute(f"""
+            INSERT INTO buildings (name, address, location, total_floors, basement_floors,
+                                   building_use, completion_year, source_key, content_hash)
+            SELECT COALESCE(name, ''), COALESCE(address, ''),
+                   CASE WHEN lng IS NULL OR lat IS NULL
+                        THEN ST_SetSRID(ST_MakePoint(%s, %s), 4326)
+                        ELSE ST_SetSRID(ST_MakePoint(lng, lat), 4326) END,
+                   total_floors, basement_floors, building_use, completion_year, source_key, content_hash
+            FROM {table}
+            ORDER BY row_no
+            ON CONFLICT (source_key) DO UPDATE SET
+                name = EXCLUDED.name,
+                address = EXCLUDED.address,
+                location = EXCLUDED.location,
+                total_floors = EXCLUDED.total_floors,
+                basement_floors = EXCLUDED.basement_floors,
+                building_use = EXCLUDED.building_use,
+                completion_year = EXCLUDED.completion_year,
+                content_hash = EXCLUDED.content_hash,
+                updated_at = NOW()
+            RETURNING id, source_key;
+        """, (DEFAULT_LNG, DEFAULT_LAT))
+        written = pd.DataFrame(cur.fetchall(), columns=["id", "source_key"])
+
+    # 입력 행 순서(row_no)대로 ID 정리
+    ids = pd.concat([existing["id"], written.set_index("source_key")["id"]])
+    ids = ids[~ids.index.duplicated(keep="last")].astype("int64")
+    key_ids = pd.Series(stage["source_key"].map(ids).to_numpy(), index=pd.Index(stage["source_key"], name="building_key"))
+    new_ids = key_ids[is_new.to_numpy()].tolist()
+    changed_ids = key_ids[changed.to_numpy()].tolist()
+
+    logger.info(
+        f"buildings 테이블 적재: 신규 {len(new_ids)}건, 변경 {len(changed_ids)}건, "
+        f"변경 없음 {len(stage) - len(delta)}건"
+    )
+    return {
+        "inserted": len(new_ids),
+        "updated": len(changed_ids),
+        "key_ids": key_ids,
+        "new_ids": new_ids,
+        "changed_ids": changed_ids,
+    }
+
+
+def _adopt_legacy_buildings(cur, candidates: pd.DataFrame) -> pd.DataFrame:
+    """
+    자연 키 도입 전에 적재된 건물(source_key IS NULL) 중 건물명+주소가 같은 행에 새 자연 키를 부여한다.
+    넘겨받은 행은 해시가 없으므로 이번 적재에서 변경으로 upsert되고, 자연 키 없는 예전 매장은
+    prune_floors에서 정리된다. 같은 건물명+주소의 키가 여러 개면 어느 행인지 알 수 없으므로 넘기지 않는다.
 
-def load_floors(conn, tenants_df: pd.DataFrame, building_id_map: dict) -> int:
+    Returns:
+        넘겨받은 건물 (source_key, id, content_hash=None) 데이터프레임
     """
-    매장(입점 업체) 데이터를 floors 테이블에 적재한다.
-    각 매장을 건물의 층별 입점 정보로 매핑한다.
+    columns = ["source_key", "id", "content_hash"]
+    names = candidates["name"].fillna("")
+    addresses = candidates["address"].fillna("")
+    unique = ~pd.concat([names, addresses], axis=1).duplicated(keep=False)
+    if not unique.any():
+        return pd.DataFrame(columns=columns, dtype=object)
+
+    # 같은 건물명+주소의 예전 행이 여러 개면 가장 먼저 적재된 행 하나만 넘겨받는다
+    cur.execute("""
+        WITH s AS (
+            SELECT * FROM unnest(%s::text[], %s::text[], %s::text[]) AS s(source_key, name, address)
+        ), legacy AS (
+            SELECT DISTINCT ON (b.name, b.address) b.id, s.source_key
+            FROM buildings b
+            JOIN s ON b.name = s.name AND b.address = s.address
+            WHERE b.source_key IS NULL
+            ORDER BY b.name, b.address, b.id
+        )
+        UPDATE buildings b
+        SET source_key = legacy.source_key, content_hash = NULL
+        FROM legacy
+        WHERE b.id = legacy.id
+        RETURNING b.source_key, b.id;
+    """, (
+        candidates.loc[unique, "source_key"].tolist(),
+        names[unique].tolist(),
+        addresses[unique].tolist(),
+    ))
+    adopted = pd.DataFrame(cur.fetchall(), columns=["source_key", "id"], dtype=object)
+    adopted["content_hash"] = None
+    if not adopted.empty:
+        logger.info(f"buildings 테이블: 자연 키 없는 예전 건물 {len(adopted)}건에 자연 키 부여")
+    return adopted[columns]
+
+
+def load_floors(
+    conn, tenants_df: pd.DataFrame, building_ids: pd.Series, stager: Optional[Callable] = None
+) -> dict:
+    """
+    매장(입점 업체) 데이터를 floors 테이블에 증분 적재한다.
+    매장마다 자연 키(floors.source_key)와 내용 해시를 계산해 새 매장과 바뀐 매장만 upsert한다.
+    폐업 매장 삭제는 prune_floors에서 한다.
 
     Args:
-        conn: psycopg2 연결 객체
-        tenants_df: 매장 데이터프레임
-        building_id_map: 건물명→ID 매핑 딕셔너리
+        conn: psycopg2 연결 객체 (커밋은 호출하는 쪽에서 한다)
+        tenants_df: 매장 데이터프레임 (building_key 컬럼)
+        building_ids: 건물 자연 키 → building_id (load_buildings의 key_ids)
+        stager: 스테이징 함수 (기본 copy_to_staging, 병렬 적재 시 ParallelStager)
 
     Returns:
-        삽입 건수
+        {"inserted": int, "updated": int, "keys": list[str]} - keys는 이번 적재에 포함된 매장 자연 키 전체
     """
+    empty = {"inserted": 0, "updated": 0, "keys": []}
     if tenants_df.empty:
         logger.warning("적재할 매장 데이터가 없습니다.")
-        return 0
+        return empty
+
+    # 건물 자연 키로 building_id를 해시 조인
+    if "building_key" in tenants_df.columns:
+        matched_ids = tenants_df["building_key"].map(building_ids[~building_ids.index.duplicated()])
+    else:
+        matched_ids = pd.Series(float("nan"), index=tenants_df.index)
+
+    # 건물에 매칭된 매장만 처리
+    matched = matched_ids.notna()
+    if not matched.any():
+        logger.info("floors 테이블 적재: 0건")
+        return empty
+
+    # MVP에서는 층 정보를 정확히 알 수 없으므로 1F로 기본 설정
+    tenants = tenants_df[matched]
+    stage = pd.DataFrame({
+        "row_no": range(len(tenants)),
+        "source_key": tenant_keys(tenants).to_numpy(),
+        "building_id": matched_ids[matched].astype("int64").to_numpy(),
+        "tenant_name": _text_column(tenants, "title", default="알 수 없음").to_numpy(),
+        "tenant_category": _text_column(tenants, "category", default="기타").to_numpy(),
+        "tenant_icon": _text_column(tenants, "category_icon", default="store").to_numpy(),
+    })
+    stage["content_hash"] = _content_hashes(stage, ["building_id", "tenant_name", "tenant_category", "tenant_icon"])
 
     cur = conn.cursor()
-    inserted = 0
-
-    insert_sql = """
-        INSERT INTO floors (building_id, floor_number, floor_order,
-                            tenant_name, tenant_category, tenant_icon, is_vacant)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT DO NOTHING;
+    cur.execute(
+        "SELECT source_key, content_hash FROM floors WHERE source_key = ANY(%s)",
+        (stage["source_key"].tolist(),),
+    )
+    stored = dict(cur.fetchall())
+    stored_hash = stage["source_key"].map(stored)
+    is_new = ~stage["source_key"].isin(stored.keys())
+    changed = ~is_new & (stored_hash.astype(object) != stage["content_hash"])
+    delta = stage[is_new | changed]
+
+    if not delta.empty:
+        table = (stager or copy_to_staging)(cur, "_stage_floors", {
+            "row_no": "integer",
+            "source_key": "text",
+            "building_id": "integer",
+            "tenant_name": "text",
+            "tenant_category": "text",
+            "tenant_icon": "text",
+            "content_hash": "bigint",
+        }, delta)
+        cur.execute(f"""
+            INSERT INTO floors (building_id, floor_number, floor_order,
+                                tenant_name, tenant_category, tenant_icon, is_vacant,
+                                source_key, content_hash)
+            SELECT building_id, '1F', 1, tenant_name, tenant_category, tenant_icon, FALSE,
+                   source_key, content_hash
+            FROM {table}
+            ORDER BY row_no
+            ON CONFLICT (source_key) DO UPDATE SET
+                building_id = EXCLUDED.building_id,
+                tenant_name = EXCLUDED.tenant_name,
+                tenant_category = EXCLUDED.tenant_category,
+                tenant_icon = EXCLUDED.tenant_icon,
+                content_hash = EXCLUDED.content_hash;
+        """)
+
+    inserted, updated = int(is_new.sum()), int(changed.sum())
+    logger.info(f"floors 테이블 적재: 신규 {inserted}건, 변경 {updated}건, 변경 없음 {len(stage) - len(delta)}건")
+    return {"inserted": inserted, "updated": updated, "keys": stage["source_key"].tolist()}
+
+
+def prune_floors(conn, building_ids: list[int], keep_keys: list[str]) -> int:
     """
+    이번 적재에 포함된 건물의 매장 중 keep_keys에 없는 매장(폐업/이전)을 삭제한다.
+    자연 키가 없는 예전 적재분도 함께 정리된다.
 
-    # building_idx로 매칭된 매장만 처리
-    for _, row in tenants_df.iterrows():
-        building_idx = row.get("building_idx")
-        if building_idx is None or pd.isna(building_idx):
-            continue
-
-        # building_idx에서 실제 building_id 추출
-        # building_id_map을 역으로 활용 (인덱스 기반)
-        building_id = _resolve_building_id(building_idx, building_id_map)
-        if not building_id:
-            continue
-
-        title = row.get("title", "알 수 없음")
-        category = row.get("category", "기타")
-        icon = row.get("category_icon", "store")
-
-        # MVP에서는 층 정보를 정확히 알 수 없으므로 1F로 기본 설정
-        floor_number = "1F"
-        floor_order = 1
-
-        try:
-            cur.execute(insert_sql, (
-                building_id, floor_number, floor_order,
-                title, category, icon, False,
-            ))
-            inserted += 1
-        except Exception as e:
-            logger.error(f"매장 INSERT 실패 [{title}]: {e}")
-            conn.rollback()
-            continue
-
-    conn.commit()
-    logger.info(f"floors 테이블 적재: {inserted}건")
-    return inserted
+    Args:
+        conn: psycopg2 연결 객체
+        building_ids: 이번 적재에 포함된 building_id 전체
+        keep_keys: 이번 적재에 포함된 매장 자연 키 전체
 
+    Returns:
+        삭제 건수
+    """
+    if not building_ids:
+        return 0
+    if not keep_keys:
+        # 매장 수집이 통째로 실패한 경우 전체 삭제를 막는다
+        logger.warning("적재된 매장이 없어 floors 정리를 건너뜁니다.")
+        return 0
 
-def load_facilities(conn, buildings_df: pd.DataFrame, building_id_map: dict) -> int:
+    cur = conn.cursor()
+    cur.execute("""
+        DELETE FROM floors f
+        USING unnest(%s::integer[]) AS b(id)
+        WHERE f.building_id = b.id
+          AND NOT EXISTS (SELECT 1 FROM unnest(%s::text[]) AS k(source_key) WHERE k.source_key = f.source_key);
+    """, (list(building_ids), list(keep_keys)))
+    deleted = cur.rowcount
+    if deleted:
+        logger.info(f"floors 테이블 정리: {deleted}건 삭제")
+    return deleted
+
+
+def load_facilities(conn, building_ids: list[int]) -> int:
     """
     건물 편의시설 데이터를 facilities 테이블에 적재한다.
     MVP에서는 건물 특성 기반으로 기본 편의시설을 자동 생성한다.
 
     Args:
         conn: psycopg2 연결 객체
-        buildings_df: 건물 데이터프레임
-        building_id_map: 건물명→ID 매핑
+        building_ids: 새로 삽입된 building_id 목록
 
     Returns:
         삽입 건수
     """
-    cur = conn.cursor()
-    inserted = 0
-
-    # 건물 용도에 따른 기본 편의시설 매핑
-    default_facilities = [
-        {"facility_type": "주차장", "location_info": "B1-B2", "status_text": "유료"},
-        {"facility_type": "와이파이", "location_info": "전층", "status_text": "무료"},
-        {"facility_type": "냉난방", "location_info": "전층", "status_text": "중앙 공급"},
-    ]
+    if not building_ids:
+        return 0
 
-    insert_sql = """
+    templates, params = _template_values(DEFAULT_FACILITIES, ["facility_type", "location_info", "status_text"])
+    cur = conn.cursor()
+    cur.execute(f"""
         INSERT INTO facilities (building_id, facility_type, location_info, is_available, status_text)
-        VALUES (%s, %s, %s, %s, %s)
+        SELECT ids.id, t.facility_type, t.location_info, TRUE, t.status_text
+        FROM unnest(%s::integer[]) WITH ORDINALITY AS ids(id, ord)
+        CROSS JOIN {templates} AS t(facility_type, location_info, status_text, template_order)
+        ORDER BY ids.ord, t.template_order
         ON CONFLICT DO NOTHING;
-    """
-
-    for building_name, building_id in building_id_map.items():
-        for facility in default_facilities:
-            try:
-                cur.execute(insert_sql, (
-                    building_id,
-                    facility["facility_type"],
-                    facility["location_info"],
-                    True,
-                    facility["status_text"],
-                ))
-                inserted += 1
-            except Exception as e:
-                logger.error(f"편의시설 INSERT 실패 [{building_name}]: {e}")
-                continue
-
-    conn.commit()
+    """, [list(building_ids)] + params)
+    inserted = cur.rowcount
     logger.info(f"facilities 테이블 적재: {inserted}건")
     return inserted
 
 
-def load_building_stats(conn, buildings_df: pd.DataFrame, building_id_map: dict) -> int:
+def load_building_stats(conn, building_ids: list[int], replace: bool = False) -> int:
     """
     건물 통계 데이터를 building_stats 테이블에 적재한다.
+    층수에 따른 통계 값은 적재된 buildings 행에서 SQL로 계산한다.
 
     Args:
         conn: psycopg2 연결 객체
-        buildings_df: 건물 데이터프레임
-        building_id_map: 건물명→ID 매핑
+        building_ids: 새로 삽입된 building_id 목록
+        replace: True면 해당 건물의 기존 통계를 지우고 다시 만든다 (내용이 바뀐 건물)
 
     Returns:
         삽입 건수
     """
-    cur = conn.cursor()
-    inserted = 0
+    if not building_ids:
+        return 0
 
-    insert_sql = """
+    templates, params = _template_values(STAT_TEMPLATES, ["stat_type", "stat_value", "stat_icon", "display_order"])
+    cur = conn.cursor()
+    if replace:
+        cur.execute("DELETE FROM building_stats WHERE building_id = ANY(%s)", (list(building_ids),))
+    cur.execute(f"""
         INSERT INTO building_stats (building_id, stat_type, stat_value, stat_icon, display_order)
-        VALUES (%s, %s, %s, %s, %s)
+        SELECT b.id, t.stat_type,
+               CASE t.stat_type
+                   WHEN 'total_floors' THEN COALESCE(b.total_floors, 0) || '층'
+                   WHEN 'basement' THEN '지하 ' || COALESCE(b.basement_floors, 0) || '층'
+                   WHEN 'tenants' THEN GREATEST(COALESCE(b.total_floors, 0), 1) * 2 || '개'
+                   ELSE t.stat_value
+               END,
+               t.stat_icon, t.display_order
+        FROM unnest(%s::integer[]) WITH ORDINALITY AS ids(id, ord)
+        JOIN buildings b ON b.id = ids.id
+        CROSS JOIN {templates} AS t(stat_type, stat_value, stat_icon, display_order, template_order)
+        ORDER BY ids.ord, t.template_order
         ON CONFLICT DO NOTHING;
-    """
-
-    for _, row in buildings_df.iterrows():
-        building_name = row.get("building_name", "")
-        building_id = building_id_map.get(building_name)
-
-        if not building_id:
-            continue
-
-        ground_floors = row.get("ground_floors", 0)
-        basement_floors = row.get("basement_floors", 0)
-
-        stats = [
-            ("total_floors", f"{ground_floors}층", "layers", 1),
-            ("basement", f"지하 {basement_floors}층", "arrow_downward", 2),
-            ("occupancy", "85%", "pie_chart", 3),          # MVP 더미 값
-            ("tenants", f"{max(ground_floors, 1) * 2}개", "store", 4),  # 추정치
-            ("congestion", "보통", "people", 5),            # MVP 더미 값
-        ]
-
-        for stat_type, stat_value, stat_icon, display_order in stats:
-            try:
-                cur.execute(insert_sql, (
-                    building_id, stat_type, stat_value, stat_icon, display_order,
-                ))
-                inserted += 1
-            except Exception as e:
-                logger.error(f"통계 INSERT 실패 [{building_name}/{stat_type}]: {e}")
-                continue
-
-    conn.commit()
+    """, [list(building_ids)] + params)
+    inserted = cur.rowcount
     logger.info(f"building_stats 테이블 적재: {inserted}건")
     return inserted
 
 
-def load_live_feeds(conn, building_id_map: dict) -> int:
+def load_live_feeds(conn, building_ids: list[int]) -> int:
     """
     LIVE 피드 더미 데이터를 live_feeds 테이블에 적재한다.
     MVP에서는 건물별로 기본 피드를 자동 생성한다.
 
     Args:
         conn: psycopg2 연결 객체
-        building_id_map: 건물명→ID 매핑
+        building_ids: 새로 삽입된 building_id 목록
 
     Returns:
         삽입 건수
     """
-    cur = conn.cursor()
-    inserted = 0
+    if not building_ids:
+        return 0
 
-    # 기본 LIVE 피드 템플릿
-    feed_templates = [
-        {
-            "feed_type": "congestion",
-            "title": "현재 혼잡도: 보통",
-            "description": "평상시 대비 적정 수준입니다.",
-            "icon": "people",
-            "icon_color": "green",
-            "time_label": "현재",
-        },
-        {
-            "feed_type": "event",
-            "title": "1층 로비 리모델링 공사 중",
-            "description": "2층 출입구를 이용해 주세요.",
-            "icon": "construction",
-            "icon_color": "orange",
-            "time_label": "오늘",
-        },
-        {
-            "feed_type": "promotion",
-            "title": "B1 카페 오픈 기념 할인",
-            "description": "아메리카노 50% 할인 (~이번주)",
-            "icon": "local_offer",
-            "icon_color": "red",
-            "time_label": "진행중",
-        },
-    ]
-
-    insert_sql = """
+    columns = ["feed_type", "title", "description", "icon", "icon_color", "time_label"]
+    templates, params = _template_values(FEED_TEMPLATES, columns)
+    cur = conn.cursor()
+    cur.execute(f"""
         INSERT INTO live_feeds (building_id, feed_type, title, description,
                                 icon, icon_color, time_label, is_active)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        SELECT ids.id, t.feed_type, t.title, t.description, t.icon, t.icon_color, t.time_label, TRUE
+        FROM unnest(%s::integer[]) WITH ORDINALITY AS ids(id, ord)
+        CROSS JOIN {templates} AS t({", ".join(columns)}, template_order)
+        ORDER BY ids.ord, t.template_order
         ON CONFLICT DO NOTHING;
+    """, [list(building_ids)] + params)
+    inserted = cur.rowcount
+    logger.info(f"live_feeds 테이블 적재: {inserted}건")
+    return inserted
+
+
+def _template_values(templates: list[dict], columns: list[str]) -> tuple[str, list]:
     """
+    템플릿 목록을 VALUES 절과 파라미터로 만든다. 마지막 컬럼은 템플릿 순서(0부터).
 
-    for building_name, building_id in building_id_map.items():
-        for feed in feed_templates:
-            try:
-                cur.execute(insert_sql, (
-                    building_id,
-                    feed["feed_type"],
-                    feed["title"],
-                    feed["description"],
-                    feed["icon"],
-                    feed["icon_color"],
-                    feed["time_label"],
-                    True,
-                ))
-                inserted += 1
-            except Exception as e:
-                logger.error(f"LIVE 피드 INSERT 실패 [{building_name}]: {e}")
-                continue
+    Returns:
+        ("(VALUES (%s, ..., %s), ...)", 파라미터 리스트)
+    """
+    row_sql = "(" + ", ".join(["%s"] * (len(columns) + 1)) + ")"
+    params = [value for order, t in enumerate(templates) for value in [t.get(c) for c in columns] + [order]]
+    return "(VALUES " + ", ".join([row_sql] * len(templates)) + ")", params
 
-    conn.commit()
-    logger.info(f"live_feeds 테이블 적재: {inserted}건")
-    return inserted
 
+def copy_to_staging(cur, table: str, columns: dict[str, str], df: pd.DataFrame) -> str:
+    """
+    데이터프레임을 트랜잭션 종료 시 사라지는 임시 테이블에 COPY FROM STDIN으로 적재한다.
 
-def _resolve_building_id(building_idx, building_id_map: dict) -> Optional[int]:
+    Args:
+        cur: psycopg2 커서
+        table: 임시 테이블 이름
+        columns: 컬럼명 → SQL 타입 (df에서 이 컬럼들을 이 순서로 보낸다)
+        df: 적재할 데이터프레임
+
+    Returns:
+        INSERT … SELECT에서 읽을 스테이징 테이블 이름
     """
-    데이터프레임 인덱스에서 DB의 building_id를 해석한다.
-    building_id_map의 값 리스트에서 인덱스로 접근한다.
+    column_defs = ", ".join(f"{name} {sql_type}" for name, sql_type in columns.items())
+    cur.execute(f"DROP TABLE IF EXISTS {table}")
+    cur.execute(f"CREATE TEMP TABLE {table} ({column_defs}) ON COMMIT DROP")
+    _copy_frame(cur, table, columns, df)
+    return table
+
+
+def _copy_frame(cur, table: str, columns: dict[str, str], df: pd.DataFrame) -> None:
+    """df의 columns 컬럼을 CSV로 만들어 table에 COPY FROM STDIN으로 보낸다."""
+    buffer = io.StringIO()
+    df[list(columns)].to_csv(buffer, index=False, header=False, na_rep=_COPY_NULL)
+    buffer.seek(0)
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+        buffer,
+    )
+
+
+class ParallelStager:
     """
-    try:
-        ids = list(building_id_map.values())
-        idx = int(building_idx)
-        if 0 <= idx < len(ids):
-            return ids[idx]
-    except (ValueError, IndexError, TypeError):
-        pass
-    return None
+    스테이징 데이터를 연결 풀의 여러 연결로 나눠 동시에 COPY한다.
+
+    임시 테이블은 만든 연결에서만 보이므로 스테이징 스키마(DB_STAGE_SCHEMA)에 실행별 UNLOGGED
+    테이블을 만들고, 프레임을 연결 수만큼 나눠 각 연결이 자기 몫을 COPY한 뒤 커밋한다.
+    스테이징 테이블은 앱이 읽지 않으므로 여기서 커밋해도 대상 테이블에는 아무 영향이 없고,
+    대상 테이블 반영(INSERT … SELECT)은 메인 연결의 트랜잭션에서 한다.
+    copy_to_staging과 같은 형태로 호출할 수 있다.
+
+    테이블 이름에 실행 시작 시각(run_id = "<epoch 초>_<난수>")을 넣어, cleanup 전에 죽은 실행이
+    남긴 테이블을 sweep_stale이 나이로 골라 지운다 (동시에 도는 다른 실행의 테이블은 건드리지 않는다).
+    """
+
+    def __init__(self, connection_pool: pool.ThreadedConnectionPool, workers: int):
+        self.pool = connection_pool
+        self.workers = workers
+        self.run_id = f"{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        self.tables: list[str] = []
+
+    def __call__(self, cur, table: str, columns: dict[str, str], df: pd.DataFrame) -> str:
+        """
+        df를 스테이징 스키마의 실행별 테이블에 병렬로 COPY한다. cur는 쓰지 않는다 (copy_to_staging 호환용).
+
+        Returns:
+            INSERT … SELECT에서 읽을 스테이징 테이블 이름 (스키마 포함)
+        """
+        name = f"{DB_STAGE_SCHEMA}.{table.lstrip('_')}_{self.run_id}"
+        column_defs = ", ".join(f"{column} {sql_type}" for column, sql_type in columns.items())
+        self._execute(
+            f"CREATE SCHEMA IF NOT EXISTS {DB_STAGE_SCHEMA}",
+            f"DROP TABLE IF EXISTS {name}",
+            f"CREATE UNLOGGED TABLE {name} ({column_defs})",
+        )
+        self.tables.append(name)
+
+        parts = np.array_split(np.arange(len(df)), max(1, min(self.workers, len(df))))
+        chunks = [df.iloc[idx] for idx in parts if len(idx)]
+        if chunks:
+            with ThreadPoolExecutor(max_workers=len(chunks), thread_name_prefix="db-stage") as executor:
+                list(executor.map(lambda chunk: self._copy_chunk(name, columns, chunk), chunks))
+
+        logger.info(f"스테이징 COPY [{name}]: {len(df)}건, 연결 {len(chunks)}개")
+        return name
+
+    def sweep_stale(self, max_age_s: float = DB_STAGE_STALE_S) -> int:
+        """
+        스테이징 스키마에서 max_age_s보다 오래된 실행의 테이블을 지운다.
+
+        Returns:
+            지운 테이블 수
+        """
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT tablename FROM pg_tables WHERE schemaname = %s", (DB_STAGE_SCHEMA,))
+                names = [row[0] for row in cur.fetchall()]
+        finally:
+            self.pool.putconn(conn)
+
+        stale = _stale_stage_tables(names, time.time() - max_age_s)
+        if stale:
+            self._execute(*(f"DROP TABLE IF EXISTS {DB_STAGE_SCHEMA}.{name}" for name in stale))
+            logger.info(f"오래된 스테이징 테이블 {len(stale)}개 삭제 [{DB_STAGE_SCHEMA}]")
+        return len(stale)
+
+    def cleanup(self) -> None:
+        """이번 실행에서 만든 스테이징 테이블을 지운다."""
+        if self.tables:
+            self._execute(*(f"DROP TABLE IF EXISTS {name}" for name in self.tables))
+            self.tables.clear()
+
+    def _copy_chunk(self, name: str, columns: dict[str, str], chunk: pd.DataFrame) -> None:
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                _copy_frame(cur, name, columns, chunk)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+
+    def _execute(self, *statements: str) -> None:
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                for sql in statements:
+                    cur.execute(sql)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+
 
+def _stale_stage_tables(names: list[str], cutoff: float) -> list[str]:
+    """ParallelStager 테이블 이름(<table>_<epoch 초>_<난수>) 중 cutoff 이전에 만든 것만 고른다."""
+    stale = []
+    for name in names:
+        match = _STAGE_TABLE_RE.match(name)
+        if match and int(match.group(1)) < cutoff:
+            stale.append(name)
+    return stale
 
-def load_all(merged_data: dict) -> dict:
+
+def _text_column(df: pd.DataFrame, column: str, default: Optional[str] = None) -> pd.Series:
+    """문자열 컬럼 (없거나 결측이면 default)."""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    values = df[column].astype(object)
+    return values.where(values.notna(), default)
+
+
+def _numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """실수 컬럼 (없거나 숫자가 아니면 NaN)."""
+    if column not in df.columns:
+        return pd.Series(float("nan"), index=df.index)
+    return pd.to_numeric(df[column], errors="coerce").astype("float64")
+
+
+def _int_column(df: pd.DataFrame, column: str, default: Optional[int] = None) -> pd.Series:
+    """정수 컬럼 (nullable Int64, 없거나 숫자가 아니면 default)."""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype="Int64")
+    values = pd.to_numeric(df[column], errors="coerce").round().astype("Int64")
+    return values.fillna(default) if default is not None else values
+
+
+def _content_hashes(stage: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """적재할 행의 내용 해시 (64비트 정수). 컬럼 값을 COPY와 같은 문자열 표현으로 이어 붙여 해시한다."""
+    parts = [stage[c].astype(object).where(stage[c].notna(), _COPY_NULL).astype(str) for c in columns]
+    joined = parts[0].str.cat(parts[1:], sep="\x1f")
+    hashes = pd.util.hash_pandas_object(joined, index=False, categorize=False).to_numpy()
+    return pd.Series(hashes.view(np.int64), index=stage.index).astype(object)
+
+
+def load_all(merged_data: dict, workers: int = DB_LOAD_WORKERS) -> dict:
     """
     전체 데이터를 DB에 적재하는 메인 함수.
+    의존 순서(건물 → 매장 → 매장 정리 → 편의시설/통계/피드)대로 메인 연결의 트랜잭션 하나에서
+    반영하고 마지막에 한 번 커밋한다. 어느 단계에서든 실패하면 전체가 롤백된다.
 
     Args:
         merged_data: merger.merge()의 반환값
@@ -352,6 +690,7 @@ def load_all(merged_data: dict) -> dict:
                 "buildings": pd.DataFrame,
                 "tenants": pd.DataFrame,
             }
+        workers: 스테이징 COPY에 쓸 연결 수 (2 이상이면 연결 풀로 나눠 동시에 보낸다)
 
     Returns:
         적재 결과 요약 딕셔너리
@@ -368,26 +707,43 @@ def load_all(merged_data: dict) -> dict:
         logger.error(f"DB 연결 실패: {e}")
         return {"error": str(e)}
 
+    connection_pool = None
+    stager = None
     try:
-        # 1. 건물 적재
-        building_result = load_buildings(conn, buildings_df)
-        building_id_map = building_result["id_map"]
-
-        # 2. 층별 매장 적재
-        floors_inserted = load_floors(conn, tenants_df, building_id_map)
+        if workers > 1:
+            connection_pool = pool.ThreadedConnectionPool(1, workers, **get_db_params())
+            stager = ParallelStager(connection_pool, workers)
+            stager.sweep_stale()
+            logger.info(f"병렬 스테이징: 연결 {workers}개")
+
+        # 1. 건물 적재 (새 건물 / 바뀐 건물만)
+        building_result = load_buildings(conn, buildings_df, stager=stager)
+        new_ids = building_result["new_ids"]
+
+        # 2. 층별 매장 적재 (건물 자연 키로 building_id 조인) 후 사라진 매장 삭제
+        if "building_key" not in tenants_df.columns:
+            tenants_df = attach_building_keys(tenants_df, buildings_df)
+        floor_result = load_floors(conn, tenants_df, building_result["key_ids"], stager=stager)
+        floors_deleted = prune_floors(conn, building_result["key_ids"].tolist(), floor_result["keys"])
 
         # 3. 편의시설 적재
-        facilities_inserted = load_facilities(conn, buildings_df, building_id_map)
+        facilities_inserted = load_facilities(conn, new_ids)
 
-        # 4. 건물 통계 적재
-        stats_inserted = load_building_stats(conn, buildings_df, building_id_map)
+        # 4. 건물 통계 적재 (바뀐 건물은 다시 계산)
+        stats_inserted = load_building_stats(conn, new_ids)
+        stats_inserted += load_building_stats(conn, building_result["changed_ids"], replace=True)
 
         # 5. LIVE 피드 적재
-        feeds_inserted = load_live_feeds(conn, building_id_map)
+        feeds_inserted = load_live_feeds(conn, new_ids)
+
+        conn.commit()
 
         result = {
             "buildings": building_result["inserted"],
-            "floors": floors_inserted,
+            "buildings_updated": building_result["updated"],
+            "floors": floor_result["inserted"],
+            "floors_updated": floor_result["updated"],
+            "floors_deleted": floors_deleted,
             "facilities": facilities_inserted,
             "building_stats": stats_inserted,
             "live_feeds": feeds_inserted,
@@ -397,9 +753,16 @@ def load_all(merged_data: dict) -> dict:
         return result
 
     except Exception as e:
-        logger.error(f"DB 적재 중 오류 발생: {e}")
+        logger.error(f"DB 적재 중 오류 발생 (전체 롤백): {e}")
         conn.rollback()
         return {"error": str(e)}
     finally:
+        if stager is not None:
+            try:
+                stager.cleanup()
+            except Exception as e:
+                logger.warning(f"스테이징 테이블 정리 실패: {e}")
+        if connection_pool is not None:
+            connection_pool.closeall()
         conn.close()
         logger.info("DB 연결 종료")
@@ -5,8 +5,13 @@ ScanPang Data Pipeline - 메인 엔트리포인트
 사용법:
     python main.py              # 전체 파이프라인 실행
     python main.py --collect    # 수집만 실행
-    python main.py --process    # 정제만 실행 (수집 데이터 필요)
-    python main.py --load       # 적재만 실행 (정제 데이터 필요)
+    python main.py --process    # 정제만 실행 (수집 체크포인트 필요)
+    python main.py --load       # 적재만 실행 (정제 체크포인트 필요)
+    python main.py --resume     # 마지막으로 완료된 단계의 체크포인트부터 이어서 실행
+    python main.py --replay     # HTTP 캐시만으로 실행 (네트워크 호출 없음)
+    python main.py --regions    # regions.json의 지역별로 샤드 병렬 실행 후 통합 적재
+    python main.py --regions seoul.json --shards 8
+    python main.py --stream     # 수집→정제→적재를 마이크로 배치로 겹쳐 실행 (--regions와 함께 사용 가능)
 """
 
 import argparse
@@ -14,6 +19,7 @@ import logging
 import sys
 import time
 from datetime import datetime
+from typing import Optional
 
 # 로깅 설정
 logging.basicConfig(
@@ -31,35 +37,54 @@ logging.basicConfig(
 
 logger = logging.getLogger("scanpang.pipeline")
 
+from utils.frames import enable_copy_on_write  # noqa: E402
 
-def run_collect():
+# 단계 사이의 방어적 복사를 얕은 복사로 대신하므로 copy-on-write가 켜져 있어야 한다
+enable_copy_on_write()
+
+
+def run_collect(concurrent: bool = True, region: Optional[dict] = None):
     """
     데이터 수집 단계
     - 건축물대장 (공공데이터포털)
     - 네이버 매장 검색
     - Google Places 매장 검색
+
+    Args:
+        concurrent: True면 비동기 수집 엔진으로 세 수집기를 동시에 실행한다
+        region: 수집 대상 지역 (utils.regions 형식, 기본값: config의 단일 지역)
     """
+    from utils.regions import default_region
     from collectors.building_ledger import collect as collect_buildings
     from collectors.naver_places import collect as collect_naver
     from collectors.google_places import collect as collect_google
+    from utils.frames import compact
 
     logger.info("=" * 60)
     logger.info("STEP 1: 데이터 수집 시작")
     logger.info("=" * 60)
 
-    # 1-1. 건축물대장 수집
-    buildings_df = collect_buildings()
-    logger.info(f"건축물대장: {len(buildings_df)}건 수집")
+    region = region or default_region()
 
-    # 1-2. 네이버 매장 수집 (건물 데이터를 전달하여 건물 주변 검색)
-    naver_df = collect_naver(buildings_df)
-    logger.info(f"네이버 매장: {len(naver_df)}건 수집")
+    if concurrent:
+        from collectors.engine import collect as collect_all
 
-    # 1-3. Google Places 매장 수집
-    google_df = collect_google()
+        buildings_df, naver_df, google_df = collect_all(region)
+    else:
+        # 1-1. 건축물대장 수집
+        buildings_df = collect_buildings(region["sigungu_cd"], region["bjdong_cd"])
+
+        # 1-2. 네이버 매장 수집 (건물 데이터를 전달하여 건물 주변 검색)
+        naver_df = collect_naver(buildings_df, region["base_queries"])
+
+        # 1-3. Google Places 매장 수집
+        google_df = collect_google(region["center_lat"], region["center_lng"], region["radius_m"])
+
+    logger.info(f"건축물대장: {len(buildings_df)}건 수집")
+    logger.info(f"네이버 매장: {len(naver_df)}건 수집")
     logger.info(f"Google Places: {len(google_df)}건 수집")
 
-    return buildings_df, naver_df, google_df
+    return compact(buildings_df, "buildings"), compact(naver_df, "naver"), compact(google_df, "google")
 
 
 def run_process(buildings_df, naver_df, google_df):
@@ -67,9 +92,11 @@ def run_process(buildings_df, naver_df, google_df):
     데이터 정제 단계
     - 데이터 통합/정규화
     - Geocoding (주소 → 좌표 변환)
+    - 좌표 기반 매장-건물 매칭
     """
-    from processors.merger import merge
+    from processors.merger import merge, rematch_tenants_spatially
     from processors.geocoder import geocode
+    from utils.frames import PROCESS_FRAMES, compact_frames, frame_memory_mb
 
     logger.info("=" * 60)
     logger.info("STEP 2: 데이터 정제 시작")
@@ -88,6 +115,14 @@ def run_process(buildings_df, naver_df, google_df):
     geocoded_buildings = merged["buildings"]["lat"].notna().sum() if "lat" in merged["buildings"].columns else 0
     logger.info(f"Geocoding 완료 건물: {geocoded_buildings}건")
 
+    # 2-3. 좌표 기반 건물 매칭 (MATCH_MODE=spatial)
+    merged["tenants"] = rematch_tenants_spatially(merged["buildings"], merged["tenants"])
+
+    merged = compact_frames(merged, PROCESS_FRAMES)
+    logger.info(
+        f"정제 결과 메모리: 건물 {frame_memory_mb(merged['buildings']):.1f}MB, "
+        f"매장 {frame_memory_mb(merged['tenants']):.1f}MB"
+    )
     return merged
 
 
@@ -114,36 +149,142 @@ def run_load(merged_data):
     return result
 
 
-def run_pipeline(steps: str = "all"):
+def run_sharded(steps: str, regions_path: Optional[str], shards: Optional[int], replay: bool):
+    """
+    지역 매니페스트의 지역별로 수집 → 정제를 프로세스 풀에서 실행하고,
+    지역별 출력을 통합하여 적재한다.
+
+    Args:
+        steps: "all" (샤드 실행 + 통합 적재), "collect" (샤드 실행만), "load" (기존 샤드 출력 통합 적재)
+        regions_path: 지역 매니페스트 경로 (None이면 기본 매니페스트)
+        shards: 최대 프로세스 수 (None이면 config.SHARD_WORKERS)
+        replay: HTTP 캐시 리플레이 모드 여부
+    """
+    from config import SHARD_WORKERS
+    from shards import combine_shards, run_shards
+    from utils.memory import track_memory
+    from utils.regions import load_regions
+
+    regions = load_regions(regions_path)
+
+    if steps == "process":
+        logger.error("샤드 모드에서는 수집과 정제가 함께 실행됩니다. --process 대신 --collect를 사용하세요.")
+        return
+
+    if steps in ("all", "collect"):
+        logger.info("=" * 60)
+        logger.info("STEP 1-2: 지역별 샤드 수집/정제 시작")
+        logger.info("=" * 60)
+        summaries = run_shards(regions, workers=shards or SHARD_WORKERS, replay=replay)
+        logger.info(f"샤드 완료: {len(summaries)}/{len(regions)}개 지역")
+
+    if steps in ("all", "load"):
+        with track_memory("load"):
+            run_load(combine_shards(regions))
+
+
+def run_stream(regions_path: Optional[str]):
+    """
+    스트리밍 모드로 수집부터 적재까지 한 번에 실행한다 (체크포인트를 남기지 않음).
+
+    Args:
+        regions_path: 지역 매니페스트 경로 (None이면 config의 단일 지역, ""이면 기본 매니페스트)
+    """
+    from streaming import run_streaming
+    from utils.memory import track_memory
+    from utils.regions import default_region, load_regions
+
+    regions = load_regions(regions_path or None) if regions_path is not None else [default_region()]
+
+    logger.info("=" * 60)
+    logger.info(f"STREAM: {len(regions)}개 지역 스트리밍 실행")
+    logger.info("=" * 60)
+
+    with track_memory("stream"):
+        result = run_streaming(regions)
+    if "error" in result:
+        logger.error(f"스트리밍 실행 실패: {result['error']}")
+    else:
+        logger.info("DB 적재 결과:")
+        for table, count in result.items():
+            logger.info(f"  - {table}: {count}건")
+    return result
+
+
+def run_pipeline(
+    steps: str = "all",
+    replay: bool = False,
+    regions_path: Optional[str] = None,
+    shards: Optional[int] = None,
+    resume: bool = False,
+    stream: bool = False,
+):
     """
     파이프라인 전체 또는 특정 단계를 실행한다.
+    각 단계의 출력은 체크포인트(utils.checkpoint)로 저장되며,
+    --process / --load 단독 실행은 직전 단계의 체크포인트를 읽어 실행한다.
 
     Args:
         steps: "all", "collect", "process", "load"
+        replay: True면 외부 API 대신 HTTP 응답 캐시만 사용한다
+        regions_path: 지정하면 지역 매니페스트 기반 샤드 모드로 실행한다 ("" 이면 기본 매니페스트)
+        shards: 샤드 모드의 최대 프로세스 수
+        resume: True면 전체 실행 시 완료된 단계는 체크포인트로 대체하고 건너뛴다
+        stream: True면 스트리밍 모드로 실행한다 (steps="all"에서만 사용)
     """
+    from utils.checkpoint import has_stage, load_stage, save_stage
+    from utils.memory import track_memory
+
     start_time = time.time()
 
+    if replay:
+        from utils.http_cache import set_replay_mode
+        set_replay_mode(True)
+
     logger.info("=" * 60)
     logger.info("ScanPang Data Pipeline 시작")
     logger.info(f"실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"실행 단계: {steps}")
+    logger.info(f"실행 단계: {steps}{' (replay)' if replay else ''}")
     logger.info("=" * 60)
 
     try:
-        if steps in ("all", "collect"):
-            buildings_df, naver_df, google_df = run_collect()
-
-        if steps in ("all", "process"):
-            if steps == "process":
-                logger.error("--process 단독 실행은 아직 지원하지 않습니다. 전체 파이프라인을 실행하세요.")
+        if stream:
+            if steps != "all":
+                logger.error("--stream은 전체 파이프라인 실행에서만 사용할 수 있습니다.")
                 return
-            merged_data = run_process(buildings_df, naver_df, google_df)
+            run_stream(regions_path)
+            elapsed = time.time() - start_time
+            logger.info(f"ScanPang Data Pipeline 완료 (소요시간: {elapsed:.1f}초)")
+            return
+
+        if regions_path is not None:
+            run_sharded(steps, regions_path or None, shards, replay)
+            elapsed = time.time() - start_time
+            logger.info(f"ScanPang Data Pipeline 완료 (소요시간: {elapsed:.1f}초)")
+            return
+
+        # --resume: 전체 실행 시 마지막으로 완료된 단계의 체크포인트부터 이어서 실행
+        skip_collect = resume and steps == "all" and (has_stage("collect") or has_stage("process"))
+        skip_process = resume and steps == "all" and has_stage("process")
+
+        if steps in ("all", "collect") and not skip_collect:
+            with track_memory("collect"):
+                buildings_df, naver_df, google_df = run_collect()
+            save_stage("collect", {"buildings": buildings_df, "naver": naver_df, "google": google_df})
+
+        if steps in ("all", "process") and not skip_process:
+            if steps == "process" or skip_collect:
+                collected = load_stage("collect")
+                buildings_df, naver_df, google_df = collected["buildings"], collected["naver"], collected["google"]
+            with track_memory("process"):
+                merged_data = run_process(buildings_df, naver_df, google_df)
+            save_stage("process", merged_data)
 
         if steps in ("all", "load"):
-            if steps == "load":
-                logger.error("--load 단독 실행은 아직 지원하지 않습니다. 전체 파이프라인을 실행하세요.")
-                return
-            result = run_load(merged_data)
+            if steps == "load" or skip_process:
+                merged_data = load_stage("process")
+            with track_memory("load"):
+                result = run_load(merged_data)
 
         elapsed = time.time() - start_time
         logger.info("=" * 60)
@@ -155,6 +296,9 @@ def run_pipeline(steps: str = "all"):
         logger.error(f"파이프라인 실행 중 오류 발생: {e}", exc_info=True)
         logger.info(f"실패까지 소요시간: {elapsed:.1f}초")
         raise
+    finally:
+        from utils.http_session import close_sessions
+        close_sessions()
 
 
 def main():
@@ -162,16 +306,31 @@ def main():
     parser.add_argument("--collect", action="store_true", help="수집 단계만 실행")
     parser.add_argument("--process", action="store_true", help="정제 단계만 실행")
     parser.add_argument("--load", action="store_true", help="적재 단계만 실행")
+    parser.add_argument("--replay", action="store_true", help="HTTP 캐시만으로 실행 (네트워크 호출 없음)")
+    parser.add_argument(
+        "--regions", nargs="?", const="", default=None, metavar="MANIFEST",
+        help="지역 매니페스트 기반 샤드 모드 (경로 생략 시 regions.json)",
+    )
+    parser.add_argument("--shards", type=int, default=None, help="샤드 모드 최대 프로세스 수")
+    parser.add_argument("--resume", action="store_true", help="마지막 체크포인트부터 이어서 실행")
+    parser.add_argument("--stream", action="store_true", help="마이크로 배치 스트리밍 모드로 전체 실행")
     args = parser.parse_args()
 
+    options = {
+        "replay": args.replay,
+        "regions_path": args.regions,
+        "shards": args.shards,
+        "resume": args.resume,
+        "stream": args.stream,
+    }
     if args.collect:
-        run_pipeline("collect")
+        run_pipeline("collect", **options)
     elif args.process:
-        run_pipeline("process")
+        run_pipeline("process", **options)
     elif args.load:
-        run_pipeline("load")
+        run_pipeline("load", **options)
     else:
-        run_pipeline("all")
+        run_pipeline("all", **options)
 
 
 if __name__ == "__main__":
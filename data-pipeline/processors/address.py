@@ -0,0 +1,179 @@
+"""
+ScanPang Data Pipeline - 주소 정규화(구조화) 모듈
+도로명/지번 주소를 구성요소(시도, 시군구, 동, 도로명, 건물 본번-부번)로 파싱해
+출처별 표기 차이가 사라진 정규 키를 만든다.
+
+    건축물대장 newPlatPlc  "서울특별시 강남구 테헤란로 152 (역삼동)"     → "서울 강남구 테헤란로 152"
+    네이버 roadAddress     "서울특별시 강남구 테헤란로 152 강남파이낸스센터" → "서울 강남구 테헤란로 152"
+    구글 vicinity          "대한민국 서울특별시 강남구 테헤란로 152"       → "서울 강남구 테헤란로 152"
+    건축물대장 platPlc     "서울특별시 강남구 역삼동 737번지"            → "서울 강남구 역삼동 737"
+    구글 vicinity          "강남구 역삼1동 737"                          → "강남구 역삼동 737"
+
+키는 주소에 있는 가장 구체적인 수준으로 만든다 (시도 생략 시 "시군구 …", 시군구도 없으면 "도로명 번호").
+건물 쪽은 모든 수준의 키를 등록해 두면 매장 키 하나로 해시 조인할 수 있다 (keys_for_join).
+파싱 결과는 고유 문자열마다 한 번만 계산한다.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+_SIDO_ALIASES = {
+    "서울특별시": "서울", "서울시": "서울", "서울": "서울",
+    "부산광역시": "부산", "부산시": "부산", "부산": "부산",
+    "대구광역시": "대구", "대구시": "대구", "대구": "대구",
+    "인천광역시": "인천", "인천시": "인천", "인천": "인천",
+    "광주광역시": "광주", "광주": "광주",
+    "대전광역시": "대전", "대전시": "대전", "대전": "대전",
+    "울산광역시": "울산", "울산시": "울산", "울산": "울산",
+    "세종특별자치시": "세종", "세종시": "세종", "세종": "세종",
+    "경기도": "경기", "경기": "경기",
+    "강원도": "강원", "강원특별자치도": "강원", "강원": "강원",
+    "충청북도": "충북", "충북": "충북",
+    "충청남도": "충남", "충남": "충남",
+    "전라북도": "전북", "전북특별자치도": "전북", "전북": "전북",
+    "전라남도": "전남", "전남": "전남",
+    "경상북도": "경북", "경북": "경북",
+    "경상남도": "경남", "경남": "경남",
+    "제주특별자치도": "제주", "제주도": "제주", "제주": "제주",
+}
+
+_COUNTRY_TOKENS = {"대한민국", "한국", "South", "Korea"}
+_SIGUNGU_RE = re.compile(r"^[가-힣]+(시|군|구)$")
+_ROAD_RE = re.compile(r"^[가-힣A-Za-z0-9.·]*[가-힣][가-힣A-Za-z0-9.·]*(로|길)$")
+_ROAD_SUFFIX_RE = re.compile(r"^\d+(번)?길$")           # "테헤란로 4길"처럼 띄어 쓴 길
+_DONG_RE = re.compile(r"^[가-힣0-9.·]+(동|가|리|읍|면)$")
+_NUMBER_RE = re.compile(r"^(산)?(\d+)(?:-(\d+))?(번지)?(?:호)?$")
+_ADMIN_DONG_RE = re.compile(r"^(.*\D)\d+동$")          # 행정동 "역삼1동" → 법정동 "역삼동"
+_PAREN_RE = re.compile(r"\(([^)]*)\)")
+
+
+class AddressParts(NamedTuple):
+    """파싱된 주소 구성요소. kind는 "road"(도로명) 또는 "jibun"(지번)."""
+    kind: str
+    sido: str
+    sigungu: str
+    dong: str
+    road: str
+    main_no: str
+    sub_no: str
+    mountain: bool
+
+    @property
+    def core(self) -> str:
+        """시도/시군구를 뺀 핵심 키 ("테헤란로 152", "역삼동 737-1")."""
+        number = self.main_no + (f"-{self.sub_no}" if self.sub_no and self.sub_no != "0" else "")
+        if self.kind == "road":
+            return f"{self.road} {number}"
+        return f"{self.dong} {'산' if self.mountain else ''}{number}"
+
+    @property
+    def key(self) -> str:
+        """주소에 있는 가장 구체적인 수준의 정규 키."""
+        if self.sigungu and self.sido:
+            return f"{self.sido} {self.sigungu} {self.core}"
+        if self.sigungu:
+            return f"{self.sigungu} {self.core}"
+        return self.core
+
+    def keys_for_join(self) -> list[str]:
+        """조인용으로 등록할 모든 수준의 키 (구체적인 것부터)."""
+        keys = [self.key]
+        if self.sigungu and self.sido:
+            keys.append(f"{self.sigungu} {self.core}")
+        if self.sigungu:
+            keys.append(self.core)
+        return keys
+
+
+@lru_cache(maxsize=None)
+def parse_address(address: str) -> Optional[AddressParts]:
+    """
+    한국 주소 문자열을 구성요소로 파싱한다.
+
+    Args:
+        address: 도로명 또는 지번 주소
+
+    Returns:
+        AddressParts 또는 None (도로명+건물번호, 동+지번 어느 쪽도 찾지 못한 경우)
+    """
+    if not isinstance(address, str) or not address:
+        return None
+
+    # 괄호 안 참고항목 "(역삼동)" / "(역삼동, 건물명)"에서 법정동만 꺼낸다
+    paren_dong = ""
+    for inner in _PAREN_RE.findall(address):
+        first = inner.replace(",", " ").split()
+        if first and _DONG_RE.match(first[0]):
+            paren_dong = first[0]
+    text = _PAREN_RE.sub(" ", address).replace(",", " ")
+    tokens = [t for t in text.split() if t not in _COUNTRY_TOKENS]
+
+    sido = sigungu = dong = road = ""
+    i = 0
+    if i < len(tokens) and tokens[i] in _SIDO_ALIASES:
+        sido = _SIDO_ALIASES[tokens[i]]
+        i += 1
+
+    # "성남시 분당구"처럼 두 단계인 시군구까지 허용
+    sigungu_parts = []
+    while i < len(tokens) and len(sigungu_parts) < 2 and _SIGUNGU_RE.match(tokens[i]) and not _ROAD_RE.match(tokens[i]):
+        sigungu_parts.append(tokens[i])
+        i += 1
+    sigungu = " ".join(sigungu_parts)
+
+    mountain = False
+    while i < len(tokens):
+        token = tokens[i]
+        if _ROAD_RE.match(token):
+            road = token
+            if i + 1 < len(tokens) and _ROAD_SUFFIX_RE.match(tokens[i + 1]):
+                road += tokens[i + 1]
+                i += 1
+            number = _NUMBER_RE.match(tokens[i + 1]) if i + 1 < len(tokens) else None
+            if number is None and i + 2 < len(tokens) and tokens[i + 1] == "지하":
+                number = _NUMBER_RE.match(tokens[i + 2])
+            if number:
+                return AddressParts("road", sido, sigungu, _legal_dong(paren_dong or dong), road,
+                                    number.group(2), number.group(3) or "", False)
+            road = ""
+        elif _DONG_RE.match(token):
+            dong = token
+        elif token == "산":
+            mountain = True
+        elif dong:
+            number = _NUMBER_RE.match(token)
+            if number:
+                return AddressParts("jibun", sido, sigungu, _legal_dong(dong), "",
+                                    number.group(2), number.group(3) or "", mountain or bool(number.group(1)))
+        i += 1
+
+    return None
+
+
+def canonical_key(address) -> str:
+    """주소의 정규 키. 파싱할 수 없으면 빈 문자열."""
+    parts = parse_address(address) if isinstance(address, str) else None
+    return parts.key if parts else ""
+
+
+def canonical_keys(addresses: pd.Series) -> pd.Series:
+    """
+    주소 시리즈의 정규 키 시리즈. 고유 문자열마다 한 번만 파싱한다.
+
+    Args:
+        addresses: 주소 시리즈
+
+    Returns:
+        정규 키 시리즈 (같은 인덱스, 파싱 실패는 빈 문자열)
+    """
+    codes, uniques = pd.factorize(addresses, use_na_sentinel=True)
+    keys = [canonical_key(value) for value in uniques] + [""]
+    return pd.Series(pd.Index(keys, dtype=object).take(codes), index=addresses.index, dtype=object)
+
+
+def _legal_dong(dong: str) -> str:
+    m = _ADMIN_DONG_RE.match(dong)
+    return f"{m.group(1)}동" if m else dong
@@ -0,0 +1,119 @@
+"""
+ScanPang Data Pipeline - 업종 카테고리 분류 모듈
+업종 분류 체계(category_taxonomy.json)를 하나의 정규식으로 컴파일해 원본 카테고리 문자열을 분류한다.
+
+분류 규칙 (키워드 우선순위 = 분류 체계 파일에 적힌 순서):
+    1. 소문자로 바꾼 원본이 키워드와 정확히 같으면 그 카테고리
+    2. 원본에 키워드가 포함되거나 원본이 키워드에 포함되는 키워드 중 우선순위가 가장 높은 것
+    3. 없으면 기본 카테고리 ("기타")
+
+키워드 전체를 우선순위 순서의 선택(alternation)으로 묶은 전방탐색 패턴을 한 번 훑으면
+각 위치에서 시작하는 가장 우선순위 높은 키워드가 나오므로, 그 중 최솟값이 2번의 답이다.
+분류는 고유 값마다 한 번만 하고 (pd.factorize 코드로) 행에 되돌려 넣는다.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from config import CATEGORY_TAXONOMY_PATH
+
+
+class CategoryClassifier:
+    """컴파일된 업종 분류기. 분류 결과는 원본 문자열별로 메모이즈한다."""
+
+    def __init__(self, taxonomy: dict):
+        self.default = taxonomy.get("default", "기타")
+        self.default_icon = taxonomy.get("default_icon", "store")
+        self.icons: dict[str, str] = {}
+        self.keywords: list[str] = []
+        self.categories: list[str] = []
+
+        for entry in taxonomy["categories"]:
+            self.icons[entry["category"]] = entry["icon"]
+            for keyword in entry["keywords"]:
+                if keyword in self.keywords:
+                    continue  # 앞선(우선순위 높은) 항목이 이미 차지한 키워드
+                self.keywords.append(keyword)
+                self.categories.append(entry["category"])
+
+        self._priority = {keyword: i for i, keyword in enumerate(self.keywords)}
+        alternation = "|".join(re.escape(k) for k in self.keywords)
+        self._pattern = re.compile(f"(?=({alternation}))")
+        self._memo: dict[str, str] = {}
+
+    def classify(self, raw_category) -> str:
+        """
+        원본 카테고리 문자열 하나를 분류한다.
+
+        Args:
+            raw_category: 원본 카테고리 (예: "음식점>한식>육류,고기요리", "cafe")
+
+        Returns:
+            정규화된 카테고리
+        """
+        if not isinstance(raw_category, str) or not raw_category:
+            return self.default
+
+        cached = self._memo.get(raw_category)
+        if cached is None:
+            cached = self._classify(raw_category.strip().lower())
+            self._memo[raw_category] = cached
+        return cached
+
+    def _classify(self, raw_lower: str) -> str:
+        exact = self._priority.get(raw_lower)
+        if exact is not None:
+            return self.categories[exact]
+
+        best = len(self.keywords)
+        for m in self._pattern.finditer(raw_lower):
+            best = min(best, self._priority[m.group(1)])
+
+        # 원본이 키워드의 일부인 경우 (짧은 원본 문자열)
+        if raw_lower:
+            for i, keyword in enumerate(self.keywords[:best]):
+                if raw_lower in keyword:
+                    best = i
+                    break
+
+        return self.categories[best] if best < len(self.keywords) else self.default
+
+    def classify_series(self, raw: pd.Series) -> pd.Series:
+        """
+        카테고리 시리즈를 분류한다. 고유 값만 분류하고 코드로 행에 매핑한다.
+
+        Args:
+            raw: 원본 카테고리 시리즈
+
+        Returns:
+            정규화된 카테고리 시리즈 (같은 인덱스)
+        """
+        codes, uniques = pd.factorize(raw, use_na_sentinel=True)
+        labels = [self.classify(value) for value in uniques] + [self.default]
+        # NA 코드(-1)는 마지막 (기본 카테고리)을 가리킨다
+        return pd.Series(pd.Index(labels).take(codes), index=raw.index, dtype=object)
+
+    def icon(self, category: str) -> str:
+        """정규화된 카테고리의 아이콘 이름."""
+        return self.icons.get(category, self.default_icon)
+
+
+def load_taxonomy(path: Path = CATEGORY_TAXONOMY_PATH) -> dict:
+    """업종 분류 체계 파일을 읽는다."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+_classifier: Optional[CategoryClassifier] = None
+
+
+def get_classifier() -> CategoryClassifier:
+    """CATEGORY_TAXONOMY_PATH로 만든 분류기를 한 번만 생성해 반환한다."""
+    global _classifier
+    if _classifier is None:
+        _classifier = CategoryClassifier(load_taxonomy())
+    return _classifier
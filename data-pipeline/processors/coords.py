@@ -0,0 +1,182 @@
+"""
+ScanPang Data Pipeline - 좌표 변환 모듈
+네이버 검색 API 좌표(mapx, mapy)를 WGS84 위경도로 벡터화 변환한다.
+
+네이버 지역 검색 API의 mapx/mapy는 두 가지 형식이 있다.
+    - WGS84 × 10^7 정수 (현행 API, 예: mapx=1270276000, mapy=374979000)
+    - 카텍(KATEC, TM128) 미터 좌표 (구 API, 예: mapx=314000, mapy=544000)
+값의 크기로 형식을 구분해 각각 변환한다.
+
+카텍 → WGS84 변환은 proj 정의
+    +proj=tmerc +lat_0=38 +lon_0=128 +k=0.9999 +x_0=400000 +y_0=600000 +ellps=bessel
+    +towgs84=-115.80,474.99,674.11,1.16,-2.31,-1.63,6.43
+와 같은 절차(횡메르카토르 역변환 → 지심직교좌표 → 7변수 Helmert 변환 → WGS84 경위도)를
+NumPy 배열 연산으로 수행한다.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Bessel 1841 타원체
+_BESSEL_A = 6377397.155
+_BESSEL_F = 1 / 299.1528128
+
+# WGS84 타원체
+_WGS84_A = 6378137.0
+_WGS84_F = 1 / 298.257223563
+
+# KATEC(TM128) 투영 원점
+_LAT0 = np.radians(38.0)
+_LON0 = np.radians(128.0)
+_K0 = 0.9999
+_FALSE_EASTING = 400000.0
+_FALSE_NORTHING = 600000.0
+
+# Bessel(Tokyo datum) → WGS84 7변수 (이동 m, 회전 arc-second, 축척 ppm; position vector 방식)
+_TOWGS84 = (-115.80, 474.99, 674.11, 1.16, -2.31, -1.63, 6.43)
+
+# mapx가 이 값 이상이면 WGS84 × 10^7 형식으로 본다 (카텍 x는 수십만 m 단위)
+_WGS84_SCALED_THRESHOLD = 1e8
+
+
+def _meridian_arc(phi, a: float, e2: float):
+    """적도에서 위도 phi까지의 자오선 호장."""
+    return a * (
+        (1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256) * phi
+        - (3 * e2 / 8 + 3 * e2 ** 2 / 32 + 45 * e2 ** 3 / 1024) * np.sin(2 * phi)
+        + (15 * e2 ** 2 / 256 + 45 * e2 ** 3 / 1024) * np.sin(4 * phi)
+        - (35 * e2 ** 3 / 3072) * np.sin(6 * phi)
+    )
+
+
+def _tm_inverse(x, y):
+    """KATEC 평면좌표 → Bessel 타원체 경위도 (라디안). Snyder(1987) 횡메르카토르 역변환."""
+    a = _BESSEL_A
+    e2 = _BESSEL_F * (2 - _BESSEL_F)
+    ep2 = e2 / (1 - e2)
+
+    m = _meridian_arc(_LAT0, a, e2) + (y - _FALSE_NORTHING) / _K0
+    mu = m / (a * (1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256))
+    e1 = (1 - np.sqrt(1 - e2)) / (1 + np.sqrt(1 - e2))
+    phi1 = (
+        mu
+        + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * np.sin(2 * mu)
+        + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * np.sin(4 * mu)
+        + (151 * e1 ** 3 / 96) * np.sin(6 * mu)
+        + (1097 * e1 ** 4 / 512) * np.sin(8 * mu)
+    )
+
+    sin1 = np.sin(phi1)
+    cos1 = np.cos(phi1)
+    tan1 = np.tan(phi1)
+    c1 = ep2 * cos1 ** 2
+    t1 = tan1 ** 2
+    n1 = a / np.sqrt(1 - e2 * sin1 ** 2)
+    r1 = a * (1 - e2) / (1 - e2 * sin1 ** 2) ** 1.5
+    d = (x - _FALSE_EASTING) / (n1 * _K0)
+
+    phi = phi1 - (n1 * tan1 / r1) * (
+        d ** 2 / 2
+        - (5 + 3 * t1 + 10 * c1 - 4 * c1 ** 2 - 9 * ep2) * d ** 4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1 ** 2 - 252 * ep2 - 3 * c1 ** 2) * d ** 6 / 720
+    )
+    lam = _LON0 + (
+        d
+        - (1 + 2 * t1 + c1) * d ** 3 / 6
+        + (5 - 2 * c1 + 28 * t1 - 3 * c1 ** 2 + 8 * ep2 + 24 * t1 ** 2) * d ** 5 / 120
+    ) / cos1
+    return phi, lam
+
+
+def _geodetic_to_ecef(phi, lam, a: float, f: float):
+    e2 = f * (2 - f)
+    n = a / np.sqrt(1 - e2 * np.sin(phi) ** 2)
+    x = n * np.cos(phi) * np.cos(lam)
+    y = n * np.cos(phi) * np.sin(lam)
+    z = n * (1 - e2) * np.sin(phi)
+    return x, y, z
+
+
+def _helmert(x, y, z):
+    """7변수 Helmert 변환 (position vector 방식, proj +towgs84와 동일)."""
+    tx, ty, tz, rx, ry, rz, s = _TOWGS84
+    arcsec = np.pi / (180 * 3600)
+    rx, ry, rz = rx * arcsec, ry * arcsec, rz * arcsec
+    scale = 1 + s * 1e-6
+    x2 = tx + scale * (x - rz * y + ry * z)
+    y2 = ty + scale * (rz * x + y - rx * z)
+    z2 = tz + scale * (-ry * x + rx * y + z)
+    return x2, y2, z2
+
+
+def _ecef_to_geodetic(x, y, z, a: float, f: float):
+    e2 = f * (2 - f)
+    lam = np.arctan2(y, x)
+    p = np.hypot(x, y)
+    phi = np.arctan2(z, p * (1 - e2))
+    for _ in range(5):
+        n = a / np.sqrt(1 - e2 * np.sin(phi) ** 2)
+        phi = np.arctan2(z + e2 * n * np.sin(phi), p)
+    return phi, lam
+
+
+def katec_to_wgs84_array(x, y) -> tuple[np.ndarray, np.ndarray]:
+    """
+    카텍(KATEC) 좌표 배열을 WGS84 위경도 배열로 변환한다.
+
+    Args:
+        x: 카텍 X좌표 (경도 방향, 미터) 배열
+        y: 카텍 Y좌표 (위도 방향, 미터) 배열
+
+    Returns:
+        (위도 배열, 경도 배열) - 도 단위
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    phi, lam = _tm_inverse(x, y)
+    ex, ey, ez = _geodetic_to_ecef(phi, lam, _BESSEL_A, _BESSEL_F)
+    wx, wy, wz = _helmert(ex, ey, ez)
+    lat, lng = _ecef_to_geodetic(wx, wy, wz, _WGS84_A, _WGS84_F)
+    return np.degrees(lat), np.degrees(lng)
+
+
+def naver_mapxy_to_wgs84(mapx, mapy) -> tuple[np.ndarray, np.ndarray]:
+    """
+    네이버 검색 API mapx/mapy 배열(문자열 허용)을 WGS84 위경도 배열로 변환한다.
+    값이 없거나 숫자가 아니면 NaN을 반환한다.
+
+    Args:
+        mapx: 네이버 mapx 값 배열 (Series/리스트/스칼라)
+        mapy: 네이버 mapy 값 배열
+
+    Returns:
+        (위도 배열, 경도 배열) - 도 단위, 소수점 7자리 반올림
+    """
+    x = pd.to_numeric(pd.Series(np.atleast_1d(mapx)), errors="coerce").to_numpy(dtype=float)
+    y = pd.to_numeric(pd.Series(np.atleast_1d(mapy)), errors="coerce").to_numpy(dtype=float)
+
+    lat = np.full(x.shape, np.nan)
+    lng = np.full(x.shape, np.nan)
+
+    valid = ~(np.isnan(x) | np.isnan(y)) & (x > 0) & (y > 0)
+    scaled = valid & (x >= _WGS84_SCALED_THRESHOLD)
+    katec = valid & ~scaled
+
+    # 현행 형식: WGS84 × 10^7
+    lat[scaled] = y[scaled] / 1e7
+    lng[scaled] = x[scaled] / 1e7
+
+    # 구 형식: 카텍
+    if katec.any():
+        lat[katec], lng[katec] = katec_to_wgs84_array(x[katec], y[katec])
+
+    return np.round(lat, 7), np.round(lng, 7)
+
+
+def to_local_meters(lat, lng, lat0: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    위경도를 기준 위도 lat0(라디안) 주변의 등거리 평면 좌표(미터)로 바꾼다.
+    수 km 범위의 거리 비교/격자 분할용 (정밀 측지 계산 아님).
+    """
+    earth_radius = 6371008.8
+    return earth_radius * np.radians(lng) * np.cos(lat0), earth_radius * np.radians(lat)
@@ -0,0 +1,206 @@
+"""
+ScanPang Data Pipeline - 매장 엔티티 해소(중복 매장 병합) 모듈
+네이버 도로명주소와 구글 vicinity처럼 표기가 달라 정확 일치로는 걸러지지 않는 같은 매장을 합친다.
+
+1. 블로킹: 매장명 문자 2-gram의 MinHash 서명을 밴드로 나눈 LSH 버킷 + 좌표 격자 셀
+   (셀 크기 ENTITY_MAX_DISTANCE_M, 주변 3×3 셀) 이 모두 같은 쌍만 후보로 만든다.
+   좌표 없는 매장은 매장명 버킷만 있는 블록(_NO_CELL)에 들어가 좌표 없는 매장끼리만 만난다.
+   후보 생성은 (밴드, 버킷, 셀) 키의 해시 조인 한 번이라 매장 수에 거의 선형이다.
+2. 점수: 후보 쌍의 실제 2-gram Jaccard 유사도와 거리로 같은 매장인지 판정한다.
+   - 양쪽 좌표가 있으면: 거리 ≤ ENTITY_MAX_DISTANCE_M, 유사도 ≥ ENTITY_TITLE_SIMILARITY
+   - 양쪽 모두 좌표가 없으면: 유사도 ≥ NO_COORDS_SIMILARITY (더 엄격) 이고 주소 키
+     (정규 주소 키, 없으면 주소)가 같거나 한쪽이 비어 있어야 한다 (같은 이름의 다른 지점 보호)
+   - 한쪽만 좌표가 있으면 병합하지 않는다 (거리를 확인할 수 없으므로)
+3. 병합: 같은 매장 쌍을 union-find로 묶고, 묶음마다 먼저 나온 행 하나를 그대로 남긴다
+   (여러 행의 값을 섞으면 한 지점의 주소에 다른 지점의 좌표가 붙을 수 있다).
+"""
+
+import logging
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from config import ENTITY_MAX_DISTANCE_M, ENTITY_TITLE_SIMILARITY
+from processors.coords import to_local_meters
+
+logger = logging.getLogger(__name__)
+
+MINHASH_BANDS = 8
+MINHASH_ROWS = 2            # 밴드당 행 수 (유사도 약 0.35 이상부터 후보가 될 확률이 높아짐)
+NO_COORDS_SIMILARITY = 0.8
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(20240229)
+_HASH_A = _rng.integers(1, _PRIME, size=MINHASH_BANDS * MINHASH_ROWS, dtype=np.int64)
+_HASH_B = _rng.integers(0, _PRIME, size=MINHASH_BANDS * MINHASH_ROWS, dtype=np.int64)
+_NO_CELL = np.int64(-(1 << 40))   # 좌표 없는 매장끼리만 만나는 셀
+
+
+def resolve_duplicate_places(
+    places: pd.DataFrame,
+    max_distance_m: float = ENTITY_MAX_DISTANCE_M,
+    min_similarity: float = ENTITY_TITLE_SIMILARITY,
+) -> pd.DataFrame:
+    """
+    표기가 달라도 같은 매장으로 판정되는 행을 하나로 합친다.
+
+    Args:
+        places: 통합 매장 데이터프레임 (title, address, lat, lng 컬럼, address_key는 있으면 사용)
+        max_distance_m: 같은 매장으로 볼 최대 거리 (미터)
+        min_similarity: 같은 매장으로 볼 최소 매장명 유사도 (2-gram Jaccard)
+
+    Returns:
+        중복이 병합된 데이터프레임 (먼저 나온 행 순서 유지, 인덱스 재설정)
+    """
+    if len(places) < 2:
+        return places
+
+    df = places.reset_index(drop=True)
+    grams = [_bigrams(t) for t in df["title"]]
+    x, y = _local_xy(df)
+
+    pairs = _candidate_pairs(grams, x, y, max_distance_m)
+    if pairs.empty:
+        return df
+
+    from processors.merger import place_address_keys
+
+    i = pairs["i"].to_numpy()
+    j = pairs["j"].to_numpy()
+    similarity = np.array([_jaccard(grams[a], grams[b]) for a, b in zip(i, j)])
+    distance = np.hypot(x[i] - x[j], y[i] - y[j])
+    both_coords = ~np.isnan(distance)
+
+    # 좌표 없는 쌍은 주소가 서로 어긋나지 않아야 한다 (같은 프랜차이즈의 다른 지점)
+    address = place_address_keys(df).fillna("").astype(str).str.strip().to_numpy(dtype=object)
+    address_ok = (address[i] == address[j]) | (address[i] == "") | (address[j] == "")
+
+    has_xy = ~(np.isnan(x) | np.isnan(y))
+    no_coords = ~has_xy[i] & ~has_xy[j]
+    same = np.where(
+        both_coords,
+        (distance <= max_distance_m) & (similarity >= min_similarity),
+        no_coords & address_ok & (similarity >= NO_COORDS_SIMILARITY),
+    )
+
+    # 묶음마다 대표 행(가장 먼저 나온 행)을 그대로 남긴다
+    root = _union_find(len(df), i[same], j[same])
+    merged = df[root == np.arange(len(df))].reset_index(drop=True)
+
+    removed = len(df) - len(merged)
+    if removed:
+        logger.info(f"유사 매장 병합: {removed}건 제거 (후보 쌍 {len(pairs)}개)")
+    return merged
+
+
+def _candidate_pairs(grams: list[set], x: np.ndarray, y: np.ndarray, cell_m: float) -> pd.DataFrame:
+    """(LSH 밴드 버킷, 격자 셀)이 같은 (i < j) 후보 쌍."""
+    n = len(grams)
+    buckets = _lsh_buckets(grams)                        # (n, bands)
+
+    has_xy = ~(np.isnan(x) | np.isnan(y))
+    cx = np.where(has_xy, np.floor(np.nan_to_num(x) / cell_m), _NO_CELL).astype(np.int64)
+    cy = np.where(has_xy, np.floor(np.nan_to_num(y) / cell_m), _NO_CELL).astype(np.int64)
+
+    band = np.tile(np.arange(MINHASH_BANDS), n)
+    rec = np.repeat(np.arange(n), MINHASH_BANDS)
+    bucket = buckets.ravel()
+    usable = bucket >= 0                                 # 2-gram이 없는 매장명은 제외
+    band, rec, bucket = band[usable], rec[usable], bucket[usable]
+    index = pd.DataFrame({"key": _block_key(band, bucket, cx[rec], cy[rec]), "j": rec})
+
+    # 주변 3×3 셀 중 절반(자기 셀 + 오른쪽/위쪽 4칸)만 조회하면 셀 경계를 넘는 쌍도 한 번씩 나온다
+    offsets = np.array([(0, 0), (1, -1), (1, 0), (1, 1), (0, 1)])
+    k = len(offsets)
+    probes = pd.DataFrame({
+        "key": _block_key(
+            np.repeat(band, k), np.repeat(bucket, k),
+            (cx[rec][:, None] + offsets[:, 0]).ravel(), (cy[rec][:, None] + offsets[:, 1]).ravel(),
+        ),
+        "i": np.repeat(rec, k),
+    })
+
+    pairs = probes.merge(index, on="key", how="inner")
+    i = pairs["i"].to_numpy()
+    j = pairs["j"].to_numpy()
+    pairs = pd.DataFrame({"i": np.minimum(i, j), "j": np.maximum(i, j)})
+    pairs = pairs[pairs["i"] < pairs["j"]].drop_duplicates()
+    return pairs.reset_index(drop=True)
+
+
+def _block_key(band: np.ndarray, bucket: np.ndarray, cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    """(밴드, 버킷, 셀 x, 셀 y)를 하나의 64비트 키로 섞는다 (충돌은 후보가 늘 뿐 점수에서 걸러진다)."""
+    key = bucket.astype(np.uint64)
+    for part in (band, cx, cy):
+        key = (key ^ part.astype(np.uint64)) * np.uint64(0x100000001B3)
+    return key
+
+
+def _lsh_buckets(grams: list[set]) -> np.ndarray:
+    """MinHash 서명을 밴드별 버킷 키로 묶는다. 2-gram이 없으면 -1."""
+    n = len(grams)
+    sizes = np.array([len(g) for g in grams], dtype=np.int64)
+    buckets = np.full((n, MINHASH_BANDS), -1, dtype=np.int64)
+    nonempty = np.flatnonzero(sizes)
+    if len(nonempty) == 0:
+        return buckets
+
+    hashes = np.fromiter(
+        (zlib.crc32(g.encode("utf-8")) & 0x7FFFFFFF for idx in nonempty for g in grams[idx]),
+        dtype=np.int64, count=int(sizes[nonempty].sum()),
+    )
+    starts = np.concatenate([[0], np.cumsum(sizes[nonempty])[:-1]])
+
+    # (해시 함수 수, 전체 2-gram 수) 행렬에서 매장별 최솟값 = MinHash 서명
+    permuted = (_HASH_A[:, None] * hashes[None, :] + _HASH_B[:, None]) % _PRIME
+    signatures = np.minimum.reduceat(permuted, starts, axis=1).T      # (매장 수, 해시 함수 수)
+
+    rows = signatures.reshape(len(nonempty), MINHASH_BANDS, MINHASH_ROWS)
+    key = rows[:, :, 0]
+    for r in range(1, MINHASH_ROWS):
+        key = key * _PRIME + rows[:, :, r]
+    buckets[nonempty] = key
+    return buckets
+
+
+def _union_find(n: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """쌍으로 연결된 묶음마다 가장 작은 행 번호를 대표로 반환한다."""
+    parent = list(range(n))
+
+    def find(a: int) -> int:
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    for a, b in zip(left.tolist(), right.tolist()):
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+
+    return np.array([find(a) for a in range(n)], dtype=np.int64)
+
+
+def _local_xy(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    if "lat" not in df.columns or "lng" not in df.columns:
+        nan = np.full(len(df), np.nan)
+        return nan, nan.copy()
+    lat = pd.to_numeric(df["lat"], errors="coerce").to_numpy(dtype=float)
+    lng = pd.to_numeric(df["lng"], errors="coerce").to_numpy(dtype=float)
+    lat0 = np.radians(np.nanmean(lat)) if (~np.isnan(lat)).any() else 0.0
+    return to_local_meters(lat, lng, lat0)
+
+
+def _bigrams(title) -> set:
+    """공백 제거 + 소문자 매장명의 문자 2-gram 집합 (한 글자 이름은 그 글자 하나)."""
+    text = "".join(str(title).split()).lower() if isinstance(title, str) else ""
+    if len(text) == 1:
+        return {text}
+    return {text[k:k + 2] for k in range(len(text) - 1)}
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
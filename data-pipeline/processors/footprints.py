@@ -0,0 +1,329 @@
+"""
+ScanPang Data Pipeline - 건물 외곽선(footprint) 기반 매장 배정 모듈
+로컬 파일의 건물 폴리곤을 읽어 STR 방식으로 채운(packed) R-tree를 만들고,
+매장 좌표가 어느 건물 폴리곤 안에 있는지 벡터화된 point-in-polygon으로 판정한다.
+
+입력 파일 (BUILDING_FOOTPRINTS_PATH):
+    - GeoJSON FeatureCollection (Polygon / MultiPolygon, WGS84 경위도)
+    - VWorld 2D 데이터 API 응답 그대로 (response.result.featureCollection)
+    속성은 VWorld LT_C_SPBD(buld_nm, rd_nm, buld_no) / LT_C_BLDGINFO(bld_nm) / OSM(name)을 인식한다.
+
+폴리곤 → 건물 연결 (건물 순서상 처음 조건을 만족하는 건물):
+    1. 폴리곤 건물명과 건물명이 같음 (공백 무시)
+    2. 폴리곤 도로명주소(도로명 + 건물번호)가 건물 주소에 연속 토큰으로 포함됨
+    3. 건물 Geocoding 좌표가 폴리곤 안에 있음 (1, 2로 연결되지 않은 폴리곤만)
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from config import BUILDING_FOOTPRINTS_PATH
+
+logger = logging.getLogger(__name__)
+
+RTREE_NODE_CAPACITY = 16
+
+
+class PackedRTree:
+    """
+    STR(Sort-Tile-Recursive)로 한 번에 채운 정적 R-tree.
+    각 레벨은 (노드 bbox 배열, 자식 범위 시작/끝 배열)이며, 자식은 아래 레벨에서 연속 구간이다.
+    """
+
+    def __init__(self, bboxes: np.ndarray, capacity: int = RTREE_NODE_CAPACITY):
+        """
+        Args:
+            bboxes: (N, 4) 배열 [minx, miny, maxx, maxy]
+            capacity: 노드당 최대 자식 수
+        """
+        self.capacity = capacity
+        self.order = _str_order(bboxes, capacity)   # 리프 위치 → 원래 폴리곤 번호
+        level_boxes = bboxes[self.order]
+        self.levels: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+
+        while True:
+            n = len(level_boxes)
+            starts = np.arange(0, n, capacity)
+            ends = np.minimum(starts + capacity, n)
+            node_boxes = np.column_stack([
+                np.minimum.reduceat(level_boxes[:, 0], starts),
+                np.minimum.reduceat(level_boxes[:, 1], starts),
+                np.maximum.reduceat(level_boxes[:, 2], starts),
+                np.maximum.reduceat(level_boxes[:, 3], starts),
+            ])
+            # 노드마다 자식 구간을 따로 들고 있으므로 상위 레벨을 위해 노드 순서를 STR로 다시 정렬해도 된다
+            perm = _str_order(node_boxes, capacity)
+            node_boxes, starts, ends = node_boxes[perm], starts[perm], ends[perm]
+            self.levels.append((node_boxes, starts, ends))
+            if len(node_boxes) == 1:
+                break
+            level_boxes = node_boxes
+        self.levels.reverse()
+        self._leaf_boxes = bboxes[self.order]
+
+    def query_points(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        점들의 bbox 후보를 구한다.
+
+        Returns:
+            (점 번호 배열, 폴리곤 번호 배열) - bbox가 점을 포함하는 모든 쌍
+        """
+        pts = np.arange(len(x))
+        nodes = np.zeros(len(x), dtype=np.int64)
+
+        for node_boxes, starts, ends in self.levels:
+            box = node_boxes[nodes]
+            inside = (x[pts] >= box[:, 0]) & (x[pts] <= box[:, 2]) & (y[pts] >= box[:, 1]) & (y[pts] <= box[:, 3])
+            pts, nodes = pts[inside], nodes[inside]
+            # 자식 구간으로 펼친다
+            counts = ends[nodes] - starts[nodes]
+            pts = np.repeat(pts, counts)
+            nodes = _expand_ranges(starts[nodes], counts)
+
+        box = self._leaf_boxes[nodes]
+        inside = (x[pts] >= box[:, 0]) & (x[pts] <= box[:, 2]) & (y[pts] >= box[:, 1]) & (y[pts] <= box[:, 3])
+        return pts[inside], self.order[nodes[inside]]
+
+
+class Footprints:
+    """건물 폴리곤 집합 (링 간선을 평탄화해 보관) + R-tree."""
+
+    def __init__(self, rings_by_polygon: list[list[np.ndarray]], properties: list[dict]):
+        self.properties = properties
+        self.names = [_footprint_name(p) for p in properties]
+        self.road_keys = [_road_key(p) for p in properties]
+
+        # 폴리곤별 간선 (x1, y1, x2, y2)을 하나의 배열로 이어 붙이고 시작 위치를 기록한다
+        edges, counts, bboxes = [], [], []
+        for rings in rings_by_polygon:
+            poly_edges = [np.column_stack([r[:-1], r[1:]]) for r in rings if len(r) >= 4]
+            poly_edges = np.vstack(poly_edges) if poly_edges else np.empty((0, 4))
+            edges.append(poly_edges)
+            counts.append(len(poly_edges))
+            pts = np.vstack(rings) if rings else np.zeros((1, 2))
+            bboxes.append([pts[:, 0].min(), pts[:, 1].min(), pts[:, 0].max(), pts[:, 1].max()])
+
+        self.edges = np.vstack(edges) if edges else np.empty((0, 4))
+        self.edge_counts = np.asarray(counts, dtype=np.int64)
+        self.edge_starts = np.concatenate([[0], np.cumsum(self.edge_counts)[:-1]]).astype(np.int64)
+        self.bboxes = np.asarray(bboxes, dtype=float).reshape(-1, 4)
+        self.areas = (self.bboxes[:, 2] - self.bboxes[:, 0]) * (self.bboxes[:, 3] - self.bboxes[:, 1])
+        self.tree = PackedRTree(self.bboxes) if len(self.bboxes) else None
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+    def locate(self, lat, lng) -> np.ndarray:
+        """
+        각 점을 포함하는 폴리곤 번호를 반환한다 (겹치면 면적이 작은 폴리곤, 없으면 -1).
+
+        Args:
+            lat: 위도 배열
+            lng: 경도 배열
+
+        Returns:
+            폴리곤 번호 배열 (int64)
+        """
+        x = np.asarray(lng, dtype=float)
+        y = np.asarray(lat, dtype=float)
+        result = np.full(len(x), -1, dtype=np.int64)
+        valid = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+        if self.tree is None or len(valid) == 0:
+            return result
+
+        pts, polys = self.tree.query_points(x[valid], y[valid])
+        hit = self._contains(x[valid][pts], y[valid][pts], polys)
+        pts, polys = pts[hit], polys[hit]
+        if len(pts) == 0:
+            return result
+
+        # 점마다 면적이 가장 작은 폴리곤 하나
+        order = np.lexsort((self.areas[polys], pts))
+        pts, polys = pts[order], polys[order]
+        first = np.concatenate([[True], pts[1:] != pts[:-1]])
+        result[valid[pts[first]]] = polys[first]
+        return result
+
+    def _contains(self, px: np.ndarray, py: np.ndarray, polys: np.ndarray) -> np.ndarray:
+        """(점, 폴리곤) 쌍마다 even-odd 규칙 ray casting (구멍/멀티폴리곤 포함)."""
+        counts = self.edge_counts[polys]
+        pair = np.repeat(np.arange(len(polys)), counts)
+        e = self.edges[_expand_ranges(self.edge_starts[polys], counts)]
+        ex, ey = px[pair], py[pair]
+        x1, y1, x2, y2 = e[:, 0], e[:, 1], e[:, 2], e[:, 3]
+
+        straddles = (y1 > ey) != (y2 > ey)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = x1 + (ey - y1) * (x2 - x1) / (y2 - y1)
+        crossings = straddles & (ex < x_cross)
+        return np.bincount(pair, weights=crossings, minlength=len(polys)) % 2 == 1
+
+
+def load_footprints(path: Path) -> Footprints:
+    """
+    GeoJSON(또는 VWorld 응답) 파일에서 건물 폴리곤을 읽는다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        Footprints
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if "response" in data:
+        data = data["response"].get("result", {}).get("featureCollection", {})
+
+    rings_by_polygon, properties = [], []
+    for feature in data.get("features", []):
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") == "Polygon":
+            parts = [geometry["coordinates"]]
+        elif geometry.get("type") == "MultiPolygon":
+            parts = geometry["coordinates"]
+        else:
+            continue
+        rings = [np.asarray(ring, dtype=float)[:, :2] for part in parts for ring in part]
+        if not rings:
+            continue
+        rings_by_polygon.append(rings)
+        properties.append(feature.get("properties") or {})
+
+    footprints = Footprints(rings_by_polygon, properties)
+    logger.info(f"건물 외곽선 로드: {len(footprints)}개 ({path})")
+    return footprints
+
+
+_footprints: Optional[Footprints] = None
+_footprints_loaded = False
+
+
+def get_footprints() -> Optional[Footprints]:
+    """BUILDING_FOOTPRINTS_PATH의 외곽선을 한 번만 읽어 반환한다. 설정이 없으면 None."""
+    global _footprints, _footprints_loaded
+    if not _footprints_loaded:
+        _footprints_loaded = True
+        if BUILDING_FOOTPRINTS_PATH:
+            path = Path(BUILDING_FOOTPRINTS_PATH)
+            if path.exists():
+                _footprints = load_footprints(path)
+            else:
+                logger.warning(f"건물 외곽선 파일이 없습니다: {path}")
+    return _footprints
+
+
+def assign_tenants_by_footprint(
+    tenants: pd.DataFrame,
+    buildings: pd.DataFrame,
+    footprints: Footprints,
+) -> pd.Series:
+    """
+    매장 좌표가 들어 있는 건물 폴리곤으로 매장을 건물에 배정한다.
+
+    Args:
+        tenants: 매장 데이터프레임 (lat, lng 컬럼)
+        buildings: 건물 데이터프레임 (building_name, address, lat, lng 컬럼)
+        footprints: 건물 외곽선
+
+    Returns:
+        건물 인덱스 라벨 시리즈 (폴리곤 밖이거나 폴리곤에 연결된 건물이 없으면 None)
+    """
+    result = pd.Series(None, index=tenants.index, dtype=object)
+    if tenants.empty or buildings.empty or len(footprints) == 0 or "lat" not in tenants.columns:
+        return result
+
+    building_of_polygon = _link_polygons_to_buildings(buildings, footprints)
+    polys = footprints.locate(
+        pd.to_numeric(tenants["lat"], errors="coerce").to_numpy(dtype=float),
+        pd.to_numeric(tenants["lng"], errors="coerce").to_numpy(dtype=float),
+    )
+    positions = np.flatnonzero(polys >= 0)
+    linked = building_of_polygon[polys[positions]]
+    keep = linked >= 0
+    labels = np.asarray(list(buildings.index), dtype=object)
+    result.iloc[positions[keep]] = labels[linked[keep]]
+    return result
+
+
+def _link_polygons_to_buildings(buildings: pd.DataFrame, footprints: Footprints) -> np.ndarray:
+    """폴리곤 번호 → 건물 위치 (연결 안 되면 -1)."""
+    linked = np.full(len(footprints), -1, dtype=np.int64)
+
+    # 1) 건물명 / 2) 도로명주소 (건물 순서상 먼저 나온 건물 우선)
+    name_pos: dict[str, int] = {}
+    road_pos: dict[str, int] = {}
+    names = buildings["building_name"] if "building_name" in buildings.columns else pd.Series("", index=buildings.index)
+    addrs = buildings["address"] if "address" in buildings.columns else pd.Series("", index=buildings.index)
+    for pos, (name, addr) in enumerate(zip(names, addrs)):
+        key = _name_key(name)
+        if key:
+            name_pos.setdefault(key, pos)
+        tokens = str(addr).split() if isinstance(addr, str) else []
+        for a, b in zip(tokens, tokens[1:]):
+            road_pos.setdefault(f"{a} {b}", pos)
+
+    for i in range(len(footprints)):
+        pos = name_pos.get(_name_key(footprints.names[i]))
+        if pos is None and footprints.road_keys[i]:
+            pos = road_pos.get(footprints.road_keys[i])
+        if pos is not None:
+            linked[i] = pos
+
+    # 3) 아직 연결되지 않은 폴리곤: 건물 Geocoding 좌표가 안에 들어 있는 건물
+    if "lat" in buildings.columns and "lng" in buildings.columns:
+        polys = footprints.locate(
+            pd.to_numeric(buildings["lat"], errors="coerce").to_numpy(dtype=float),
+            pd.to_numeric(buildings["lng"], errors="coerce").to_numpy(dtype=float),
+        )
+        for pos in np.flatnonzero(polys >= 0):
+            if linked[polys[pos]] < 0:
+                linked[polys[pos]] = pos
+
+    return linked
+
+
+def _str_order(bboxes: np.ndarray, capacity: int) -> np.ndarray:
+    """STR 정렬 순서: x 중심으로 세로 띠를 나누고, 띠 안에서 y 중심으로 정렬한다."""
+    n = len(bboxes)
+    cx = (bboxes[:, 0] + bboxes[:, 2]) / 2
+    cy = (bboxes[:, 1] + bboxes[:, 3]) / 2
+    leaves = int(np.ceil(n / capacity))
+    slabs = max(1, int(np.ceil(np.sqrt(leaves))))
+    slab_size = slabs * capacity
+
+    by_x = np.argsort(cx, kind="stable")
+    slab_of = np.empty(n, dtype=np.int64)
+    slab_of[by_x] = np.arange(n) // slab_size
+    return np.lexsort((cy, slab_of))
+
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """[start, start + count) 구간들을 하나의 인덱스 배열로 펼친다."""
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts)
+    return np.arange(total, dtype=np.int64) + offsets
+
+
+def _footprint_name(props: dict) -> str:
+    for key in ("buld_nm", "bld_nm", "name"):
+        value = (props.get(key) or "").strip()
+        if value:
+            return value
+    return ""
+
+
+def _road_key(props: dict) -> str:
+    road, number = (props.get("rd_nm") or "").strip(), str(props.get("buld_no") or "").strip()
+    return f"{road} {number}" if road and number else ""
+
+
+def _name_key(name) -> str:
+    return "".join(str(name).split()).lower() if isinstance(name, str) else ""
@@ -0,0 +1,152 @@
+"""
+ScanPang Data Pipeline - Geocoding 결과 캐시 모듈
+검색어 → 좌표 결과를 로컬 SQLite에 저장해 재실행 시 Geocoding API 호출을 줄인다.
+
+- 키: 정규화된 검색어 (연속 공백 정리 + 소문자)
+- 성공 결과: GEOCODE_CACHE_TTL 동안 유지
+- 실패 결과(검색 결과 없음): GEOCODE_NEGATIVE_TTL 동안 유지 (네거티브 캐시)
+  네트워크 오류 등 요청 자체가 실패한 경우는 저장하지 않는다.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from config import (
+    GEOCODE_CACHE_ENABLED,
+    GEOCODE_CACHE_PATH,
+    GEOCODE_CACHE_TTL,
+    GEOCODE_NEGATIVE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+# 좌표 변환 방식이 바뀌면 올린다 (이전 버전으로 계산된 성공 결과는 무효화)
+# 1: 카텍 간이 선형 변환 / 2: TM 역변환 + datum 변환, WGS84 × 10^7 형식 지원
+COORDS_VERSION = 2
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (연속 공백 정리, 양끝 공백 제거, 소문자)."""
+    return re.sub(r"\s+", " ", query or "").strip().lower()
+
+
+class GeocodeCache:
+    """
+    SQLite 기반 Geocoding 캐시. 여러 스레드/프로세스에서 함께 사용할 수 있다.
+    (스레드 간에는 락으로, 프로세스 간에는 SQLite WAL 모드로 동시 접근을 처리)
+    """
+
+    def __init__(
+        self,
+        path: Path = GEOCODE_CACHE_PATH,
+        ttl: float = GEOCODE_CACHE_TTL,
+        negative_ttl: float = GEOCODE_NEGATIVE_TTL,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS geocode_cache (
+                query      TEXT PRIMARY KEY,
+                lat        REAL,
+                lng        REAL,
+                found      INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < COORDS_VERSION:
+            deleted = self._conn.execute("DELETE FROM geocode_cache WHERE found = 1").rowcount
+            self._conn.execute(f"PRAGMA user_version = {COORDS_VERSION}")
+            if deleted:
+                logger.info(f"좌표 변환 방식 변경으로 Geocoding 캐시 {deleted}건 무효화")
+        self._conn.commit()
+
+    def get(self, query: str) -> Optional[dict]:
+        """
+        캐시된 결과를 반환한다.
+
+        Returns:
+            성공 캐시: {"lat", "lng"} / 네거티브 캐시: {} / 없음 또는 만료: None
+        """
+        key = normalize_query(query)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT lat, lng, found, updated_at FROM geocode_cache WHERE query = ?", (key,)
+            ).fetchone()
+
+            if row is not None:
+                lat, lng, found, updated_at = row
+                ttl = self.ttl if found else self.negative_ttl
+                if time.time() - updated_at <= ttl:
+                    if found:
+                        self.hits += 1
+                        return {"lat": lat, "lng": lng}
+                    self.negative_hits += 1
+                    return {}
+
+            self.misses += 1
+            return None
+
+    def put(self, query: str, coords: dict) -> None:
+        """결과를 저장한다. coords가 비어 있으면 네거티브 결과로 저장한다."""
+        key = normalize_query(query)
+        found = bool(coords)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (query, lat, lng, found, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, coords.get("lat") if found else None, coords.get("lng") if found else None,
+                 int(found), time.time()),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """조회 통계 (hits, negative_hits, misses, hit_rate)."""
+        total = self.hits + self.negative_hits + self.misses
+        hit_rate = (self.hits + self.negative_hits) / total if total else 0.0
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": hit_rate,
+        }
+
+    def log_stats(self) -> None:
+        s = self.stats()
+        logger.info(
+            f"Geocoding 캐시: 히트 {s['hits']}건, 네거티브 히트 {s['negative_hits']}건, "
+            f"미스 {s['misses']}건 (히트율 {s['hit_rate']:.1%})"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[GeocodeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> Optional[GeocodeCache]:
+    """프로세스 공유 Geocoding 캐시를 반환한다. 비활성화되어 있으면 None."""
+    global _cache
+    if not GEOCODE_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = GeocodeCache()
+        return _cache
@@ -7,12 +7,16 @@ API: 네이버 클라우드 플랫폼 > Maps > Geocoding
 """
 
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 
 import pandas as pd
 import requests
 
-from config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from config import GEOCODE_MAX_WORKERS, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from processors.coords import katec_to_wgs84_array, naver_mapxy_to_wgs84
+from processors.geocode_cache import get_geocode_cache
+from utils.http_cache import cached_get
 
 logger = logging.getLogger(__name__)
 
@@ -27,18 +31,43 @@ VWORLD_GEOCODE_URL = "https://api.vworld.kr/req/address"
 NAVER_SEARCH_URL = "https://openapi.naver.com/v1/search/local.json"
 
 
-def geocode_with_naver_search(address: str) -> dict:
+def geocode_with_naver_search(address: str, use_cache: bool = True) -> dict:
     """
     네이버 지역 검색 API를 활용하여 주소의 좌표를 추출한다.
-    네이버 검색 결과의 mapx, mapy 값을 사용한다.
-    (mapx, mapy는 카텍 좌표계이므로 WGS84로 근사 변환 필요)
+    네이버 검색 결과의 mapx, mapy 값을 WGS84로 변환해 사용한다.
+
+    결과(검색 결과 없음 포함)는 Geocoding 캐시에 저장되어 재실행 시 API를 호출하지 않는다.
 
     Args:
         address: 검색할 주소 문자열
+        use_cache: Geocoding 캐시 사용 여부
 
     Returns:
         {"lat": float, "lng": float} 또는 빈 딕셔너리
     """
+    cache = get_geocode_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(address)
+        if cached is not None:
+            return cached
+
+    coords = _search_naver_coords(address)
+    if coords is None:
+        # 요청 자체가 실패한 경우는 캐시하지 않는다 (다음 실행에서 재시도)
+        return {}
+
+    if cache is not None:
+        cache.put(address, coords)
+    return coords
+
+
+def _search_naver_coords(address: str) -> Optional[dict]:
+    """
+    네이버 지역 검색으로 좌표를 조회한다.
+
+    Returns:
+        {"lat", "lng"} / 검색 결과 없음: {} / 요청 실패: None
+    """
     headers = {
         "X-Naver-Client-Id": NAVER_CLIENT_ID,
         "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
@@ -49,7 +78,7 @@ def geocode_with_naver_search(address: str) -> dict:
     }
 
     try:
-        resp = requests.get(NAVER_SEARCH_URL, headers=headers, params=params, timeout=10)
+        resp = cached_get("naver", NAVER_SEARCH_URL, params=params, headers=headers, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         items = data.get("items", [])
@@ -64,23 +93,22 @@ def geocode_with_naver_search(address: str) -> dict:
         if not mapx or not mapy:
             return {}
 
-        # 네이버 검색 API의 mapx/mapy는 카텍(KATEC) 좌표
-        # WGS84 근사 변환 (간이 변환 - 정밀도 약 수십m 이내)
-        lat, lng = katec_to_wgs84(int(mapy), int(mapx))
-        return {"lat": lat, "lng": lng}
+        # mapx/mapy는 WGS84 × 10^7 또는 카텍(KATEC) 좌표 (형식 자동 판별)
+        lat, lng = naver_mapxy_to_wgs84(mapx, mapy)
+        if pd.isna(lat[0]) or pd.isna(lng[0]):
+            return {}
+        return {"lat": float(lat[0]), "lng": float(lng[0])}
 
     except (requests.exceptions.RequestException, ValueError, TypeError) as e:
         logger.debug(f"네이버 Geocoding 실패 [{address}]: {e}")
-        return {}
+        return None
 
 
 def katec_to_wgs84(y: int, x: int) -> tuple:
     """
-    카텍(KATEC) 좌표를 WGS84 좌표로 근사 변환한다.
-
-    네이버 검색 API의 mapx(경도), mapy(위도)는 카텍 좌표계 기반이다.
-    정밀 변환을 위해서는 proj4 라이브러리가 필요하지만,
-    MVP에서는 간이 선형 변환을 사용한다.
+    카텍(KATEC) 좌표를 WGS84 좌표로 변환한다.
+    Bessel 타원체 TM 역변환 + 7변수 datum 변환을 사용한다 (processors.coords).
+    여러 점을 변환할 때는 katec_to_wgs84_array를 사용한다.
 
     Args:
         y: 카텍 Y좌표 (위도 방향)
@@ -89,22 +117,66 @@ def katec_to_wgs84(y: int, x: int) -> tuple:
     Returns:
         (위도, 경도) 튜플
     """
-    # 간이 변환 공식 (서울/수도권 기준, 오차 약 50m 이내)
-    # 보다 정확한 변환이 필요하면 pyproj 라이브러리 사용 권장
-    lat = (y - 464362.242) / 111062.9516 + 37.0
-    lng = (x - 305048.896) / 88762.6832 + 127.0
+    lat, lng = katec_to_wgs84_array([x], [y])
+    return round(float(lat[0]), 7), round(float(lng[0]), 7)
+
+
+def batch_geocode(queries: Iterable[str], max_workers: int = GEOCODE_MAX_WORKERS) -> dict[str, dict]:
+    """
+    검색어 목록을 중복 제거한 뒤 스레드 풀로 동시에 Geocoding한다.
+    API 호출 수는 행 수가 아니라 고유 검색어 수에 비례한다.
+    (호출 속도는 프로바이더 레이트 리미터가, 재실행 시 호출 여부는 Geocoding 캐시가 결정)
 
-    # 보정 (서울 강남구 근처 경험적 보정값)
-    lat += 0.0028
-    lng -= 0.0045
+    Args:
+        queries: 검색어 목록 (빈 값은 무시)
+        max_workers: 동시 요청 수
+
+    Returns:
+        {검색어: {"lat", "lng"} 또는 {}}
+    """
+    unique = list(dict.fromkeys(q for q in queries if q))
+    if not unique:
+        return {}
 
-    return round(lat, 7), round(lng, 7)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = dict(zip(unique, executor.map(geocode_with_naver_search, unique)))
+
+    found = sum(1 for c in results.values() if c)
+    logger.info(f"Geocoding 배치: 고유 검색어 {len(unique)}건 중 {found}건 성공")
+    return results
+
+
+def _compose_query(name: pd.Series, address: pd.Series) -> pd.Series:
+    """이름 + 주소 검색어를 만든다. 이름이 없으면 주소만 사용한다."""
+    name = name.fillna("").astype(str)
+    address = address.fillna("").astype(str)
+    combined = (name + " " + address).str.strip()
+    return combined.where(name != "", address)
+
+
+def _scatter_coords(df: pd.DataFrame, queries: pd.Series, results: dict[str, dict]) -> pd.Series:
+    """
+    검색어별 결과를 해당 행들의 lat/lng 컬럼에 채운다 (검색어 기준 해시 조인).
+
+    Returns:
+        좌표를 채운 행 마스크
+    """
+    lat_map = {q: c["lat"] for q, c in results.items() if c}
+    lng_map = {q: c["lng"] for q, c in results.items() if c}
+    lats = queries.map(lat_map)
+    resolved = lats.notna()
+    df.loc[resolved.index[resolved], "lat"] = lats[resolved]
+    df.loc[resolved.index[resolved], "lng"] = queries[resolved].map(lng_map)
+    return resolved
 
 
 def geocode_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
     """
     건물 데이터프레임의 주소를 좌표로 변환한다.
 
+    좌표가 없는 행의 검색어(건물명 + 주소)를 먼저 모아 고유 검색어만 동시에 조회하고,
+    실패한 행은 주소만으로 한 번 더 조회한 뒤 결과를 검색어 기준으로 행에 되돌려 넣는다.
+
     Args:
         buildings_df: 건물 데이터프레임 (address 컬럼 필수)
 
@@ -114,7 +186,7 @@ def geocode_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
     if buildings_df.empty:
         return buildings_df
 
-    df = buildings_df.copy()
+    df = buildings_df.copy(deep=False)
 
     # 이미 좌표가 있는 경우 건너뜀
     if "lat" not in df.columns:
@@ -122,44 +194,26 @@ def geocode_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
     if "lng" not in df.columns:
         df["lng"] = None
 
-    geocoded_count = 0
-    failed_count = 0
-
-    for idx, row in df.iterrows():
-        # 이미 좌표가 있으면 건너뜀
-        if pd.notna(row.get("lat")) and pd.notna(row.get("lng")):
-            continue
-
-        address = row.get("address", "")
-        building_name = row.get("building_name", "")
-
-        if not address and not building_name:
-            failed_count += 1
-            continue
-
-        # 건물명 + 주소로 검색 (정확도 향상)
-        search_query = f"{building_name} {address}".strip() if building_name else address
-
-        coords = geocode_with_naver_search(search_query)
-
-        if coords:
-            df.at[idx, "lat"] = coords["lat"]
-            df.at[idx, "lng"] = coords["lng"]
-            geocoded_count += 1
-        else:
-            # 주소만으로 재시도
-            if address and search_query != address:
-                coords = geocode_with_naver_search(address)
-                if coords:
-                    df.at[idx, "lat"] = coords["lat"]
-                    df.at[idx, "lng"] = coords["lng"]
-                    geocoded_count += 1
-                else:
-                    failed_count += 1
-            else:
-                failed_count += 1
-
-        time.sleep(0.2)  # API 호출 간격
+    todo = df[df["lat"].isna() | df["lng"].isna()]
+    address = todo.get("address", pd.Series("", index=todo.index)).fillna("").astype(str)
+    name = todo.get("building_name", pd.Series("", index=todo.index))
+
+    searchable = (address != "") | (name.fillna("").astype(str) != "")
+    failed_count = int((~searchable).sum())
+
+    # 1차: 건물명 + 주소로 검색 (정확도 향상)
+    primary = _compose_query(name, address)[searchable]
+    resolved = _scatter_coords(df, primary, batch_geocode(primary))
+    geocoded_count = int(resolved.sum())
+
+    # 2차: 실패한 행은 주소만으로 재시도
+    retry = primary[~resolved]
+    retry_address = address[retry.index]
+    retry_mask = (retry_address != "") & (retry != retry_address)
+    fallback = retry_address[retry_mask]
+    if not fallback.empty:
+        geocoded_count += int(_scatter_coords(df, fallback, batch_geocode(fallback)).sum())
+    failed_count += len(primary) - geocoded_count
 
     logger.info(f"Geocoding 완료: 성공 {geocoded_count}건, 실패 {failed_count}건")
     return df
@@ -168,7 +222,8 @@ def geocode_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
 def geocode_tenants(tenants_df: pd.DataFrame) -> pd.DataFrame:
     """
     매장 데이터프레임의 좌표를 보완한다.
-    Google Places 결과는 이미 좌표가 있으므로 없는 것만 처리한다.
+    Google Places 결과와 mapx/mapy가 있는 네이버 결과는 이미 좌표가 있으므로 없는 것만 처리한다.
+    고유 검색어(매장명 + 주소)만 동시에 조회한 뒤 행에 되돌려 넣는다.
 
     Args:
         tenants_df: 매장 데이터프레임
@@ -179,7 +234,7 @@ def geocode_tenants(tenants_df: pd.DataFrame) -> pd.DataFrame:
     if tenants_df.empty:
         return tenants_df
 
-    df = tenants_df.copy()
+    df = tenants_df.copy(deep=False)
 
     if "lat" not in df.columns:
         df["lat"] = None
@@ -188,24 +243,12 @@ def geocode_tenants(tenants_df: pd.DataFrame) -> pd.DataFrame:
 
     # 좌표가 없는 매장만 처리
     missing_coords = df[df["lat"].isna() | df["lng"].isna()]
-    geocoded_count = 0
-
-    for idx, row in missing_coords.iterrows():
-        address = row.get("address", "")
-        title = row.get("title", "")
-
-        if not address and not title:
-            continue
+    address = missing_coords.get("address", pd.Series("", index=missing_coords.index)).fillna("").astype(str)
+    title = missing_coords.get("title", pd.Series("", index=missing_coords.index))
 
-        search_query = f"{title} {address}".strip() if title else address
-        coords = geocode_with_naver_search(search_query)
-
-        if coords:
-            df.at[idx, "lat"] = coords["lat"]
-            df.at[idx, "lng"] = coords["lng"]
-            geocoded_count += 1
-
-        time.sleep(0.2)
+    searchable = (address != "") | (title.fillna("").astype(str) != "")
+    queries = _compose_query(title, address)[searchable]
+    geocoded_count = int(_scatter_coords(df, queries, batch_geocode(queries)).sum())
 
     logger.info(f"매장 Geocoding 보완: {geocoded_count}건 추가")
     return df
@@ -216,5 +259,10 @@ def geocode(buildings_df: pd.DataFrame, tenants_df: pd.DataFrame) -> tuple:
     logger.info("=== Geocoding 시작 ===")
     buildings_df = geocode_buildings(buildings_df)
     tenants_df = geocode_tenants(tenants_df)
+
+    cache = get_geocode_cache()
+    if cache is not None:
+        cache.log_stats()
+
     logger.info("=== Geocoding 완료 ===")
     return buildings_df, tenants_df
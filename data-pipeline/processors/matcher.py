@@ -0,0 +1,305 @@
+"""
+ScanPang Data Pipeline - 매장 → 건물 매칭 모듈
+건물 주소 토큰/건물명으로 역색인을 만들어 각 매장을 후보 건물과만 비교한다.
+
+정규 주소 키 매칭 (processors.address):
+    매장 주소의 정규 키가 건물 도로명/지번 주소의 정규 키(모든 수준)와 같으면 그 건물
+    (여러 건물이면 건물 순서상 처음). 키 사전 하나에 대한 해시 조인(Series.map)으로 계산한다.
+
+정규 키로 매칭되지 않은 매장의 텍스트 규칙 (건물 순서대로 처음 만족하는 건물에 매칭):
+    1. 건물명(3자 이상)이 매장 주소에 포함됨
+    2. 건물 주소와 매장 주소의 공통 토큰(공백 기준)이 MIN_COMMON_TOKENS개 이상
+주소가 비어 있는 건물은 매칭 대상에서 제외한다.
+
+- 토큰 조건: 공통 토큰이 k개 이상이려면 매장 토큰 중 가장 흔한 k-1개를 뺀 나머지
+  (가장 드문 토큰들) 중 하나는 반드시 공유해야 한다. 그 토큰들의 역색인만 건물 순서대로
+  훑으며 처음 조건을 만족하는 건물에서 멈춘다.
+- 건물명 조건: 건물명을 가장 드문 3-gram 하나로 색인하고, 매장 주소의 모든 3-gram으로
+  후보를 찾은 뒤 부분 문자열 포함 여부를 확인한다.
+
+좌표 매칭 (MATCH_MODE="spatial", Geocoding 이후):
+    건물 좌표를 MATCH_MAX_DISTANCE_M 크기의 균일 격자에 넣고, 매장 좌표 주변 3×3 격자의
+    건물만 후보로 삼는다 (격자 키 해시 조인으로 한 번에 계산). 후보 중 가까운 건물 →
+    텍스트 규칙을 만족하는 건물 → 건물 순서로 고른다. 좌표가 없거나 거리 안에 후보 건물이
+    없는 매장은 텍스트 매칭을 그대로 쓴다.
+    BUILDING_FOOTPRINTS_PATH가 설정되어 있으면 건물 폴리곤 안에 든 매장은 그 건물로 배정한다
+    (processors.footprints).
+    정규 주소 키로 매칭된 매장은 좌표/폴리곤 매칭과 상관없이 그 건물로 확정한다.
+"""
+
+import heapq
+from collections import Counter, defaultdict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from config import MATCH_MAX_DISTANCE_M, MATCH_MODE
+from processors.address import canonical_keys, parse_address
+from processors.coords import to_local_meters
+from processors.footprints import assign_tenants_by_footprint, get_footprints
+
+MIN_COMMON_TOKENS = 3
+MIN_NAME_LENGTH = 3
+_NGRAM = 3
+
+
+class AddressMatcher:
+    """건물 주소/건물명 역색인. 한 번 만들어 여러 매장 주소에 재사용한다."""
+
+    def __init__(self, buildings: pd.DataFrame):
+        self.labels = list(buildings.index)
+        names = _as_str_list(buildings, "building_name")
+        addrs = _as_str_list(buildings, "address")
+
+        self._names: list[str] = []
+        self._token_sets: list[frozenset] = []
+        self._token_index: dict[str, list[int]] = defaultdict(list)
+        name_positions: list[int] = []
+
+        for pos, (name, addr) in enumerate(zip(names, addrs)):
+            tokens = frozenset(addr.split()) if addr else frozenset()
+            self._names.append(name if addr else "")
+            self._token_sets.append(tokens)
+            for token in tokens:
+                self._token_index[token].append(pos)
+            if addr and len(name) >= MIN_NAME_LENGTH:
+                name_positions.append(pos)
+
+        # 건물명은 (건물명 전체에서) 가장 드문 3-gram 하나로만 색인한다
+        gram_freq = Counter(g for pos in name_positions for g in set(_ngrams(self._names[pos])))
+        self._name_index: dict[str, list[int]] = defaultdict(list)
+        for pos in name_positions:
+            rarest = min(set(_ngrams(self._names[pos])), key=lambda g: (gram_freq[g], g))
+            self._name_index[rarest].append(pos)
+
+    def match(self, address: str) -> Optional[object]:
+        """
+        매장 주소에 매칭되는 첫 번째 건물의 인덱스 라벨을 반환한다.
+
+        Args:
+            address: 매장 주소
+
+        Returns:
+            건물 인덱스 라벨 또는 None
+        """
+        best = len(self.labels)
+
+        for i in range(len(address) - _NGRAM + 1):
+            for pos in self._name_index.get(address[i:i + _NGRAM], ()):
+                if pos < best and self._names[pos] in address:
+                    best = pos
+
+        # 어떤 건물에도 없는 토큰은 공통 토큰이 될 수 없으므로 제외
+        tokens = {t for t in address.split() if t in self._token_index}
+        if len(tokens) >= MIN_COMMON_TOKENS:
+            # 흔한 토큰 (MIN_COMMON_TOKENS - 1)개를 제외한 토큰의 역색인만 본다
+            ordered = sorted(tokens, key=lambda t: len(self._token_index[t]))
+            prefix = ordered[:len(ordered) - (MIN_COMMON_TOKENS - 1)]
+            # 역색인은 건물 순서로 정렬되어 있으므로 앞에서부터 보다가 처음 만족하는 건물에서 멈춘다
+            for pos in heapq.merge(*(self._token_index[t] for t in prefix)):
+                if pos >= best:
+                    break
+                if len(self._token_sets[pos] & tokens) >= MIN_COMMON_TOKENS:
+                    best = pos
+                    break
+
+        if best == len(self.labels):
+            return None
+        return self.labels[best]
+
+    def matches(self, address: str, pos: int) -> bool:
+        """매장 주소가 pos번째 건물과 텍스트 규칙으로 매칭되는지 확인한다."""
+        name = self._names[pos]
+        if len(name) >= MIN_NAME_LENGTH and name in address:
+            return True
+        return len(self._token_sets[pos] & set(address.split())) >= MIN_COMMON_TOKENS
+
+
+def match_addresses(
+    addresses: pd.Series,
+    buildings: pd.DataFrame,
+    keys: Optional[pd.Series] = None,
+) -> pd.Series:
+    """
+    매장 주소 시리즈를 건물에 매칭한다. 정규 주소 키 조인 후 남은 매장만 텍스트 규칙을 쓴다.
+    같은 주소는 한 번만 계산한다.
+
+    Args:
+        addresses: 매장 주소 시리즈
+        buildings: 건물 데이터프레임 (building_name, address 컬럼)
+        keys: 매장 정규 주소 키 시리즈 (없으면 addresses에서 계산)
+
+    Returns:
+        매칭된 건물 인덱스 라벨 시리즈 (매칭 실패는 None, object dtype)
+    """
+    if buildings.empty or addresses.empty:
+        return pd.Series(None, index=addresses.index, dtype=object)
+
+    by_key = match_address_keys(canonical_keys(addresses) if keys is None else keys, buildings)
+    return _fill_by_text(addresses, buildings, by_key)
+
+
+def _fill_by_text(addresses: pd.Series, buildings: pd.DataFrame, by_key: pd.Series) -> pd.Series:
+    """정규 키로 매칭되지 않은 매장만 텍스트 규칙으로 채운 새 시리즈를 반환한다."""
+    result = by_key.copy()
+    rest = addresses[by_key.isna()]
+    if rest.empty:
+        return result
+    matcher = AddressMatcher(buildings)
+    addr_str = [str(v) for v in rest]
+    matched = {addr: matcher.match(addr) for addr in set(addr_str)}
+    result.loc[rest.index] = [matched[addr] for addr in addr_str]
+    return result
+
+
+def match_address_keys(keys: pd.Series, buildings: pd.DataFrame) -> pd.Series:
+    """
+    매장 정규 주소 키를 건물 정규 키 사전에 해시 조인한다.
+
+    Args:
+        keys: 매장 정규 주소 키 시리즈 (processors.address.canonical_keys)
+        buildings: 건물 데이터프레임 (road_address, jibun_address, address 중 있는 컬럼 사용)
+
+    Returns:
+        매칭된 건물 인덱스 라벨 시리즈 (매칭 실패는 None, object dtype)
+    """
+    lookup: dict[str, object] = {}
+    columns = [c for c in ("road_address", "jibun_address", "address") if c in buildings.columns]
+    for label, *values in buildings[columns].itertuples(index=True, name=None):
+        for value in values:
+            parts = parse_address(value) if isinstance(value, str) else None
+            if parts is not None:
+                for key in parts.keys_for_join():
+                    lookup.setdefault(key, label)
+
+    return pd.Series([lookup.get(key) for key in keys], index=keys.index, dtype=object)
+
+
+def match_tenants(
+    tenants: pd.DataFrame,
+    buildings: pd.DataFrame,
+    mode: str = MATCH_MODE,
+    max_distance_m: float = MATCH_MAX_DISTANCE_M,
+) -> pd.Series:
+    """
+    매장을 건물에 매칭한다. spatial 모드에서는 좌표 근접도를 우선하고 텍스트로 동점을 가린다.
+    정규 주소 키 매칭은 두 모드 모두에서 확정이다.
+
+    Args:
+        tenants: 매장 데이터프레임 (address, lat, lng 컬럼)
+        buildings: 건물 데이터프레임 (building_name, address, lat, lng 컬럼)
+        mode: "text" 또는 "spatial"
+        max_distance_m: spatial 모드에서 후보로 볼 최대 거리 (미터)
+
+    Returns:
+        매칭된 건물 인덱스 라벨 시리즈 (매칭 실패는 None, object dtype)
+    """
+    if buildings.empty or tenants.empty:
+        return pd.Series(None, index=tenants.index, dtype=object)
+
+    addresses = tenants["address"] if "address" in tenants.columns else pd.Series("", index=tenants.index)
+    keys = tenants["address_key"] if "address_key" in tenants.columns else canonical_keys(addresses)
+    by_key = match_address_keys(keys, buildings)
+    matched = _fill_by_text(addresses, buildings, by_key)
+    if mode != "spatial":
+        return matched
+
+    result = _match_by_distance(tenants, buildings, addresses, matched, max_distance_m)
+
+    # 건물 외곽선이 있으면 폴리곤 안에 든 매장은 그 건물로 확정한다
+    footprints = get_footprints()
+    if footprints is not None and "lat" in tenants.columns and "lng" in tenants.columns:
+        by_footprint = assign_tenants_by_footprint(tenants, buildings, footprints)
+        inside = by_footprint.notna()
+        result[inside] = by_footprint[inside]
+
+    # 정규 주소 키 매칭은 좌표/폴리곤 매칭이 덮어쓰지 않는다
+    keyed = by_key.notna()
+    result[keyed] = by_key[keyed]
+    return result
+
+
+def _match_by_distance(
+    tenants: pd.DataFrame,
+    buildings: pd.DataFrame,
+    addresses: pd.Series,
+    matched: pd.Series,
+    max_distance_m: float,
+) -> pd.Series:
+    """격자 기반 거리 매칭. 좌표나 거리 안 후보가 없으면 텍스트 매칭 결과(matched)를 그대로 쓴다."""
+    has_coords = all(c in df.columns for df in (tenants, buildings) for c in ("lat", "lng"))
+    if not has_coords:
+        return matched
+
+    matcher = AddressMatcher(buildings)
+    t_lat, t_lng = _coords(tenants)
+    b_lat, b_lng = _coords(buildings)
+    valid_t = ~(np.isnan(t_lat) | np.isnan(t_lng))
+    valid_b = ~(np.isnan(b_lat) | np.isnan(b_lng))
+    if not valid_t.any() or not valid_b.any():
+        return matched
+
+    # 지역 평균 위도 기준 등거리 평면 좌표 (수 km 범위에서 오차 무시 가능)
+    lat0 = np.radians(np.nanmean(np.concatenate([t_lat[valid_t], b_lat[valid_b]])))
+    t_x, t_y = to_local_meters(t_lat, t_lng, lat0)
+    b_x, b_y = to_local_meters(b_lat, b_lng, lat0)
+
+    pairs = _grid_pairs(t_x, t_y, np.flatnonzero(valid_t), b_x, b_y, np.flatnonzero(valid_b), max_distance_m)
+
+    address_list = [str(v) for v in addresses]
+    pairs["text"] = [matcher.matches(address_list[t], b) for t, b in zip(pairs["t"], pairs["b"])]
+    best = (
+        pairs.sort_values(["t", "dist", "text", "b"], ascending=[True, True, False, True])
+        .drop_duplicates("t", keep="first")
+    )
+
+    result = matched.copy()
+    labels = np.asarray(matcher.labels, dtype=object)
+    result.iloc[best["t"].to_numpy()] = labels[best["b"].to_numpy()]
+    return result
+
+
+def _coords(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    lat = pd.to_numeric(df["lat"], errors="coerce").to_numpy(dtype=float)
+    lng = pd.to_numeric(df["lng"], errors="coerce").to_numpy(dtype=float)
+    return lat, lng
+
+
+def _grid_pairs(
+    t_x: np.ndarray, t_y: np.ndarray, t_pos: np.ndarray,
+    b_x: np.ndarray, b_y: np.ndarray, b_pos: np.ndarray,
+    cell_m: float,
+) -> pd.DataFrame:
+    """격자 해시 조인으로 거리 cell_m 이내의 (매장 위치, 건물 위치, 거리) 쌍을 구한다."""
+    grid = pd.DataFrame({
+        "cx": np.floor(b_x[b_pos] / cell_m).astype(np.int64),
+        "cy": np.floor(b_y[b_pos] / cell_m).astype(np.int64),
+        "b": b_pos,
+    })
+
+    # 매장마다 주변 3×3 격자 키를 만든다
+    offsets = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+    t_cx = np.floor(t_x[t_pos] / cell_m).astype(np.int64)
+    t_cy = np.floor(t_y[t_pos] / cell_m).astype(np.int64)
+    probes = pd.DataFrame({
+        "cx": (t_cx[:, None] + offsets[:, 0]).ravel(),
+        "cy": (t_cy[:, None] + offsets[:, 1]).ravel(),
+        "t": np.repeat(t_pos, len(offsets)),
+    })
+
+    pairs = probes.merge(grid, on=["cx", "cy"], how="inner")[["t", "b"]]
+    t_idx = pairs["t"].to_numpy()
+    b_idx = pairs["b"].to_numpy()
+    pairs["dist"] = np.hypot(t_x[t_idx] - b_x[b_idx], t_y[t_idx] - b_y[b_idx])
+    return pairs[pairs["dist"] <= cell_m].reset_index(drop=True)
+
+
+def _as_str_list(df: pd.DataFrame, column: str) -> list[str]:
+    if column not in df.columns:
+        return [""] * len(df)
+    return [str(v) for v in df[column]]
+
+
+def _ngrams(text: str) -> list[str]:
+    return [text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)]
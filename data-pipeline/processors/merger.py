@@ -9,103 +9,40 @@ from typing import Optional
 
 import pandas as pd
 
+from config import MATCH_MODE
+from processors.address import canonical_keys
+from processors.category import get_classifier
+from processors.coords import naver_mapxy_to_wgs84
+from processors.entity_resolution import resolve_duplicate_places
+from processors.matcher import match_addresses, match_tenants
+
 logger = logging.getLogger(__name__)
 
-# 업종 카테고리 정규화 매핑
-CATEGORY_NORMALIZE_MAP = {
-    # 음식
-    "음식점": "음식점",
-    "한식": "음식점",
-    "중식": "음식점",
-    "일식": "음식점",
-    "양식": "음식점",
-    "분식": "음식점",
-    "치킨": "음식점",
-    "피자": "음식점",
-    "패스트푸드": "음식점",
-    "restaurant": "음식점",
-    # 카페/디저트
-    "카페": "카페",
-    "커피": "카페",
-    "디저트": "카페",
-    "베이커리": "카페",
-    "cafe": "카페",
-    # 편의시설
-    "편의점": "편의점",
-    "convenience_store": "편의점",
-    "약국": "약국",
-    "pharmacy": "약국",
-    "은행": "은행",
-    "bank": "은행",
-    "ATM": "은행",
-    # 의료
-    "병원": "병원",
-    "의원": "병원",
-    "치과": "병원",
-    "한의원": "병원",
-    "hospital": "병원",
-    # 생활
-    "미용실": "미용실",
-    "헤어": "미용실",
-    "hair_care": "미용실",
-    "헬스장": "헬스장",
-    "피트니스": "헬스장",
-    "gym": "헬스장",
-    # 교육
-    "학원": "학원",
-    "교육": "학원",
-    # 기타
-    "주차장": "주차장",
-    "parking": "주차장",
-    "상점": "상점",
-    "store": "상점",
-}
-
-# 업종 아이콘 매핑
-CATEGORY_ICON_MAP = {
-    "음식점": "restaurant",
-    "카페": "cafe",
-    "편의점": "convenience_store",
-    "약국": "local_pharmacy",
-    "은행": "account_balance",
-    "병원": "local_hospital",
-    "미용실": "content_cut",
-    "헬스장": "fitness_center",
-    "학원": "school",
-    "주차장": "local_parking",
-    "상점": "store",
-}
+# 업종 카테고리 정규화 매핑 / 아이콘 매핑 (category_taxonomy.json에서 생성)
+CATEGORY_NORMALIZE_MAP = dict(zip(get_classifier().keywords, get_classifier().categories))
+CATEGORY_ICON_MAP = dict(get_classifier().icons)
 
 
 def normalize_category(raw_category: str) -> str:
     """업종 카테고리를 정규화한다."""
-    if not raw_category:
-        return "기타"
-
-    raw_lower = raw_category.strip().lower()
+    return get_classifier().classify(raw_category)
 
-    # 직접 매핑 확인
-    if raw_lower in CATEGORY_NORMALIZE_MAP:
-        return CATEGORY_NORMALIZE_MAP[raw_lower]
 
-    # 부분 매칭 시도
-    for keyword, normalized in CATEGORY_NORMALIZE_MAP.items():
-        if keyword in raw_lower or raw_lower in keyword:
-            return normalized
-
-    return "기타"
+def normalize_categories(raw: pd.Series) -> pd.Series:
+    """업종 카테고리 시리즈를 정규화한다 (고유 값마다 한 번만 분류)."""
+    return get_classifier().classify_series(raw)
 
 
 def clean_html_tags(text: str) -> str:
     """HTML 태그를 제거한다."""
-    if not text or not isinstance(text, str):
-        return text or ""
+    if not isinstance(text, str) or not text:
+        return "" if pd.isna(text) or not text else text
     return re.sub(r"<[^>]+>", "", text).strip()
 
 
 def normalize_address(address: str) -> str:
     """주소를 정규화한다 (공백 정리, 불필요 접두사 제거)."""
-    if not address or not isinstance(address, str):
+    if not isinstance(address, str) or not address:
         return ""
     # 연속 공백 제거
     address = re.sub(r"\s+", " ", address).strip()
@@ -164,10 +101,10 @@ def _process_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
     if buildings_df is None or buildings_df.empty:
         return pd.DataFrame(columns=[
             "building_name", "address", "total_floors", "basement_floors",
-            "building_use", "completion_year",
+            "building_use", "completion_year", "building_key",
         ])
 
-    df = buildings_df.copy()
+    df = buildings_df.copy(deep=False)
 
     # 건물명 정리
     if "building_name" in df.columns:
@@ -176,10 +113,13 @@ def _process_buildings(buildings_df: pd.DataFrame) -> pd.DataFrame:
     # 주소 정규화
     if "address" in df.columns:
         df["address"] = df["address"].apply(normalize_address)
+        df["address_key"] = canonical_keys(df["address"])
 
-    # 건물명 + 주소 기준 중복 제거 (가장 층수가 높은 것 우선)
-    df = df.sort_values("ground_floors", ascending=False)
+    # 건물명 + 주소, 자연 키 기준 중복 제거 (가장 층수가 높은 것 우선)
+    df["building_key"] = building_keys(df)
+    df = df.sort_values("ground_floors", ascending=False, kind="stable")
     df = df.drop_duplicates(subset=["building_name", "address"], keep="first")
+    df = df.drop_duplicates(subset=["building_key"], keep="first")
     df = df.reset_index(drop=True)
 
     return df
@@ -192,47 +132,145 @@ def _merge_places(
     """네이버 + 구글 매장 데이터를 통합하고 중복을 제거한다."""
     frames = []
 
-    # 네이버 데이터 정규화
     if naver_df is not None and not naver_df.empty:
-        naver = naver_df.copy()
-        naver["title"] = naver["title"].apply(clean_html_tags)
-        naver["category_normalized"] = naver["category"].apply(normalize_category)
-        naver["category_icon"] = naver["category_normalized"].map(CATEGORY_ICON_MAP).fillna("store")
-
-        if "road_address" in naver.columns:
-            naver["address"] = naver["road_address"].apply(normalize_address)
-        else:
-            naver["address"] = ""
+        frames.append(normalize_naver_places(naver_df))
 
-        frames.append(naver[["title", "category_normalized", "category_icon", "address", "source"]].rename(
-            columns={"category_normalized": "category"}
-        ))
-
-    # 구글 데이터 정규화
     if google_df is not None and not google_df.empty:
-        google = google_df.copy()
-        google["title"] = google["title"].apply(clean_html_tags)
-        google["category_normalized"] = google["category"].apply(normalize_category)
-        google["category_icon"] = google["category_normalized"].map(CATEGORY_ICON_MAP).fillna("store")
-        google["address"] = google["address"].apply(normalize_address)
-
-        # 좌표 정보 보존
-        cols = ["title", "category_normalized", "category_icon", "address", "source"]
-        if "lat" in google.columns:
-            cols.extend(["lat", "lng"])
-        frames.append(google[cols].rename(columns={"category_normalized": "category"}))
+        frames.append(normalize_google_places(google_df))
 
     if not frames:
-        return pd.DataFrame(columns=["title", "category", "category_icon", "address", "source"])
+        return pd.DataFrame(columns=["title", "category", "category_icon", "address", "address_key", "source"])
+
+    return dedupe_places(pd.concat(frames, ignore_index=True))
+
+
+def dedupe_places(places: pd.DataFrame) -> pd.DataFrame:
+    """
+    통합 매장 프레임의 중복을 제거한다 (먼저 나온 행 유지, 인덱스 재설정).
+    매장명 정규화 + 정규 주소 키(없으면 주소)가 같은 행을 지운 뒤,
+    표기가 달라 걸러지지 않은 같은 매장을 병합한다 (매장명 유사도 + 좌표 근접).
+    """
+    if places.empty:
+        return places.reset_index(drop=True)
+
+    exact = pd.DataFrame({"title": place_dedupe_keys(places), "address": place_address_keys(places)})
+    places = places[~exact.duplicated(keep="first").to_numpy()].reset_index(drop=True)
+    return resolve_duplicate_places(places)
+
+
+def normalize_naver_places(naver_df: pd.DataFrame) -> pd.DataFrame:
+    """네이버 매장 데이터를 통합 매장 스키마로 정규화한다."""
+    naver = naver_df.copy(deep=False)
+    naver["title"] = naver["title"].apply(clean_html_tags)
+    naver["category_normalized"] = normalize_categories(naver["category"])
+    naver["category_icon"] = naver["category_normalized"].map(CATEGORY_ICON_MAP).fillna("store")
+
+    if "road_address" in naver.columns:
+        naver["address"] = naver["road_address"].apply(normalize_address)
+    else:
+        naver["address"] = ""
+
+    # 정규 주소 키: 도로명주소로 못 만들면 지번주소로
+    naver["address_key"] = canonical_keys(naver["address"])
+    if "jibun_address" in naver.columns:
+        missing = naver["address_key"] == ""
+        naver.loc[missing, "address_key"] = canonical_keys(naver.loc[missing, "jibun_address"])
 
-    merged = pd.concat(frames, ignore_index=True)
+    cols = ["title", "category_normalized", "category_icon", "address", "address_key", "source"]
+    # 검색 결과의 mapx/mapy를 WGS84로 변환해 두면 Geocoding API 호출이 필요 없다
+    if "mapx" in naver.columns and "mapy" in naver.columns:
+        naver["lat"], naver["lng"] = naver_mapxy_to_wgs84(naver["mapx"], naver["mapy"])
+        cols.extend(["lat", "lng"])
+    return naver[cols].rename(columns={"category_normalized": "category"})
 
-    # 중복 제거: 매장명 정규화 후 비교
-    merged["_title_norm"] = merged["title"].str.replace(r"\s+", "", regex=True).str.lower()
-    merged = merged.drop_duplicates(subset=["_title_norm", "address"], keep="first")
-    merged = merged.drop(columns=["_title_norm"]).reset_index(drop=True)
 
-    return merged
+def normalize_google_places(google_df: pd.DataFrame) -> pd.DataFrame:
+    """구글 매장 데이터를 통합 매장 스키마로 정규화한다 (좌표 정보 보존)."""
+    google = google_df.copy(deep=False)
+    google["title"] = google["title"].apply(clean_html_tags)
+    google["category_normalized"] = normalize_categories(google["category"])
+    google["category_icon"] = google["category_normalized"].map(CATEGORY_ICON_MAP).fillna("store")
+    google["address"] = google["address"].apply(normalize_address)
+    google["address_key"] = canonical_keys(google["address"])
+
+    cols = ["title", "category_normalized", "category_icon", "address", "address_key", "source"]
+    if "lat" in google.columns:
+        cols.extend(["lat", "lng"])
+    return google[cols].rename(columns={"category_normalized": "category"})
+
+
+def place_dedupe_keys(places: pd.DataFrame) -> pd.Series:
+    """매장 중복 판정용 정규화 매장명 (공백 제거 + 소문자). 주소와 함께 중복 키로 쓴다."""
+    return places["title"].str.replace(r"\s+", "", regex=True).str.lower()
+
+
+def place_address_keys(places: pd.DataFrame) -> pd.Series:
+    """매장 중복 판정용 주소 키. 정규 주소 키가 있으면 그것을, 없으면 정규화된 주소 문자열을 쓴다."""
+    address = places["address"].fillna("")
+    if "address_key" not in places.columns:
+        return address
+    return places["address_key"].where(places["address_key"].fillna("") != "", address)
+
+
+def building_keys(buildings: pd.DataFrame) -> pd.Series:
+    """
+    건물의 자연 키. 수집부터 DB 적재까지 건물을 식별하는 데 쓴다 (buildings.source_key).
+
+    건축물대장 관리번호(ledger_pk)가 있으면 "pk:<관리번호>",
+    없으면 "addr:<정규 주소 키(없으면 주소)>|<건물명>".
+
+    Args:
+        buildings: 건물 데이터프레임
+
+    Returns:
+        자연 키 시리즈 (같은 인덱스)
+    """
+    def text(column: str) -> pd.Series:
+        if column not in buildings.columns:
+            return pd.Series("", index=buildings.index, dtype=object)
+        return buildings[column].astype(object).where(buildings[column].notna(), "").astype(str)
+
+    address = text("address_key").where(text("address_key") != "", text("address"))
+    keys = "addr:" + address + "|" + text("building_name")
+
+    pk = text("ledger_pk").str.strip()
+    return ("pk:" + pk).where(pk != "", keys).astype(object)
+
+
+def tenant_keys(tenants: pd.DataFrame) -> pd.Series:
+    """
+    매장의 자연 키 "<building_key>|<정규화 매장명>" (floors.source_key).
+    같은 건물에 이름이 같은 매장이 여러 개면 두 번째부터 "#2", "#3" …을 붙인다.
+    건물에 매칭되지 않은 매장은 None.
+
+    Args:
+        tenants: building_key 컬럼이 붙은 매장 데이터프레임
+
+    Returns:
+        자연 키 시리즈 (같은 인덱스)
+    """
+    if tenants.empty or "building_key" not in tenants.columns:
+        return pd.Series(None, index=tenants.index, dtype=object)
+
+    building = tenants["building_key"].astype(object)
+    keys = building + "|" + place_dedupe_keys(tenants).astype(object).fillna("")
+    occurrence = keys.groupby(keys, sort=False, dropna=False).cumcount() + 1
+    keys = keys.where(occurrence == 1, keys + "#" + occurrence.astype(str))
+    return keys.where(building.notna(), None).astype(object)
+
+
+def attach_building_keys(tenants: pd.DataFrame, buildings: pd.DataFrame) -> pd.DataFrame:
+    """매장의 building_idx(건물 프레임 인덱스)로 매칭된 건물의 자연 키를 building_key 컬럼에 붙인다."""
+    tenants = tenants.copy(deep=False)
+    if tenants.empty or buildings.empty or "building_idx" not in tenants.columns:
+        tenants["building_key"] = None
+        return tenants
+
+    keys = buildings["building_key"] if "building_key" in buildings.columns else building_keys(buildings)
+    positions = pd.to_numeric(tenants["building_idx"], errors="coerce").to_numpy()
+    matched = keys.reindex(positions).to_numpy(dtype=object)
+    tenants["building_key"] = pd.Series(matched, index=tenants.index).where(pd.notna(matched), None)
+    return tenants
 
 
 def _match_tenants_to_buildings(
@@ -241,44 +279,37 @@ def _match_tenants_to_buildings(
 ) -> pd.DataFrame:
     """
     매장의 주소를 기반으로 건물에 매칭한다.
-    주소에 건물명이 포함되거나, 주소가 같은 경우 매칭한다.
+    정규 주소 키가 같은 건물에 먼저 매칭하고, 나머지는 주소에 건물명이 포함되거나
+    주소 공통 토큰이 3개 이상이면 매칭한다 (processors.matcher).
     """
-    tenants = tenants.copy()
+    tenants = tenants.copy(deep=False)
     tenants["building_idx"] = None
 
     if buildings.empty or tenants.empty:
-        return tenants
-
-    for idx, building in buildings.iterrows():
-        b_name = str(building.get("building_name", ""))
-        b_addr = str(building.get("address", ""))
+        return attach_building_keys(tenants, buildings)
 
-        if not b_addr:
-            continue
+    addresses = tenants["address"] if "address" in tenants.columns else pd.Series("", index=tenants.index)
+    tenants["building_idx"] = match_addresses(addresses, buildings, keys=tenants.get("address_key"))
+    return attach_building_keys(tenants, buildings)
 
-        # 주소 기반 매칭: 매장 주소에 건물 주소의 핵심 부분이 포함되는지 확인
-        # "서울 강남구 역삼동 xxx" 에서 동 이하를 비교
-        addr_parts = b_addr.split()
-        # 최소 2개 이상의 주소 토큰이 매칭되면 같은 건물로 간주
-        for t_idx, tenant in tenants.iterrows():
-            if tenants.at[t_idx, "building_idx"] is not None:
-                continue  # 이미 매칭된 매장은 건너뜀
 
-            t_addr = str(tenant.get("address", ""))
-            t_title = str(tenant.get("title", ""))
-
-            # 건물명이 매장 주소에 포함
-            if b_name and len(b_name) > 2 and b_name in t_addr:
-                tenants.at[t_idx, "building_idx"] = idx
-                continue
-
-            # 주소 공통 토큰 수 비교
-            if t_addr and b_addr:
-                common_tokens = set(addr_parts) & set(t_addr.split())
-                if len(common_tokens) >= 3:
-                    tenants.at[t_idx, "building_idx"] = idx
+def rematch_tenants_spatially(
+    buildings: pd.DataFrame,
+    tenants: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Geocoding 이후 좌표 근접도로 매장-건물 매칭을 다시 계산한다 (MATCH_MODE="spatial"일 때만).
+    정규 주소 키 매칭은 그대로 두고, 텍스트 매칭은 가까운 후보 사이의 동점 처리와
+    좌표가 없거나 거리 안에 후보 건물이 없는 매장에만 쓰인다.
+    """
+    if MATCH_MODE != "spatial" or tenants.empty:
+        return tenants
 
-    return tenants
+    tenants = tenants.copy(deep=False)
+    tenants["building_idx"] = match_tenants(tenants, buildings, mode="spatial")
+    matched_count = tenants["building_idx"].notna().sum()
+    logger.info(f"좌표 기반 건물 매칭: {matched_count}/{len(tenants)}건 매칭됨")
+    return attach_building_keys(tenants, buildings)
 
 
 def merge(
@@ -0,0 +1,222 @@
+"""
+ScanPang Data Pipeline - 지역 샤드 실행 모듈
+지역 매니페스트의 각 지역을 프로세스 풀에서 독립적으로 수집 → 정제하고,
+지역별 결과를 별도 디렉토리에 저장한 뒤 적재 시점에 합친다.
+
+출력 구조:
+    output/shards/<sigungu_cd>_<bjdong_cd>/  (utils.checkpoint 형식: buildings, tenants)
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import SHARD_OUTPUT_DIR, SHARD_WORKERS
+from utils.checkpoint import has_frames, load_frames, save_frames
+from utils.frames import PROCESS_FRAMES, compact_frames, enable_copy_on_write
+from utils.regions import region_key
+
+logger = logging.getLogger(__name__)
+
+_FRAMES = ("buildings", "tenants")
+
+
+def save_shard(merged: dict, shard_dir: Path) -> None:
+    """정제 결과(buildings, tenants)를 샤드 디렉토리에 저장한다."""
+    save_frames(shard_dir, {name: merged.get(name, pd.DataFrame()) for name in _FRAMES})
+
+
+def load_shard(shard_dir: Path) -> dict:
+    """샤드 디렉토리에서 정제 결과를 읽는다."""
+    return load_frames(shard_dir)
+
+
+def run_region_shard(region: dict, output_dir: str, replay: bool = False, rate_scale: float = 1.0) -> dict:
+    """
+    한 지역의 수집 → 정제(통합 + Geocoding)를 실행하고 결과를 저장한다.
+    프로세스 풀 워커에서 호출된다.
+
+    Args:
+        region: 지역 딕셔너리 (utils.regions 형식)
+        output_dir: 샤드 출력 루트 디렉토리
+        replay: HTTP 캐시 리플레이 모드 여부
+        rate_scale: 이 프로세스에 배분할 프로바이더 쿼터 비율
+
+    Returns:
+        {"region", "key", "buildings", "tenants", "path", "elapsed"} 요약
+    """
+    from collectors.engine import collect
+    from processors.geocoder import geocode
+    from processors.merger import merge, rematch_tenants_spatially
+    from utils.http_cache import set_replay_mode
+    from utils.http_session import close_sessions
+    from utils.memory import track_memory
+    from utils.rate_limiter import set_rate_scale
+
+    start_time = time.time()
+    enable_copy_on_write()
+    set_rate_scale(rate_scale)
+    if replay:
+        set_replay_mode(True)
+
+    try:
+        with track_memory(f"shard {region['name']}"):
+            buildings_df, naver_df, google_df = collect(region)
+            merged = merge(buildings_df, naver_df, google_df)
+            merged["buildings"], merged["tenants"] = geocode(merged["buildings"], merged["tenants"])
+            merged["tenants"] = rematch_tenants_spatially(merged["buildings"], merged["tenants"])
+            merged = compact_frames(merged, PROCESS_FRAMES)
+    finally:
+        close_sessions()
+
+    shard_dir = Path(output_dir) / region_key(region)
+    save_shard(merged, shard_dir)
+
+    return {
+        "region": region["name"],
+        "key": region_key(region),
+        "buildings": len(merged["buildings"]),
+        "tenants": len(merged["tenants"]),
+        "path": str(shard_dir),
+        "elapsed": time.time() - start_time,
+    }
+
+
+def run_shards(
+    regions: list[dict],
+    workers: int = SHARD_WORKERS,
+    replay: bool = False,
+    output_dir: Path = SHARD_OUTPUT_DIR,
+) -> list[dict]:
+    """
+    지역별 샤드를 프로세스 풀에서 병렬 실행한다.
+
+    프로바이더 쿼터는 프로세스 간에 공유되지 않으므로, 동시에 도는 워커 수로
+    나눈 비율(1/N)만큼씩 각 워커의 레이트 리미터에 배분한다.
+
+    Args:
+        regions: 지역 리스트
+        workers: 최대 프로세스 수
+        replay: HTTP 캐시 리플레이 모드 여부
+        output_dir: 샤드 출력 루트 디렉토리
+
+    Returns:
+        성공한 샤드의 요약 리스트 (매니페스트 순서)
+    """
+    if not regions:
+        logger.warning("실행할 지역이 없습니다.")
+        return []
+
+    workers = max(1, min(workers, len(regions)))
+    rate_scale = 1.0 / workers
+    logger.info(f"샤드 실행: {len(regions)}개 지역, 프로세스 {workers}개 (프로세스당 쿼터 {rate_scale:.2f})")
+
+    summaries: dict[str, dict] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_region_shard, region, str(output_dir), replay, rate_scale): region
+            for region in regions
+        }
+        for future in as_completed(futures):
+            region = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                logger.error(f"샤드 실패 [{region['name']}]: {e}", exc_info=True)
+                continue
+            summaries[summary["key"]] = summary
+            logger.info(
+                f"샤드 완료 [{summary['region']}]: 건물 {summary['buildings']}건, "
+                f"매장 {summary['tenants']}건 ({summary['elapsed']:.1f}초)"
+            )
+
+    failed = len(regions) - len(summaries)
+    if failed:
+        logger.warning(f"샤드 {failed}개 실패. 실패한 지역은 적재에서 제외됩니다.")
+
+    return [summaries[region_key(r)] for r in regions if region_key(r) in summaries]
+
+
+def combine_shards(
+    regions: list[dict],
+    output_dir: Path = SHARD_OUTPUT_DIR,
+) -> dict:
+    """
+    지역별 샤드 결과를 하나의 merged 딕셔너리로 합친다.
+    매장의 building_idx는 합쳐진 buildings 프레임 기준으로 다시 계산한다.
+    이웃 지역의 검색 범위가 겹쳐 두 샤드에 함께 들어온 건물(같은 building_key)과 매장
+    (단일 지역 정제와 같은 dedupe_places)은 먼저 나온 지역의 행 하나만 남긴다.
+
+    Args:
+        regions: 합칠 지역 리스트 (출력이 없는 지역은 건너뜀)
+        output_dir: 샤드 출력 루트 디렉토리
+
+    Returns:
+        {"buildings": pd.DataFrame, "tenants": pd.DataFrame}
+    """
+    building_frames = []
+    tenant_frames = []
+    offset = 0
+
+    for region in regions:
+        shard_dir = Path(output_dir) / region_key(region)
+        if not has_frames(shard_dir):
+            logger.warning(f"샤드 출력 없음 [{region['name']}]: {shard_dir}")
+            continue
+
+        shard = load_shard(shard_dir)
+        buildings = shard["buildings"].reset_index(drop=True)
+        tenants = shard["tenants"].copy(deep=False)
+
+        if "building_idx" in tenants.columns:
+            tenants["building_idx"] = tenants["building_idx"].map(
+                lambda idx: None if idx is None or pd.isna(idx) else int(idx) + offset
+            ).astype(object)
+
+        building_frames.append(buildings)
+        tenant_frames.append(tenants)
+        offset += len(buildings)
+
+    buildings_df = pd.concat(building_frames, ignore_index=True) if building_frames else pd.DataFrame()
+    tenants_df = pd.concat(tenant_frames, ignore_index=True) if tenant_frames else pd.DataFrame()
+    buildings_df, tenants_df = _dedupe_across_shards(buildings_df, tenants_df)
+    logger.info(f"샤드 통합: {len(building_frames)}개 지역, 건물 {len(buildings_df)}건, 매장 {len(tenants_df)}건")
+
+    # 지역마다 카테고리 집합이 달라 concat 결과가 object로 풀린 컬럼을 다시 압축한다
+    return compact_frames({"buildings": buildings_df, "tenants": tenants_df}, PROCESS_FRAMES)
+
+
+def _dedupe_across_shards(buildings: pd.DataFrame, tenants: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """합친 프레임에서 샤드 간 중복 건물/매장을 지우고 매장의 building_idx를 남은 건물 기준으로 옮긴다."""
+    from processors.merger import attach_building_keys, building_keys, dedupe_places
+
+    if not buildings.empty:
+        keys = buildings["building_key"] if "building_key" in buildings.columns else building_keys(buildings)
+        keys = keys.astype(object).to_numpy()
+        keep = ~pd.Series(keys).duplicated(keep="first").to_numpy()
+        # 각 행 → 같은 키의 첫 행 → 중복 제거 후 위치
+        first_pos = pd.Series(np.flatnonzero(keep), index=keys[keep])
+        new_pos = (np.cumsum(keep) - 1)[first_pos.loc[keys].to_numpy()]
+        buildings = buildings[keep].reset_index(drop=True)
+
+        if not tenants.empty and "building_idx" in tenants.columns:
+            old = pd.to_numeric(tenants["building_idx"], errors="coerce")
+            matched = old.notna().to_numpy()
+            remapped = np.full(len(tenants), None, dtype=object)
+            remapped[matched] = new_pos[old[matched].astype("int64").to_numpy()].tolist()
+            tenants = tenants.copy(deep=False)
+            tenants["building_idx"] = remapped
+
+    if not tenants.empty:
+        before = len(tenants)
+        tenants = dedupe_places(tenants)
+        if "building_idx" in tenants.columns:
+            tenants = attach_building_keys(tenants, buildings)
+        if len(tenants) < before:
+            logger.info(f"샤드 간 중복 매장 {before - len(tenants)}건 제거")
+
+    return buildings, tenants
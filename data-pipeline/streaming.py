@@ -0,0 +1,344 @@
+"""
+ScanPang Data Pipeline - 스트리밍 실행 모듈
+수집 → 정규화 → Geocoding → 매칭 → DB 적재를 마이크로 배치 단위로 흘려보낸다.
+
+각 단계는 별도 스레드에서 돌고, 단계 사이는 크기가 제한된 큐(STREAM_QUEUE_SIZE)로
+연결되어 있어 느린 단계가 있으면 앞 단계가 자동으로 멈춘다(backpressure).
+네트워크(API), CPU(정규화/매칭), DB 작업이 서로 겹쳐 실행되며,
+지역은 하나씩 처리하고 끝난 지역의 데이터는 버리므로 지역 수가 늘어도
+최대 메모리는 한 지역 분량으로 유지된다.
+
+단계 구성 (지역 하나 기준):
+
+    건축물대장 페이지 ─▶ 건물 정제 ─┬─▶ 건물 Geocoding ─▶ ┐
+                                    └─▶ (네이버 건물 검색 대상)  │
+    네이버 검색 ─┐                                              ├─▶ DB 적재
+    Google 검색 ─┴─▶ 매장 정규화 ─▶ 매장 Geocoding ─▶ 매장 매칭 ─▶ ┘
+
+매장 매칭은 건물 좌표(MATCH_MODE=spatial)와 주소를 함께 쓰므로 지역의 건물 목록이
+모두 Geocoding된 뒤 시작한다.
+DB 적재는 건물 배치를 먼저 모두 적재해 building_id를 확보한 다음 매장 배치를 적재하며,
+배치마다 커밋한다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterable
+
+import pandas as pd
+
+from config import STREAM_BATCH_SIZE, STREAM_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class StreamAborted(Exception):
+    """다른 단계의 오류로 스트림이 중단되었을 때 발생한다."""
+
+
+class _Stream:
+    """한 지역 스트림의 큐/스레드/오류 상태를 관리한다."""
+
+    def __init__(self, queue_size: int = STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.abort = threading.Event()
+        self.errors: list[BaseException] = []
+        self._threads: list[threading.Thread] = []
+
+    def new_queue(self) -> queue.Queue:
+        return queue.Queue(maxsize=self.queue_size)
+
+    def put(self, q: queue.Queue, item) -> None:
+        """큐가 가득 차면 대기한다. 다른 단계가 실패하면 StreamAborted를 던진다."""
+        while True:
+            if self.abort.is_set():
+                raise StreamAborted()
+            try:
+                q.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def get(self, q: queue.Queue):
+        while True:
+            if self.abort.is_set():
+                raise StreamAborted()
+            try:
+                return q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def consume(self, q: queue.Queue, producers: int = 1) -> Iterable:
+        """producers개의 생산자가 모두 종료 신호를 보낼 때까지 큐의 배치를 내보낸다."""
+        remaining = producers
+        while remaining:
+            item = self.get(q)
+            if item is _DONE:
+                remaining -= 1
+                continue
+            yield item
+
+    def spawn(self, name: str, target: Callable, outputs: tuple = ()) -> None:
+        """단계 스레드를 시작한다. 종료(정상/오류) 시 outputs 큐에 종료 신호를 보낸다."""
+
+        def _run():
+            try:
+                target()
+            except StreamAborted:
+                pass
+            except BaseException as e:
+                logger.error(f"스트림 단계 실패 [{name}]: {e}", exc_info=True)
+                self.errors.append(e)
+                self.abort.set()
+            finally:
+                for q in outputs:
+                    try:
+                        self.put(q, _DONE)
+                    except StreamAborted:
+                        pass
+
+        thread = threading.Thread(target=_run, name=f"stream-{name}", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+        if self.errors:
+            raise self.errors[0]
+
+
+def _batches(df: pd.DataFrame, size: int) -> Iterable[pd.DataFrame]:
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+def _drop_seen_buildings(batch: pd.DataFrame, seen_names: set, seen_keys: set) -> pd.DataFrame:
+    """
+    정제된 건물 배치에서 앞 배치에 이미 나온 건물을 지운다.
+    배치 모드(merger._process_buildings)와 같이 건물명+주소와 자연 키 두 기준으로 보며,
+    이번 배치의 값은 seen_names/seen_keys에 더한다.
+    """
+    names = list(zip(_nullable(batch, "building_name"), _nullable(batch, "address")))
+    keep = [name not in seen_names and key not in seen_keys for name, key in zip(names, batch["building_key"])]
+    seen_names.update(names)
+    seen_keys.update(batch["building_key"])
+    return batch[keep]
+
+
+def _nullable(df: pd.DataFrame, column: str) -> list:
+    """컬럼 값 리스트 (결측은 None으로 통일해 drop_duplicates처럼 서로 같게 본다)."""
+    if column not in df.columns:
+        return [None] * len(df)
+    values = df[column].astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+def stream_region(region: dict, conn, batch_size: int = STREAM_BATCH_SIZE) -> dict:
+    """
+    한 지역을 스트리밍 방식으로 수집부터 적재까지 처리한다.
+
+    Args:
+        region: 지역 딕셔너리 (utils.regions 형식)
+        conn: psycopg2 연결 객체 (DB 적재 단계 전용)
+        batch_size: 매장 마이크로 배치 크기
+
+    Returns:
+        테이블별 적재 건수 딕셔너리
+    """
+    from collectors import building_ledger, google_places, naver_places
+    from loaders import db_loader
+    from processors import geocoder, matcher, merger
+
+    stream = _Stream()
+    counts = {
+        "buildings": 0, "buildings_updated": 0, "floors": 0, "floors_updated": 0, "floors_deleted": 0,
+        "facilities": 0, "building_stats": 0, "live_feeds": 0,
+    }
+
+    ledger_q = stream.new_queue()
+    building_geo_q = stream.new_queue()
+    building_db_q = stream.new_queue()
+    naver_target_q: queue.Queue = queue.Queue()   # 최대 MAX_BUILDING_TARGETS개라 제한 불필요
+    raw_place_q = stream.new_queue()
+    place_geo_q = stream.new_queue()
+    place_match_q = stream.new_queue()
+    place_db_q = stream.new_queue()
+
+    buildings_ready = threading.Event()
+    region_buildings: list[pd.DataFrame] = []
+
+    # ── 건물 흐름 ──
+    def ledger_source():
+        seen_pks = set()
+        for page in building_ledger.iter_ledger_pages(region["sigungu_cd"], region["bjdong_cd"]):
+            new_items = [i for i in page if not i.get("mgmBldrgstPk") or i["mgmBldrgstPk"] not in seen_pks]
+            seen_pks.update(i.get("mgmBldrgstPk") for i in new_items)
+            if new_items:
+                stream.put(ledger_q, building_ledger.parse_building_ledger(pd.DataFrame(new_items)))
+
+    def building_clean():
+        seen_names = set()
+        seen_keys = set()
+        offset = 0
+        targets = 0
+        try:
+            for batch in stream.consume(ledger_q):
+                batch = _drop_seen_buildings(merger._process_buildings(batch), seen_names, seen_keys)
+                if batch.empty:
+                    continue
+
+                # 지역 내 전체 건물 순서 기준 인덱스 (매장의 building_idx)
+                batch.index = range(offset, offset + len(batch))
+                offset += len(batch)
+
+                for name in naver_places.select_building_targets(batch):
+                    if targets >= naver_places.MAX_BUILDING_TARGETS:
+                        break
+                    naver_target_q.put(name)
+                    targets += 1
+
+                stream.put(building_geo_q, batch)
+        finally:
+            naver_target_q.put(_DONE)
+
+    def building_geocode():
+        try:
+            for batch in stream.consume(building_geo_q):
+                batch = geocoder.geocode_buildings(batch)
+                region_buildings.append(batch)
+                stream.put(building_db_q, batch)
+        finally:
+            buildings_ready.set()
+
+    # ── 매장 흐름 ──
+    def naver_source():
+        while True:
+            name = naver_target_q.get()
+            if name is _DONE:
+                break
+            places = naver_places.search_around(name)
+            if places:
+                stream.put(raw_place_q, ("naver", pd.DataFrame(places)))
+        for base_query in region["base_queries"]:
+            places = naver_places.search_around(base_query)
+            if places:
+                stream.put(raw_place_q, ("naver", pd.DataFrame(places)))
+
+    def google_source():
+        google_df = google_places.collect(region["center_lat"], region["center_lng"], region["radius_m"])
+        for batch in _batches(google_df, batch_size):
+            stream.put(raw_place_q, ("google", batch))
+
+    def place_normalize():
+        seen_keys = set()
+        for source, batch in stream.consume(raw_place_q, producers=2):
+            if source == "naver":
+                batch = batch.drop_duplicates(subset=["title", "road_address"], keep="first")
+                batch = merger.normalize_naver_places(batch)
+            else:
+                batch = merger.normalize_google_places(batch)
+
+            keys = list(zip(merger.place_dedupe_keys(batch), merger.place_address_keys(batch)))
+            keep = []
+            for key in keys:
+                keep.append(key not in seen_keys)
+                seen_keys.add(key)
+            batch = batch[keep].reset_index(drop=True)
+            if not batch.empty:
+                stream.put(place_geo_q, batch)
+
+    def place_geocode():
+        for batch in stream.consume(place_geo_q):
+            stream.put(place_match_q, geocoder.geocode_tenants(batch))
+
+    def place_match():
+        buildings = None
+        for batch in stream.consume(place_match_q):
+            if buildings is None:
+                # 지역 건물 목록이 모두 Geocoding될 때까지 대기 (이 동안 앞 단계는 큐가 차면 멈춘다)
+                while not buildings_ready.wait(timeout=0.5):
+                    if stream.abort.is_set():
+                        raise StreamAborted()
+                buildings = pd.concat(region_buildings) if region_buildings else pd.DataFrame()
+            batch = batch.copy(deep=False)
+            batch["building_idx"] = matcher.match_tenants(batch, buildings)
+            stream.put(place_db_q, merger.attach_building_keys(batch, buildings))
+
+    # ── DB 적재 ──
+    def db_sink():
+        key_ids: list[pd.Series] = []
+        for batch in stream.consume(building_db_q):
+            result = db_loader.load_buildings(conn, batch)
+            key_ids.append(result["key_ids"])
+            counts["buildings"] += result["inserted"]
+            counts["buildings_updated"] += result["updated"]
+            counts["facilities"] += db_loader.load_facilities(conn, result["new_ids"])
+            counts["building_stats"] += db_loader.load_building_stats(conn, result["new_ids"])
+            counts["building_stats"] += db_loader.load_building_stats(conn, result["changed_ids"], replace=True)
+            counts["live_feeds"] += db_loader.load_live_feeds(conn, result["new_ids"])
+            conn.commit()
+
+        building_ids = pd.concat(key_ids) if key_ids else pd.Series(dtype="int64")
+        tenant_keys: list[str] = []
+        for batch in stream.consume(place_db_q):
+            result = db_loader.load_floors(conn, batch, building_ids)
+            counts["floors"] += result["inserted"]
+            counts["floors_updated"] += result["updated"]
+            tenant_keys.extend(result["keys"])
+            conn.commit()
+
+        # 지역의 매장이 모두 적재된 뒤에 사라진 매장을 지운다
+        counts["floors_deleted"] += db_loader.prune_floors(conn, building_ids.tolist(), tenant_keys)
+        conn.commit()
+
+    stream.spawn("ledger", ledger_source, outputs=(ledger_q,))
+    stream.spawn("building-clean", building_clean, outputs=(building_geo_q,))
+    stream.spawn("building-geocode", building_geocode, outputs=(building_db_q,))
+    stream.spawn("naver", naver_source, outputs=(raw_place_q,))
+    stream.spawn("google", google_source, outputs=(raw_place_q,))
+    stream.spawn("place-normalize", place_normalize, outputs=(place_geo_q,))
+    stream.spawn("place-geocode", place_geocode, outputs=(place_match_q,))
+    stream.spawn("place-match", place_match, outputs=(place_db_q,))
+    stream.spawn("db", db_sink)
+    stream.join()
+
+    return counts
+
+
+def run_streaming(regions: list[dict], batch_size: int = STREAM_BATCH_SIZE) -> dict:
+    """
+    지역 목록을 하나씩 스트리밍 처리한다. DB 연결은 전체 실행 동안 하나를 사용한다.
+
+    Args:
+        regions: 지역 리스트
+        batch_size: 매장 마이크로 배치 크기
+
+    Returns:
+        테이블별 누적 적재 건수 딕셔너리 (연결 실패 시 {"error": ...})
+    """
+    from loaders.db_loader import get_connection
+
+    try:
+        conn = get_connection()
+    except Exception as e:
+        logger.error(f"DB 연결 실패: {e}")
+        return {"error": str(e)}
+
+    totals: dict[str, int] = {}
+    try:
+        for region in regions:
+            start_time = time.time()
+            logger.info(f"=== 스트리밍 처리 시작 [{region['name']}] ===")
+            counts = stream_region(region, conn, batch_size)
+            for table, count in counts.items():
+                totals[table] = totals.get(table, 0) + count
+            logger.info(f"=== 스트리밍 처리 완료 [{region['name']}]: {counts} ({time.time() - start_time:.1f}초) ===")
+    finally:
+        conn.close()
+
+    return totals
@@ -0,0 +1,6 @@
+"""data-pipeline 모듈을 실행 위치와 상관없이 `from config import ...` 형태로 불러올 수 있게 한다."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,39 @@
+"""건축물대장 수집 모듈 테스트."""
+
+import json
+
+from collectors.building_ledger import _is_cacheable
+from utils.http_cache import CachedResponse
+
+
+def _response(text: str, content_type: str) -> CachedResponse:
+    return CachedResponse("http://apis.data.go.kr/test", 200, {"content-type": content_type}, text)
+
+
+def _json_response(payload: dict) -> CachedResponse:
+    return _response(json.dumps(payload), "application/json;charset=UTF-8")
+
+
+def test_caches_normal_json_page():
+    assert _is_cacheable(_json_response({"response": {
+        "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+        "body": {"items": "", "totalCount": 0},
+    }}))
+
+
+def test_does_not_cache_json_error_code_or_missing_body():
+    assert not _is_cacheable(_json_response({"response": {
+        "header": {"resultCode": "22", "resultMsg": "LIMITED NUMBER OF SERVICE REQUESTS EXCEEDS ERROR."},
+    }}))
+    assert not _is_cacheable(_json_response({"response": {"header": {"resultCode": "00"}}}))
+
+
+def test_xml_responses():
+    ok = "<response><header><resultCode>00</resultCode></header><body><totalCount>0</totalCount></body></response>"
+    quota = (
+        "<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+        "<returnReasonCode>22</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+    )
+    assert _is_cacheable(_response(ok, "text/xml;charset=UTF-8"))
+    assert not _is_cacheable(_response(quota, "text/xml;charset=UTF-8"))
+    assert not _is_cacheable(_response("Unexpected errors", "text/plain"))
@@ -0,0 +1,33 @@
+"""단계별 체크포인트 저장/로드 테스트."""
+
+import pandas as pd
+
+from utils.checkpoint import has_stage, load_stage, save_stage
+
+
+def test_round_trip_returns_writable_frames(tmp_path):
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"], "lat": [37.5, None, 37.6]})
+    save_stage("collect", {"buildings": df}, root=tmp_path)
+
+    loaded = load_stage("collect", root=tmp_path)["buildings"]
+    pd.testing.assert_frame_equal(loaded, df)
+    # 이후 단계는 읽은 프레임을 제자리에서 수정한다
+    loaded.loc[0, "id"] = 10
+    assert loaded.loc[0, "id"] == 10
+
+
+def test_saving_a_stage_drops_later_stages(tmp_path):
+    save_stage("collect", {"buildings": pd.DataFrame({"id": [1]})}, root=tmp_path)
+    save_stage("process", {"buildings": pd.DataFrame({"id": [1]})}, root=tmp_path)
+    assert has_stage("process", root=tmp_path)
+
+    # 새로 수집하면 이전 실행의 정제 결과로 --resume 하지 않는다
+    save_stage("collect", {"buildings": pd.DataFrame({"id": [2]})}, root=tmp_path)
+    assert has_stage("collect", root=tmp_path)
+    assert not has_stage("process", root=tmp_path)
+
+
+def test_saving_last_stage_keeps_earlier_stages(tmp_path):
+    save_stage("collect", {"buildings": pd.DataFrame({"id": [1]})}, root=tmp_path)
+    save_stage("process", {"buildings": pd.DataFrame({"id": [1]})}, root=tmp_path)
+    assert has_stage("collect", root=tmp_path)
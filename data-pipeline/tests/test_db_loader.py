@@ -0,0 +1,211 @@
+"""DB 적재 모듈 테스트 (DB 없이 가짜 커서 사용)."""
+
+import pandas as pd
+
+from loaders.db_loader import (
+    _adopt_legacy_buildings,
+    _stale_stage_tables,
+    load_buildings,
+    load_floors,
+    prune_floors,
+)
+
+
+class _FakeCursor:
+    """
+    고정 rows를 돌려주는 가짜 커서. respond가 있으면 (공백 정리된 SQL, params)로 rows를 계산한다.
+    실행한 (SQL, params)는 executed에 남는다.
+    """
+
+    def __init__(self, rows=None, respond=None):
+        self.rows = rows if rows is not None else []
+        self.respond = respond
+        self.params = None
+        self.executed = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.params = params
+        self.executed.append((sql, params))
+        if self.respond is not None:
+            self.rows = self.respond(sql, params)
+
+    def fetchall(self):
+        return self.rows
+
+
+class _FakeConn:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+class _FakeDB:
+    """
+    buildings/floors의 (source_key → id, content_hash)만 흉내 내는 가짜 DB.
+    스테이징 함수(stager)로 받은 프레임을 INSERT … SELECT 시점에 반영한다.
+    """
+
+    def __init__(self):
+        self.buildings: dict[str, tuple[int, int]] = {}
+        self.floors: dict[str, int] = {}
+        self.staged: dict[str, pd.DataFrame] = {}
+
+    def stager(self, cur, table, columns, df):
+        self.staged[table] = df.copy()
+        return table
+
+    def connect(self):
+        self.staged = {}
+        return _FakeConn(_FakeCursor(respond=self.respond))
+
+    def respond(self, sql, params):
+        if sql.startswith("SELECT source_key, id, content_hash FROM buildings"):
+            return [(k, *self.buildings[k]) for k in params[0] if k in self.buildings]
+        if sql.startswith("SELECT source_key, content_hash FROM floors"):
+            return [(k, self.floors[k]) for k in params[0] if k in self.floors]
+        if sql.startswith("INSERT INTO buildings"):
+            rows = []
+            for key, content_hash in self.staged["_stage_buildings"][["source_key", "content_hash"]].itertuples(
+                index=False
+            ):
+                building_id = self.buildings.get(key, (len(self.buildings) + 1, None))[0]
+                self.buildings[key] = (building_id, content_hash)
+                rows.append((building_id, key))
+            return rows
+        if sql.startswith("INSERT INTO floors"):
+            for key, content_hash in self.staged["_stage_floors"][["source_key", "content_hash"]].itertuples(
+                index=False
+            ):
+                self.floors[key] = content_hash
+        return []
+
+
+def _ledger_buildings(floors=(10, 5)):
+    return pd.DataFrame({
+        "building_name": ["A빌딩", "B빌딩"],
+        "address": ["서울 강남구 테헤란로 1", "서울 강남구 테헤란로 2"],
+        "ground_floors": list(floors),
+        "building_key": ["pk:1", "pk:2"],
+    })
+
+
+def _tenants(titles_by_building):
+    rows = [(title, key) for key, titles in titles_by_building.items() for title in titles]
+    return pd.DataFrame({
+        "title": [title for title, _ in rows],
+        "category": "카페",
+        "category_icon": "local_cafe",
+        "building_key": [key for _, key in rows],
+    })
+
+
+def test_adopt_legacy_buildings_skips_ambiguous_name_and_address():
+    candidates = pd.DataFrame({
+        "source_key": ["pk:1", "pk:2", "pk:3"],
+        "name": ["A빌딩", "B빌딩", "B빌딩"],
+        "address": ["테헤란로 1", "테헤란로 2", "테헤란로 2"],
+    })
+    cur = _FakeCursor([("pk:1", 7)])
+
+    adopted = _adopt_legacy_buildings(cur, candidates)
+
+    # 같은 건물명+주소의 키가 둘인 B빌딩은 어느 예전 행인지 알 수 없으므로 보내지 않는다
+    assert cur.params == (["pk:1"], ["A빌딩"], ["테헤란로 1"])
+    assert adopted.to_dict("records") == [{"source_key": "pk:1", "id": 7, "content_hash": None}]
+
+
+def test_adopt_legacy_buildings_without_candidates_skips_query():
+    cur = _FakeCursor([])
+    adopted = _adopt_legacy_buildings(cur, pd.DataFrame(columns=["source_key", "name", "address"]))
+    assert cur.params is None
+    assert adopted.empty
+
+
+def test_stale_stage_tables_by_run_timestamp():
+    names = [
+        "stage_buildings_1700000000_0a1b2c3d",   # 오래된 실행
+        "stage_floors_1700000000_0a1b2c3d",
+        "stage_buildings_1800000000_99aabbcc",   # 동시에 도는 최근 실행
+        "manual_table",                          # 스테이징 이름 형식이 아님
+    ]
+    assert _stale_stage_tables(names, cutoff=1750000000) == names[:2]
+
+
+def test_load_buildings_first_run_inserts_in_input_order():
+    db = _FakeDB()
+
+    result = load_buildings(db.connect(), _ledger_buildings(), stager=db.stager)
+
+    assert result["inserted"] == 2 and result["updated"] == 0
+    assert result["key_ids"].index.tolist() == ["pk:1", "pk:2"]
+    assert result["new_ids"] == result["key_ids"].tolist() == [1, 2]
+    assert result["changed_ids"] == []
+
+
+def test_load_buildings_unchanged_rerun_stages_nothing():
+    db = _FakeDB()
+    first = load_buildings(db.connect(), _ledger_buildings(), stager=db.stager)
+
+    conn = db.connect()
+    result = load_buildings(conn, _ledger_buildings(), stager=db.stager)
+
+    assert db.staged == {}
+    assert not any(sql.startswith("INSERT") for sql, _ in conn.cursor().executed)
+    assert result["inserted"] == result["updated"] == 0
+    assert result["key_ids"].tolist() == first["key_ids"].tolist()
+    assert result["new_ids"] == result["changed_ids"] == []
+
+
+def test_load_buildings_changed_row_is_upserted():
+    db = _FakeDB()
+    load_buildings(db.connect(), _ledger_buildings(), stager=db.stager)
+
+    result = load_buildings(db.connect(), _ledger_buildings(floors=(10, 6)), stager=db.stager)
+
+    assert db.staged["_stage_buildings"]["source_key"].tolist() == ["pk:2"]
+    assert result["inserted"] == 0 and result["updated"] == 1
+    assert result["changed_ids"] == [2]
+    assert result["new_ids"] == []
+
+
+def test_load_floors_maps_tenant_keys_to_building_ids_and_skips_unchanged():
+    db = _FakeDB()
+    building_ids = pd.Series([11, 12], index=pd.Index(["pk:1", "pk:2"], name="building_key"))
+    tenants = _tenants({"pk:1": ["스타벅스", "스타벅스"], "pk:2": ["이디야"]})
+    tenants.loc[len(tenants)] = ["미매칭 매장", "카페", "local_cafe", None]
+
+    result = load_floors(db.connect(), tenants, building_ids, stager=db.stager)
+
+    staged = db.staged["_stage_floors"]
+    assert staged["source_key"].tolist() == ["pk:1|스타벅스", "pk:1|스타벅스#2", "pk:2|이디야"]
+    assert staged["building_id"].tolist() == [11, 11, 12]
+    assert result["inserted"] == 3 and result["keys"] == staged["source_key"].tolist()
+
+    rerun = load_floors(db.connect(), tenants, building_ids, stager=db.stager)
+    assert db.staged == {}
+    assert rerun["inserted"] == rerun["updated"] == 0
+
+
+def test_prune_floors_gets_keys_without_missing_tenant():
+    db = _FakeDB()
+    building_ids = pd.Series([11, 12], index=pd.Index(["pk:1", "pk:2"], name="building_key"))
+    load_floors(db.connect(), _tenants({"pk:1": ["스타벅스"], "pk:2": ["이디야"]}), building_ids, stager=db.stager)
+
+    # 이디야가 폐업해 이번 수집에는 없다
+    result = load_floors(db.connect(), _tenants({"pk:1": ["스타벅스"]}), building_ids, stager=db.stager)
+    cur = _FakeCursor()
+    prune_floors(_FakeConn(cur), building_ids.tolist(), result["keys"])
+
+    sql, params = cur.executed[0]
+    assert sql.startswith("DELETE FROM floors")
+    assert params == ([11, 12], ["pk:1|스타벅스"])
+
+
+def test_prune_floors_skips_empty_keep_list():
+    cur = _FakeCursor()
+    assert prune_floors(_FakeConn(cur), [11, 12], []) == 0
+    assert cur.executed == []
@@ -0,0 +1,91 @@
+"""매장 엔티티 해소(MinHash-LSH 블로킹 + 유사도/거리 판정) 테스트."""
+
+import numpy as np
+import pandas as pd
+
+from processors.entity_resolution import _bigrams, _jaccard, resolve_duplicate_places
+
+
+def _places(rows):
+    return pd.DataFrame(rows, columns=["title", "address", "lat", "lng"])
+
+
+def test_bigrams_and_jaccard():
+    assert _bigrams("스타 벅스") == {"스타", "타벅", "벅스"}
+    assert _bigrams("A") == {"a"}
+    assert _bigrams(None) == set()
+    assert _jaccard(_bigrams("스타벅스"), _bigrams("스타벅스")) == 1.0
+    assert _jaccard(set(), _bigrams("스타벅스")) == 0.0
+
+
+def test_merges_same_place_written_differently():
+    merged = resolve_duplicate_places(_places([
+        ["스타벅스 강남파이낸스점", "서울 강남구 테헤란로 152", 37.50000, 127.03600],
+        ["스타벅스강남파이낸스점", "강남구 테헤란로 152", 37.50005, 127.03602],
+        ["이디야커피 역삼점", "서울 강남구 논현로 1", 37.49000, 127.03000],
+    ]))
+    assert merged["title"].tolist() == ["스타벅스 강남파이낸스점", "이디야커피 역삼점"]
+
+
+def test_keeps_same_name_far_apart():
+    merged = resolve_duplicate_places(_places([
+        ["스타벅스 강남파이낸스점", None, 37.500, 127.036],
+        ["스타벅스 강남파이낸스점", None, 37.510, 127.036],   # 약 1.1km
+    ]))
+    assert len(merged) == 2
+
+
+def test_never_merges_place_without_coordinates_into_located_place():
+    merged = resolve_duplicate_places(_places([
+        ["스타벅스 강남파이낸스점", "서울 강남구 테헤란로 152", 37.5, 127.036],
+        ["스타벅스 강남파이낸스점", "강남구 테헤란로 152", np.nan, np.nan],
+    ]))
+    assert len(merged) == 2
+
+
+def test_keeps_same_name_branches_at_different_addresses():
+    merged = resolve_duplicate_places(_places([
+        ["파리바게뜨", "서울 강남구 테헤란로 1", np.nan, np.nan],
+        ["파리바게뜨", "서울 강남구 논현로 99", np.nan, np.nan],
+        ["파리바게뜨", "서울 송파구 올림픽로 300", 37.5, 127.1],
+        ["파리바게뜨", "서울 송파구 올림픽로 1", 37.52, 127.1],      # 약 2.2km
+    ]))
+    assert merged["address"].tolist() == [
+        "서울 강남구 테헤란로 1", "서울 강남구 논현로 99", "서울 송파구 올림픽로 300", "서울 송파구 올림픽로 1",
+    ]
+    # 행 값이 섞이지 않는다
+    assert merged["lat"].isna().tolist() == [True, True, False, False]
+
+
+def test_merges_places_without_coordinates_by_address_key():
+    places = _places([
+        ["파리바게뜨 역삼점", "서울 강남구 테헤란로 1", np.nan, np.nan],
+        ["파리바게뜨역삼점", "강남구 테헤란로 1 1층", np.nan, np.nan],
+        ["파리바게뜨 역삼점", "서울 강남구 논현로 99", np.nan, np.nan],
+    ])
+    places["address_key"] = ["강남구 테헤란로 1", "강남구 테헤란로 1", "강남구 논현로 99"]
+
+    merged = resolve_duplicate_places(places)
+
+    assert merged["address"].tolist() == ["서울 강남구 테헤란로 1", "서울 강남구 논현로 99"]
+
+
+def test_merged_group_keeps_one_representative_row():
+    merged = resolve_duplicate_places(pd.DataFrame({
+        "title": ["스타벅스 강남파이낸스점", "스타벅스강남파이낸스점"],
+        "address": [None, "강남구 테헤란로 152"],
+        "lat": [37.50000, 37.50005],
+        "lng": [127.03600, 127.03602],
+    }))
+    assert len(merged) == 1
+    assert pd.isna(merged.loc[0, "address"])
+    assert merged.loc[0, "lat"] == 37.5
+
+
+def test_places_without_coordinates_need_high_similarity():
+    merged = resolve_duplicate_places(_places([
+        ["스타벅스 강남파이낸스점", None, np.nan, np.nan],
+        ["스타벅스 강남파이낸스점", None, np.nan, np.nan],
+        ["스타벅스 강남역점", None, np.nan, np.nan],
+    ]))
+    assert merged["title"].tolist() == ["스타벅스 강남파이낸스점", "스타벅스 강남역점"]
@@ -0,0 +1,74 @@
+"""Google Nearby Search 적응형 타일링 스케줄러 테스트 (네트워크 없이 가짜 응답 사용)."""
+
+from collectors import google_places
+from collectors.google_places import _is_saturated, search_types
+
+LAT, LNG = 37.4979, 127.0276
+
+
+def _fake_fetch(full_locations: set):
+    """
+    full_locations에 있는 검색 중심은 Google처럼 20건씩 3페이지(3페이지에는 토큰 없음)를,
+    나머지는 결과 1건짜리 페이지 하나를 돌려주는 가짜 _fetch_nearby_page.
+    """
+    calls = []
+
+    def fetch(params, place_type, page_no):
+        location = params["location"]
+        calls.append((location, page_no))
+        lat, lng = map(float, location.split(","))
+        if location in full_locations:
+            results = [
+                {"place_id": f"{location}-{page_no}-{i}", "geometry": {"location": {"lat": lat, "lng": lng}}}
+                for i in range(20)
+            ]
+            token = f"token-{page_no}" if page_no < 3 else None
+            return {"status": "OK", "results": results, "next_page_token": token}
+        return {"status": "OK", "results": [{"place_id": location, "geometry": {"location": {"lat": lat, "lng": lng}}}]}
+
+    return fetch, calls
+
+
+def _patch(monkeypatch, full_locations: set):
+    fetch, calls = _fake_fetch(full_locations)
+    monkeypatch.setattr(google_places, "_fetch_nearby_page", fetch)
+    # 다음 페이지를 캐시된 것으로 취급해 토큰 유효화 대기(2초)를 건너뛴다
+    monkeypatch.setattr(google_places, "has_cached", lambda *args, **kwargs: True)
+    return calls
+
+
+def test_is_saturated():
+    assert _is_saturated(3, 3, 60, None)
+    assert _is_saturated(3, 3, 45, "token")
+    assert not _is_saturated(3, 3, 59, None)
+    assert not _is_saturated(2, 3, 40, "token")
+
+
+def test_full_three_pages_split_into_quadrants(monkeypatch):
+    calls = _patch(monkeypatch, {f"{LAT},{LNG}"})
+
+    results = search_types(["restaurant"], LAT, LNG, 500, tiling=True, max_workers=2)["restaurant"]
+
+    root_pages = [page for location, page in calls if location == f"{LAT},{LNG}"]
+    tile_searches = {location for location, _ in calls if location != f"{LAT},{LNG}"}
+    assert root_pages == [1, 2, 3]
+    assert len(tile_searches) == 4
+    # 전체 원 60건 + 사분면 타일마다 1건 (모두 반경 안)
+    assert len(results) == 64
+
+
+def test_unsaturated_search_is_not_split(monkeypatch):
+    calls = _patch(monkeypatch, set())
+
+    results = search_types(["restaurant"], LAT, LNG, 500, tiling=True, max_workers=2)["restaurant"]
+
+    assert calls == [(f"{LAT},{LNG}", 1)]
+    assert len(results) == 1
+
+
+def test_tiling_off_never_splits(monkeypatch):
+    calls = _patch(monkeypatch, {f"{LAT},{LNG}"})
+
+    search_types(["restaurant"], LAT, LNG, 500, tiling=False, max_pages=2)
+
+    assert calls == [(f"{LAT},{LNG}", 1), (f"{LAT},{LNG}", 2)]
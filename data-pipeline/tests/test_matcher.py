@@ -0,0 +1,47 @@
+"""매장 → 건물 매칭 (정규 주소 키, 텍스트 규칙, 좌표 근접도) 테스트."""
+
+import pandas as pd
+
+from processors.matcher import match_tenants
+
+# 위도 1e-5도 ≈ 1.11m
+LAT, LNG = 37.50000, 127.03600
+
+
+def _buildings():
+    return pd.DataFrame({
+        "building_name": ["", ""],
+        "address": ["서울특별시 강남구 테헤란로 150", "서울특별시 강남구 테헤란로 152"],
+        "lat": [LAT, LAT + 0.00019],     # 152는 150에서 북쪽으로 약 21m
+        "lng": [LNG, LNG],
+    })
+
+
+def _tenants(address: str, lat: float):
+    return pd.DataFrame({"address": [address], "lat": [lat], "lng": [LNG]})
+
+
+def test_address_key_match_wins_over_nearer_building():
+    # 150에서 4m, 152에서 17m
+    tenants = _tenants("서울특별시 강남구 테헤란로 152", LAT + 0.000036)
+
+    assert match_tenants(tenants, _buildings(), mode="text").tolist() == [1]
+    assert match_tenants(tenants, _buildings(), mode="spatial").tolist() == [1]
+
+
+def test_spatial_prefers_nearest_when_text_matches_both():
+    # 번지 없는 주소는 정규 키가 없고, 같은 도로 토큰으로 두 건물 모두 텍스트 규칙을 만족한다
+    tenants = _tenants("서울특별시 강남구 테헤란로", LAT + 0.00015)
+
+    assert match_tenants(tenants, _buildings(), mode="text").tolist() == [0]
+    assert match_tenants(tenants, _buildings(), mode="spatial").tolist() == [1]
+
+
+def test_spatial_keeps_address_match_without_nearby_candidate():
+    # 152에서 약 44m 떨어진 대형 건물 안 매장
+    buildings = _buildings().iloc[[1]].reset_index(drop=True)
+    keyed = _tenants("서울특별시 강남구 테헤란로 152", LAT + 0.00019 + 0.0004)
+    text_only = _tenants("서울특별시 강남구 테헤란로", LAT + 0.00019 + 0.0004)
+
+    assert match_tenants(keyed, buildings, mode="spatial").tolist() == [0]
+    assert match_tenants(text_only, buildings, mode="spatial").tolist() == [0]
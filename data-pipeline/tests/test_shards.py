@@ -0,0 +1,46 @@
+"""지역 샤드 통합 테스트."""
+
+import pandas as pd
+
+from shards import combine_shards, save_shard
+
+REGION_A = {"name": "역삼동", "sigungu_cd": "11680", "bjdong_cd": "10100"}
+REGION_B = {"name": "삼성동", "sigungu_cd": "11680", "bjdong_cd": "10500"}
+
+
+def _buildings(keys):
+    return pd.DataFrame({
+        "building_name": [f"{k}빌딩" for k in keys],
+        "address": [f"서울 강남구 테헤란로 {k}" for k in keys],
+        "building_key": [f"pk:{k}" for k in keys],
+    })
+
+
+def _tenants(rows):
+    return pd.DataFrame(rows, columns=["title", "address", "lat", "lng", "building_idx"])
+
+
+def test_overlapping_shards_are_deduplicated(tmp_path):
+    # 두 지역 모두 건물 2와 그 안의 스타벅스를 수집했다
+    save_shard({
+        "buildings": _buildings([1, 2]),
+        "tenants": _tenants([
+            ["스타벅스 테헤란로2점", "서울 강남구 테헤란로 2", 37.5000, 127.0300, 1],
+            ["이디야커피", "서울 강남구 테헤란로 1", 37.4990, 127.0290, 0],
+        ]),
+    }, tmp_path / "11680_10100")
+    save_shard({
+        "buildings": _buildings([2, 3]),
+        "tenants": _tenants([
+            ["스타벅스 테헤란로2점", "서울 강남구 테헤란로 2", 37.5000, 127.0300, 0],
+            ["투썸플레이스", "서울 강남구 테헤란로 3", 37.5010, 127.0310, 1],
+        ]),
+    }, tmp_path / "11680_10500")
+
+    merged = combine_shards([REGION_A, REGION_B], output_dir=tmp_path)
+
+    buildings, tenants = merged["buildings"], merged["tenants"]
+    assert buildings["building_key"].tolist() == ["pk:1", "pk:2", "pk:3"]
+    assert tenants["title"].tolist() == ["스타벅스 테헤란로2점", "이디야커피", "투썸플레이스"]
+    assert [int(i) for i in tenants["building_idx"]] == [1, 0, 2]
+    assert tenants["building_key"].tolist() == ["pk:2", "pk:1", "pk:3"]
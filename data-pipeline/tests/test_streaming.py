@@ -0,0 +1,28 @@
+"""스트리밍 모드 배치 간 처리 테스트."""
+
+import pandas as pd
+
+from processors import merger
+from streaming import _drop_seen_buildings
+
+
+def _ledger(rows):
+    return pd.DataFrame(rows, columns=["ledger_pk", "building_name", "address", "ground_floors"])
+
+
+def test_cross_batch_building_dedupe_matches_batch_mode():
+    # 같은 주소에 건물명이 빈 필지가 여러 페이지에 나뉘어 온다
+    pages = [
+        _ledger([["1", "", "서울특별시 강남구 역삼동 700", 5], ["2", "A빌딩", "서울특별시 강남구 역삼동 701", 10]]),
+        _ledger([["3", "", "서울특별시 강남구 역삼동 700", 5], ["4", "B빌딩", "서울특별시 강남구 역삼동 702", 3]]),
+    ]
+
+    seen_names, seen_keys = set(), set()
+    streamed = pd.concat(
+        [_drop_seen_buildings(merger._process_buildings(page), seen_names, seen_keys) for page in pages],
+        ignore_index=True,
+    )
+    batch = merger._process_buildings(pd.concat(pages, ignore_index=True))
+
+    assert sorted(streamed["building_key"]) == sorted(batch["building_key"])
+    assert sorted(streamed["building_key"]) == ["pk:1", "pk:2", "pk:4"]
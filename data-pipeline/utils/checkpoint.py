@@ -0,0 +1,135 @@
+"""
+ScanPang Data Pipeline - 단계별 체크포인트 모듈
+각 단계의 데이터프레임을 Arrow IPC(Feather v2, 비압축) 파일로 저장하고,
+다시 읽어 어느 단계에서든 이어서 실행할 수 있게 한다.
+Arrow 파일은 메모리 매핑으로 열어 pandas로 한 번만 복사한다. 이후 단계가 프레임을
+제자리에서 수정하므로 읽기 전용인 zero-copy 버퍼를 그대로 넘기지는 않는다.
+
+단계 체크포인트를 저장하면 그 뒤 단계(STAGES 순서)의 체크포인트는 지운다.
+새 수집 결과 위에 이전 실행의 정제 결과가 남아 --resume이 옛 데이터로 이어가는 일을 막는다.
+
+디렉토리 구조:
+    output/checkpoints/<stage>/<frame>.arrow
+    output/checkpoints/<stage>/_SUCCESS.json   # 모든 프레임 저장 후 마지막에 기록
+
+pyarrow가 없거나 Arrow로 표현할 수 없는 컬럼(혼합 타입 object 등)이 있으면
+해당 프레임만 pickle로 저장한다.
+"""
+
+import json
+import logging
+import shutil
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from config import CHECKPOINT_DIR
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pa = None
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST = "_SUCCESS.json"
+
+# 단계 순서 (앞 단계를 다시 저장하면 뒤 단계 체크포인트는 무효)
+STAGES = ("collect", "process")
+
+
+def save_frames(directory: Path, frames: dict[str, pd.DataFrame]) -> None:
+    """
+    데이터프레임 묶음을 디렉토리에 저장한다.
+    기존 내용은 지우고 새로 쓰며, 매니페스트를 마지막에 기록해 불완전한 저장을 구분한다.
+
+    Args:
+        directory: 저장 디렉토리
+        frames: {프레임 이름: 데이터프레임}
+    """
+    directory = Path(directory)
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True)
+
+    entries = {}
+    for name, df in frames.items():
+        if df is None:
+            df = pd.DataFrame()
+        entries[name] = {"format": _write_frame(directory, name, df), "rows": len(df)}
+
+    with open(directory / _MANIFEST, "w", encoding="utf-8") as f:
+        json.dump({"frames": entries, "created_at": time.time()}, f, ensure_ascii=False, indent=2)
+
+
+def _write_frame(directory: Path, name: str, df: pd.DataFrame) -> str:
+    if feather is not None:
+        try:
+            # 비압축으로 저장해야 읽을 때 압축 해제 없이 메모리 매핑으로 열 수 있다
+            feather.write_feather(df, directory / f"{name}.arrow", compression="uncompressed")
+            return "arrow"
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.warning(f"체크포인트 [{name}] Arrow 변환 실패, pickle로 저장: {e}")
+    df.to_pickle(directory / f"{name}.pkl")
+    return "pickle"
+
+
+def load_frames(directory: Path) -> dict[str, pd.DataFrame]:
+    """
+    save_frames로 저장한 데이터프레임 묶음을 읽는다.
+
+    Raises:
+        FileNotFoundError: 디렉토리가 없거나 저장이 완료되지 않은 경우
+    """
+    directory = Path(directory)
+    manifest_path = directory / _MANIFEST
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"완료된 체크포인트가 없습니다: {directory}")
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    frames = {}
+    for name, entry in manifest["frames"].items():
+        if entry["format"] == "arrow":
+            if feather is None:
+                raise ImportError("Arrow 체크포인트를 읽으려면 pyarrow가 필요합니다.")
+            # 메모리 매핑된 테이블에서 pandas로 한 번만 복사한다 (Arrow 힙 사본을 따로 만들지 않음)
+            frames[name] = feather.read_table(directory / f"{name}.arrow", memory_map=True).to_pandas()
+        else:
+            frames[name] = pd.read_pickle(directory / f"{name}.pkl")
+    return frames
+
+
+def has_frames(directory: Path) -> bool:
+    """저장이 완료된 데이터프레임 묶음이 있는지 확인한다."""
+    return (Path(directory) / _MANIFEST).exists()
+
+
+def save_stage(stage: str, frames: dict[str, pd.DataFrame], root: Path = CHECKPOINT_DIR) -> None:
+    """단계 출력을 체크포인트로 저장한다 (예: stage="collect"). 뒤 단계 체크포인트는 지운다."""
+    # 저장 도중 실패해도 옛 뒤 단계가 남지 않도록 먼저 지운다
+    later_stages = STAGES[STAGES.index(stage) + 1:] if stage in STAGES else ()
+    for later in later_stages:
+        if (Path(root) / later).exists():
+            shutil.rmtree(Path(root) / later)
+            logger.info(f"체크포인트 삭제 [{later}]: [{stage}] 단계가 새로 저장됨")
+    save_frames(Path(root) / stage, frames)
+    summary = ", ".join(f"{name} {0 if df is None else len(df)}건" for name, df in frames.items())
+    logger.info(f"체크포인트 저장 [{stage}]: {summary}")
+
+
+def load_stage(stage: str, root: Path = CHECKPOINT_DIR) -> dict[str, pd.DataFrame]:
+    """단계 체크포인트를 읽는다."""
+    frames = load_frames(Path(root) / stage)
+    summary = ", ".join(f"{name} {len(df)}건" for name, df in frames.items())
+    logger.info(f"체크포인트 로드 [{stage}]: {summary}")
+    return frames
+
+
+def has_stage(stage: str, root: Path = CHECKPOINT_DIR) -> bool:
+    """단계 체크포인트가 있는지 확인한다."""
+    return has_frames(Path(root) / stage)
@@ -0,0 +1,142 @@
+"""
+ScanPang Data Pipeline - 데이터프레임 스키마 / 메모리 절감 유틸
+단계 사이를 오가는 프레임에 명시적인 컴팩트 스키마를 적용한다.
+
+- 반복이 많은 저카디널리티 문자열 (category, source, building_use, search_context ...) → category
+- 나머지 문자열 → Arrow 기반 문자열 (pyarrow가 없으면 object 그대로)
+- 층수/평점 등 숫자 → 범위에 맞는 작은 정수/실수 (위경도는 정밀도 때문에 float64 유지)
+- copy-on-write 모드를 켜서 단계마다 하던 방어적 전체 복사를 얕은 복사로 대신한다
+"""
+
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+    STRING = pd.StringDtype("pyarrow")
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    STRING = object
+
+CATEGORY = "category"
+
+SCHEMAS: dict[str, dict[str, object]] = {
+    "buildings": {
+        "building_name": STRING,
+        "jibun_address": STRING,
+        "road_address": STRING,
+        "address": STRING,
+        "address_key": STRING,
+        "ledger_pk": STRING,
+        "building_key": STRING,
+        "approval_date": STRING,
+        "building_use": CATEGORY,
+        "ground_floors": "int16",
+        "basement_floors": "int16",
+        "total_floors": "int16",
+        "completion_year": "Int16",
+        "lat": "float64",
+        "lng": "float64",
+    },
+    "naver": {
+        "title": STRING,
+        "category": CATEGORY,
+        "naver_category": CATEGORY,
+        "road_address": STRING,
+        "jibun_address": STRING,
+        "mapx": "float64",
+        "mapy": "float64",
+        "link": STRING,
+        "telephone": STRING,
+        "search_context": CATEGORY,
+        "source": CATEGORY,
+    },
+    "google": {
+        "place_id": STRING,
+        "title": STRING,
+        "category": CATEGORY,
+        "google_type": CATEGORY,
+        "address": STRING,
+        "lat": "float64",
+        "lng": "float64",
+        "rating": "float32",
+        "user_ratings_total": "Int32",
+        "price_level": "Int8",
+        "business_status": CATEGORY,
+        "source": CATEGORY,
+    },
+    "tenants": {
+        "title": STRING,
+        "category": CATEGORY,
+        "category_icon": CATEGORY,
+        "address": STRING,
+        "address_key": STRING,
+        "building_key": STRING,
+        "source": CATEGORY,
+        "lat": "float64",
+        "lng": "float64",
+    },
+}
+
+# 단계 출력 프레임 이름 → 스키마
+PROCESS_FRAMES = {"buildings": "buildings", "tenants": "tenants"}
+
+
+def enable_copy_on_write() -> None:
+    """pandas copy-on-write 모드를 켠다 (pandas 3에서는 기본값)."""
+    try:
+        pd.set_option("mode.copy_on_write", True)
+    except (KeyError, ValueError, pd.errors.OptionError):
+        pass
+
+
+def compact(df: pd.DataFrame, kind: str) -> pd.DataFrame:
+    """
+    프레임에 kind 스키마를 적용한다. 스키마에 없는 컬럼은 그대로 둔다.
+
+    Args:
+        df: 대상 프레임
+        kind: SCHEMAS 키 ("buildings", "naver", "google", "tenants")
+
+    Returns:
+        컴팩트 dtype이 적용된 프레임 (변환할 수 없는 컬럼은 원래 dtype 유지)
+    """
+    if df is None or df.empty:
+        return df
+
+    converted = {}
+    for column, dtype in SCHEMAS[kind].items():
+        if column not in df.columns or df[column].dtype == dtype:
+            continue
+        try:
+            converted[column] = _convert(df[column], dtype)
+        except (TypeError, ValueError, OverflowError) as e:
+            logger.debug(f"dtype 변환 건너뜀 [{kind}.{column} → {dtype}]: {e}")
+
+    return df.assign(**converted) if converted else df
+
+
+def compact_frames(frames: dict[str, pd.DataFrame], kinds: dict[str, str]) -> dict[str, pd.DataFrame]:
+    """프레임 딕셔너리의 각 프레임에 kinds[이름] 스키마를 적용한다 (kinds에 없는 프레임은 그대로)."""
+    return {name: compact(df, kinds[name]) if name in kinds else df for name, df in frames.items()}
+
+
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    """프레임이 차지하는 메모리 (MB, 문자열 내용 포함)."""
+    if df is None:
+        return 0.0
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+
+def _convert(series: pd.Series, dtype) -> pd.Series:
+    if dtype is STRING or dtype == CATEGORY:
+        # None/NaN 외의 값은 문자열로 맞춘 뒤 변환 (숫자가 섞인 컬럼 대비)
+        values = series.where(series.isna(), series.astype(str))
+        return values.astype(dtype)
+    numeric = pd.to_numeric(series, errors="coerce")
+    if isinstance(dtype, str) and dtype.startswith("int") and numeric.isna().any():
+        # 결측이 있는 정수 컬럼은 nullable 정수로
+        dtype = str(dtype).capitalize()
+    return numeric.astype(dtype)
@@ -0,0 +1,234 @@
+"""
+ScanPang Data Pipeline - HTTP 응답 캐시 모듈
+외부 API 응답을 디스크에 저장해 재실행 시 네트워크 호출을 줄인다.
+
+- 키: URL + 정렬된 파라미터의 SHA-256 (serviceKey, key 등 비밀값은 키에서 제외)
+- 만료: 프로바이더별 TTL (config.HTTP_CACHE_TTL)
+- 용량: 전체 크기가 HTTP_CACHE_MAX_BYTES를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- 리플레이 모드: 네트워크를 전혀 사용하지 않고 캐시만으로 실행 (캐시 미스는 요청 실패로 처리)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+
+from config import (
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_MAX_BYTES,
+    HTTP_CACHE_SECRET_PARAMS,
+    HTTP_CACHE_TTL,
+)
+from utils.http_session import get_session
+from utils.rate_limiter import throttle
+
+logger = logging.getLogger(__name__)
+
+_replay_mode = False
+_lock = threading.Lock()
+_total_bytes: Optional[int] = None  # 최초 쓰기 시점에 디렉토리를 스캔해 초기화
+
+
+class CacheMissError(requests.exceptions.RequestException):
+    """리플레이 모드에서 캐시에 없는 요청이 들어왔을 때 발생한다."""
+
+
+class CachedResponse:
+    """
+    requests.Response 중 파이프라인이 사용하는 부분만 흉내 내는 응답 객체.
+    (status_code, headers, text, json(), raise_for_status())
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict, text: str, from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.text = text
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=None
+            )
+
+
+def set_replay_mode(enabled: bool) -> None:
+    """리플레이 모드를 켜거나 끈다. 켜면 캐시 미스 시 네트워크 대신 CacheMissError를 던진다."""
+    global _replay_mode
+    _replay_mode = enabled
+    logger.info(f"HTTP 캐시 리플레이 모드: {'ON' if enabled else 'OFF'}")
+
+
+def is_replay_mode() -> bool:
+    return _replay_mode
+
+
+def make_cache_key(url: str, params: Optional[dict] = None) -> str:
+    """URL과 정규화된 파라미터로 캐시 키를 만든다. 비밀 파라미터는 키에서 제외한다."""
+    normalized = sorted(
+        (str(k), str(v))
+        for k, v in (params or {}).items()
+        if k not in HTTP_CACHE_SECRET_PARAMS and v is not None
+    )
+    raw = json.dumps([url, normalized], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _entry_path(provider: str, key: str) -> Path:
+    return HTTP_CACHE_DIR / provider / key[:2] / f"{key}.json"
+
+
+def _read_entry(path: Path, ttl: float) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # 리플레이 모드에서는 TTL과 무관하게 저장된 응답을 사용한다
+    if not _replay_mode and time.time() - entry.get("stored_at", 0) > ttl:
+        return None
+
+    # LRU 기준 시각 갱신
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+    return entry
+
+
+def _write_entry(path: Path, entry: dict) -> None:
+    global _total_bytes
+    data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    with _lock:
+        if _total_bytes is None:
+            _total_bytes = _scan_total_bytes()
+        else:
+            _total_bytes += len(data)
+        if _total_bytes > HTTP_CACHE_MAX_BYTES:
+            _evict()
+
+
+def _scan_total_bytes() -> int:
+    return sum(p.stat().st_size for p in HTTP_CACHE_DIR.rglob("*.json"))
+
+
+def _evict() -> None:
+    """가장 오래 사용하지 않은 항목부터 삭제해 용량 상한의 90%까지 줄인다. (_lock 보유 상태에서 호출)"""
+    global _total_bytes
+    entries = []
+    for p in HTTP_CACHE_DIR.rglob("*.json"):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+    entries.sort()
+
+    total = sum(size for _, size, _ in entries)
+    target = int(HTTP_CACHE_MAX_BYTES * 0.9)
+    removed = 0
+    for _, size, p in entries:
+        if total <= target:
+            break
+        try:
+            p.unlink()
+            total -= size
+            removed += 1
+        except OSError:
+            continue
+    _total_bytes = total
+    logger.info(f"HTTP 캐시 정리: {removed}건 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+
+
+def has_cached(provider: str, url: str, params: Optional[dict] = None) -> bool:
+    """요청이 캐시에서 바로 응답될 수 있는지 확인한다 (네트워크 호출 없음)."""
+    if not HTTP_CACHE_ENABLED and not _replay_mode:
+        return False
+    path = _entry_path(provider, make_cache_key(url, params))
+    return _read_entry(path, HTTP_CACHE_TTL.get(provider, 0)) is not None
+
+
+def cached_get(
+    provider: str,
+    url: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: float = 30,
+    should_cache: Optional[Callable[[CachedResponse], bool]] = None,
+    fetch: Optional[Callable[[], requests.Response]] = None,
+) -> CachedResponse:
+    """
+    캐시를 거쳐 GET 요청을 수행한다.
+
+    Args:
+        provider: 프로바이더 이름 (TTL/캐시 디렉토리 구분용, 예: "naver")
+        url: 요청 URL
+        params: 쿼리 파라미터
+        headers: 요청 헤더 (캐시 키에는 포함되지 않음)
+        timeout: 요청 타임아웃 (초)
+        should_cache: 응답을 저장할지 판단하는 함수 (기본: 2xx 응답만 저장)
+        fetch: 실제 네트워크 요청 함수 (기본: 프로바이더 공유 세션의 get). 캐시 미스일 때만 호출되며,
+            호출 전에 프로바이더 레이트 리미터를 거친다
+
+    Returns:
+        CachedResponse
+
+    Raises:
+        CacheMissError: 리플레이 모드에서 캐시에 없는 요청
+        requests.exceptions.RequestException: 네트워크 요청 실패
+    """
+    def _network_get() -> requests.Response:
+        # 레이트 리미터는 실제 네트워크 요청에만 적용한다 (캐시 히트는 쿼터를 쓰지 않음)
+        throttle(provider)
+        if fetch:
+            return fetch()
+        return get_session(provider).get(url, params=params, headers=headers, timeout=timeout)
+
+    if not HTTP_CACHE_ENABLED and not _replay_mode:
+        resp = _network_get()
+        return CachedResponse(url, resp.status_code, dict(resp.headers), resp.text)
+
+    key = make_cache_key(url, params)
+    path = _entry_path(provider, key)
+    ttl = HTTP_CACHE_TTL.get(provider, 0)
+
+    entry = _read_entry(path, ttl)
+    if entry is not None:
+        logger.debug(f"HTTP 캐시 히트 [{provider}] {key[:12]}")
+        return CachedResponse(url, entry["status_code"], entry["headers"], entry["text"], from_cache=True)
+
+    if _replay_mode:
+        raise CacheMissError(f"리플레이 모드 캐시 미스 [{provider}]: {url}")
+
+    resp = _network_get()
+    cached = CachedResponse(url, resp.status_code, dict(resp.headers), resp.text)
+
+    ok = 200 <= cached.status_code < 300
+    if ok and (should_cache is None or should_cache(cached)):
+        _write_entry(path, {
+            "url": url,
+            "status_code": cached.status_code,
+            "headers": {"content-type": cached.headers.get("content-type", "")},
+            "text": cached.text,
+            "stored_at": time.time(),
+        })
+
+    return cached
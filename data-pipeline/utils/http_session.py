@@ -0,0 +1,92 @@
+"""
+ScanPang Data Pipeline - HTTP 세션 모듈
+프로바이더별로 keep-alive 커넥션 풀을 가진 requests.Session을 공유한다.
+
+- 커넥션 풀: 같은 호스트로 가는 요청이 TCP/TLS 연결을 재사용한다
+- 재시도: 429/5xx 응답과 연결 오류에 대해 지수 백오프 + 지터로 재시도한다
+  (Retry-After 헤더가 있으면 우선 적용)
+"""
+
+import logging
+import random
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_BACKOFF_JITTER,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_MAXSIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class JitteredRetry(Retry):
+    """지수 백오프에 무작위 지터를 더하는 Retry (urllib3 1.26/2.x 공통 동작)."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return backoff + random.uniform(0, HTTP_BACKOFF_JITTER)
+
+
+_sessions: dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retry = JitteredRetry(
+        total=HTTP_MAX_RETRIES,
+        connect=HTTP_MAX_RETRIES,
+        read=HTTP_MAX_RETRIES,
+        status=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+        pool_block=True,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(provider: str) -> requests.Session:
+    """
+    프로바이더별 공유 세션을 반환한다 (최초 호출 시 생성).
+
+    Args:
+        provider: 프로바이더 이름 (예: "naver", "google", "data_go_kr")
+
+    Returns:
+        커넥션 풀과 재시도 정책이 설정된 requests.Session
+    """
+    with _lock:
+        session = _sessions.get(provider)
+        if session is None:
+            session = _build_session()
+            _sessions[provider] = session
+            logger.debug(f"HTTP 세션 생성 [{provider}]: pool {HTTP_POOL_MAXSIZE}, retry {HTTP_MAX_RETRIES}")
+        return session
+
+
+def close_sessions() -> None:
+    """모든 프로바이더 세션을 닫는다 (파이프라인 종료 시 호출)."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
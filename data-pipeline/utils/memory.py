@@ -0,0 +1,94 @@
+"""
+ScanPang Data Pipeline - 단계별 최대 메모리 측정 유틸
+백그라운드 스레드가 프로세스 RSS를 주기적으로 읽어 단계 실행 중 최대값을 기록한다.
+(/proc/self/statm을 읽을 수 없는 환경에서는 프로세스 전체 최대 RSS(getrusage)로 대신한다)
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL_S = 0.05
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_mb() -> Optional[float]:
+    """현재 RSS (MB). 읽을 수 없으면 None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_mb() -> float:
+    """프로세스 시작 이후 최대 RSS (MB)."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class StageMemory:
+    """단계 실행 중 RSS를 샘플링해 시작/최대/종료 값을 기록한다."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_S):
+        self.interval = interval
+        self.start_mb = current_rss_mb()
+        self.peak_mb = self.start_mb or 0.0
+        self.end_mb: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StageMemory":
+        if self.start_mb is not None:
+            self._thread = threading.Thread(target=self._sample, name="memory-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.end_mb = current_rss_mb()
+        if self.start_mb is None:
+            self.peak_mb = peak_rss_mb()
+        elif self.end_mb is not None:
+            self.peak_mb = max(self.peak_mb, self.end_mb)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            rss = current_rss_mb()
+            if rss is not None and rss > self.peak_mb:
+                self.peak_mb = rss
+
+
+@contextmanager
+def track_memory(stage: str) -> Iterator[StageMemory]:
+    """
+    with 블록 실행 중 최대 메모리를 측정해 로그로 남긴다.
+
+    Args:
+        stage: 로그에 표시할 단계 이름
+    """
+    usage = StageMemory().start()
+    start_time = time.time()
+    try:
+        yield usage
+    finally:
+        usage.stop()
+        if usage.start_mb is None:
+            logger.info(f"[{stage}] 최대 메모리 {usage.peak_mb:.0f}MB (프로세스 전체 기준)")
+        else:
+            logger.info(
+                f"[{stage}] 최대 메모리 {usage.peak_mb:.0f}MB "
+                f"(시작 {usage.start_mb:.0f}MB → 종료 {usage.end_mb or 0:.0f}MB, {time.time() - start_time:.1f}초)"
+            )
@@ -0,0 +1,108 @@
+"""
+ScanPang Data Pipeline - API 호출 속도 제한 모듈
+프로바이더(API 제공자)별 토큰 버킷 레이트 리미터를 제공한다.
+
+같은 API를 호출하는 모든 모듈이 하나의 버킷을 공유하므로,
+예: naver_places.search_local 과 geocoder.geocode_with_naver_search 는
+둘 다 openapi.naver.com 쿼터를 함께 소진한다.
+"""
+
+import logging
+import threading
+import time
+
+from config import RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷.
+
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓인다.
+    토큰이 충분하면 즉시 통과하고, 부족하면 필요한 만큼만 대기한다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(max(burst, 1))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 소비한다. 부족하면 채워질 때까지 대기한다.
+
+        Args:
+            tokens: 소비할 토큰 수
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            # 락을 잡은 채로 자지 않도록 락 밖에서 대기
+            time.sleep(wait)
+            waited += wait
+
+
+_limiters: dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+_rate_scale = 1.0
+
+
+def set_rate_scale(scale: float) -> None:
+    """
+    이 프로세스의 모든 프로바이더 속도를 scale배로 조정한다.
+    여러 프로세스가 같은 쿼터를 나눠 쓸 때(샤드 실행) 프로세스당 1/N로 설정한다.
+    """
+    global _rate_scale
+    with _registry_lock:
+        _rate_scale = scale
+        _limiters.clear()
+
+
+def get_rate_limiter(provider: str) -> TokenBucket:
+    """
+    프로바이더별 공유 레이트 리미터를 반환한다.
+    같은 프로바이더 이름이면 프로세스 내 어디서 호출하든 같은 버킷을 돌려준다.
+
+    Args:
+        provider: 프로바이더 이름 (config.RATE_LIMITS의 키, 예: "naver")
+
+    Returns:
+        TokenBucket 인스턴스
+    """
+    with _registry_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            if provider not in RATE_LIMITS:
+                raise KeyError(f"알 수 없는 프로바이더: {provider}")
+            qps, burst = RATE_LIMITS[provider]
+            qps *= _rate_scale
+            burst = max(1, int(burst * _rate_scale))
+            limiter = TokenBucket(qps, burst)
+            _limiters[provider] = limiter
+            logger.debug(f"레이트 리미터 생성 [{provider}]: {qps} QPS, burst {burst}")
+        return limiter
+
+
+def throttle(provider: str) -> float:
+    """프로바이더 버킷에서 토큰 1개를 소비한다 (요청 직전에 호출)."""
+    return get_rate_limiter(provider).acquire()
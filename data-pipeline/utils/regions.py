@@ -0,0 +1,104 @@
+"""
+ScanPang Data Pipeline - 수집 지역 매니페스트 모듈
+여러 수집 지역(시군구/법정동 + 검색 중심/반경)을 JSON 매니페스트로 관리한다.
+
+매니페스트 형식 (regions.json):
+    [
+        {
+            "name": "강남구 역삼동",
+            "sigungu_cd": "11680",
+            "bjdong_cd": "10300",
+            "center_lat": 37.4979,
+            "center_lng": 127.0276,
+            "radius_m": 500,
+            "base_queries": ["역삼동", "강남역"]   # 선택 (없으면 name 사용)
+        },
+        ...
+    ]
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+from config import (
+    BJDONG_CD,
+    REGION_MANIFEST_PATH,
+    SIGUNGU_CD,
+    TARGET_CENTER_LAT,
+    TARGET_CENTER_LNG,
+    TARGET_RADIUS_M,
+)
+
+logger = logging.getLogger(__name__)
+
+_REQUIRED_KEYS = ("sigungu_cd", "bjdong_cd", "center_lat", "center_lng", "radius_m")
+
+
+def default_region() -> dict:
+    """config.py의 단일 지역 설정을 지역 딕셔너리로 반환한다."""
+    from collectors.naver_places import BASE_QUERIES
+
+    return {
+        "name": "default",
+        "sigungu_cd": SIGUNGU_CD,
+        "bjdong_cd": BJDONG_CD,
+        "center_lat": TARGET_CENTER_LAT,
+        "center_lng": TARGET_CENTER_LNG,
+        "radius_m": TARGET_RADIUS_M,
+        "base_queries": list(BASE_QUERIES),
+    }
+
+
+def region_key(region: dict) -> str:
+    """지역의 고유 키 (샤드 출력 디렉토리명으로 사용)."""
+    return f"{region['sigungu_cd']}_{region['bjdong_cd']}"
+
+
+def load_regions(path: Optional[Path] = None) -> list[dict]:
+    """
+    지역 매니페스트를 읽어 검증된 지역 리스트를 반환한다.
+
+    Args:
+        path: 매니페스트 경로 (기본값: config.REGION_MANIFEST_PATH)
+
+    Returns:
+        지역 딕셔너리 리스트 (같은 sigungu_cd/bjdong_cd는 처음 것만 유지)
+
+    Raises:
+        ValueError: 필수 키가 없거나 형식이 잘못된 경우
+    """
+    path = Path(path or REGION_MANIFEST_PATH)
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError(f"지역 매니페스트는 리스트여야 합니다: {path}")
+
+    regions = []
+    seen = set()
+    for i, entry in enumerate(entries):
+        missing = [k for k in _REQUIRED_KEYS if k not in entry]
+        if missing:
+            raise ValueError(f"지역 매니페스트 {i}번 항목에 필수 키 누락: {missing}")
+
+        region = {
+            "name": entry.get("name") or f"{entry['sigungu_cd']}-{entry['bjdong_cd']}",
+            "sigungu_cd": str(entry["sigungu_cd"]),
+            "bjdong_cd": str(entry["bjdong_cd"]),
+            "center_lat": float(entry["center_lat"]),
+            "center_lng": float(entry["center_lng"]),
+            "radius_m": int(entry["radius_m"]),
+        }
+        region["base_queries"] = list(entry.get("base_queries") or [region["name"]])
+
+        key = region_key(region)
+        if key in seen:
+            logger.warning(f"중복 지역 무시: {region['name']} ({key})")
+            continue
+        seen.add(key)
+        regions.append(region)
+
+    logger.info(f"지역 매니페스트 로드: {len(regions)}개 지역 ({path})")
+    return regions